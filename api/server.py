@@ -41,6 +41,9 @@ PLANS_PATH = VAULT_PATH / "Plans"
 LOGS_PATH = VAULT_PATH / "Logs"
 REPORTS_PATH = VAULT_PATH / "Reports"
 
+# Briefing output formats -> file extension (see RENDERERS in scripts/ceo_briefing_generator.py)
+REPORT_FORMATS = {"markdown": "md", "json": "json", "csv": "csv"}
+
 # Pydantic models
 class Task(BaseModel):
     id: str
@@ -322,13 +325,16 @@ def task_action(task_id: str, action: TaskAction):
 
 
 @app.get("/api/reports/latest")
-def get_latest_report():
-    """Get the latest CEO briefing report."""
+def get_latest_report(format: str = "markdown"):
+    """Get the latest CEO briefing report (markdown, json or csv)."""
+    if format not in REPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid format. Use one of: {', '.join(REPORT_FORMATS)}")
+
     if not REPORTS_PATH.exists():
         raise HTTPException(status_code=404, detail="No reports found")
 
     # Find the latest report
-    reports = list(REPORTS_PATH.glob("CEO_Briefing_*.md"))
+    reports = list(REPORTS_PATH.glob(f"CEO_Briefing_*.{REPORT_FORMATS[format]}"))
     if not reports:
         raise HTTPException(status_code=404, detail="No reports found")
 
@@ -338,21 +344,34 @@ def get_latest_report():
     with open(latest_report, "r", encoding="utf-8") as f:
         content = f.read()
 
-    return {
+    response = {
         "filename": latest_report.name,
+        "format": format,
         "content": content,
         "generated_at": datetime.fromtimestamp(latest_report.stat().st_mtime).isoformat()
     }
 
+    if format == "json":
+        try:
+            response["data"] = json.loads(content)
+        except json.JSONDecodeError:
+            raise HTTPException(status_code=500, detail="Report data is corrupted")
+
+    return response
+
 
 @app.post("/api/reports/generate")
 def generate_report():
-    """Trigger CEO briefing generation."""
+    """Trigger CEO briefing generation (one analysis pass, all formats)."""
     import subprocess
 
+    command = ["python", "scripts/ceo_briefing_generator.py"]
+    for report_format in REPORT_FORMATS:
+        command += ["--format", report_format]
+
     try:
         result = subprocess.run(
-            ["python", "scripts/generate_briefing.py"],
+            command,
             capture_output=True,
             text=True,
             timeout=30,
@@ -7,11 +7,14 @@ MCP actions based on the file metadata. It supports various action types like
 send_email, post_linkedin, etc., with retry logic, rate limiting, and error handling.
 
 Features:
-- Watch folder for new approved actions
+- Watch folder for new approved actions (inotify on Linux, polling elsewhere)
 - Parse metadata to determine action type
 - Execute actions via MCP protocol
 - Retry with exponential backoff
 - Rate limiting (10 actions per hour)
+- Deferred scheduling of rate-limited and scheduled actions
+- Priority-ordered execution (priority, action type, age)
+- Per-stage execution tracing with latency histograms
 - Comprehensive logging
 - Dry-run mode for testing
 - Dashboard updates
@@ -23,24 +26,38 @@ Usage:
     # Dry-run mode (no actual actions)
     python scripts/approval_executor.py --dry-run
 
-    # Custom watch interval
+    # Custom watch interval (polling fallback when inotify is unavailable)
     python scripts/approval_executor.py --interval 5
 
     # One-time execution (no watching)
     python scripts/approval_executor.py --once
+
+    # Show latency statistics from previous runs
+    python scripts/approval_executor.py --stats
+
+    # Custom priority weights (JSON with priority/action_type/age_per_hour keys)
+    python scripts/approval_executor.py --priority-weights weights.json
 """
 
 import asyncio
+import ctypes
+import ctypes.util
+import hashlib
+import heapq
+import itertools
 import json
 import os
+import random
 import re
 import shutil
+import struct
 import subprocess
 import sys
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 from collections import deque
 import argparse
 import logging
@@ -57,12 +74,20 @@ DONE_PATH = VAULT_PATH / "Done"
 FAILED_PATH = VAULT_PATH / "Failed"
 LOGS_PATH = VAULT_PATH / "Logs"
 DASHBOARD_PATH = VAULT_PATH / "Dashboard.md"
+METRICS_FILE = LOGS_PATH / "executor_metrics.json"
 
 # MCP Server configuration
 MCP_EMAIL_SERVER = PROJECT_ROOT / "mcp_servers" / "email" / "server.js"
 MCP_LINKEDIN_SERVER = PROJECT_ROOT / "mcp_servers" / "linkedin" / "server.js"
 LINKEDIN_DRAFTS_PATH = VAULT_PATH / "LinkedIn_Drafts"
 
+# Duplicate content detection
+DUPLICATE_CHECK_DAYS = 7
+SIMILARITY_THRESHOLD = 0.8
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16  # 16 bands x 4 rows: ~99.9% recall at 0.8 similarity
+CONTENT_INDEX_FILE = LINKEDIN_DRAFTS_PATH / ".content_index.json"
+
 # Execution configuration
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 2  # seconds
@@ -71,6 +96,27 @@ WATCH_INTERVAL = 3  # seconds
 RATE_LIMIT_WINDOW = 3600  # 1 hour in seconds
 MAX_ACTIONS_PER_HOUR = 10
 
+# Tracing configuration
+HISTOGRAM_SUB_BUCKET_BITS = 7  # 128 sub-buckets per power of two (<1% error)
+RECENT_TRACES = 50
+
+# Priority queue weights (higher score runs first)
+PRIORITY_WEIGHTS = {
+    'urgent': 100,
+    'high': 60,
+    'medium': 30,
+    'normal': 30,
+    'low': 0,
+}
+ACTION_TYPE_WEIGHTS = {
+    'send_email': 20,
+    'post_linkedin': 10,
+    'create_calendar_event': 10,
+    'draft_email': 5,
+    'search_emails': 0,
+}
+AGE_WEIGHT_PER_HOUR = 5  # Aging so old low-priority items are not starved
+
 # Supported action types
 SUPPORTED_ACTIONS = [
     'send_email',
@@ -177,6 +223,348 @@ class RateLimiter:
         }
 
 
+# =============================================================================
+# ACTION SCHEDULER
+# =============================================================================
+
+class ActionScheduler:
+    """
+    Time-ordered queue of deferred actions.
+
+    Actions that hit the rate limit or carry a future schedule_time are parked
+    here (files stay in Approved/) instead of being moved to Failed/. Entries are
+    kept in a heap keyed on the time they become eligible to run.
+    """
+
+    def __init__(self):
+        """Initialize an empty scheduler."""
+        self._heap: List[Tuple[float, int, Path]] = []
+        self._counter = itertools.count()
+        self._eligible_at: Dict[Path, float] = {}
+
+    def schedule(self, file_path: Path, eligible_at: float):
+        """
+        Park an action file until the given time.
+
+        Rescheduling a file replaces its previous entry.
+
+        Args:
+            file_path: Path to action file
+            eligible_at: Unix timestamp when the action may run
+        """
+        self._eligible_at[file_path] = eligible_at
+        # Counter keeps FIFO order between entries with the same eligible time
+        heapq.heappush(self._heap, (eligible_at, next(self._counter), file_path))
+
+    def is_scheduled(self, file_path: Path) -> bool:
+        """Check if a file is currently parked."""
+        return file_path in self._eligible_at
+
+    def pop_due(self, now: Optional[float] = None) -> List[Path]:
+        """
+        Remove and return all actions whose eligible time has passed.
+
+        Args:
+            now: Reference timestamp (defaults to current time)
+
+        Returns:
+            List of file paths in eligibility order
+        """
+        now = time.time() if now is None else now
+        due = []
+
+        while self._heap and self._heap[0][0] <= now:
+            eligible_at, _, file_path = heapq.heappop(self._heap)
+
+            # Skip stale entries left behind by a reschedule
+            if self._eligible_at.get(file_path) != eligible_at:
+                continue
+
+            del self._eligible_at[file_path]
+            due.append(file_path)
+
+        return due
+
+    def time_until_next(self) -> Optional[float]:
+        """
+        Get seconds until the next parked action becomes eligible.
+
+        Returns:
+            Seconds to wait (0 if already due), or None if nothing is parked
+        """
+        while self._heap and self._eligible_at.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+        if not self._heap:
+            return None
+
+        return max(0.0, self._heap[0][0] - time.time())
+
+    def __len__(self) -> int:
+        return len(self._eligible_at)
+
+
+def parse_schedule_time(value: Any) -> Optional[float]:
+    """
+    Parse a schedule_time metadata value into a Unix timestamp.
+
+    Args:
+        value: ISO 8601 datetime string (as written by the approval generator)
+
+    Returns:
+        Unix timestamp, or None if the value is missing or unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(str(value).strip().replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        logger.warning(f"Ignoring invalid schedule_time: {value}")
+        return None
+
+
+# =============================================================================
+# EXECUTION TRACING
+# =============================================================================
+
+class ActionTrace:
+    """
+    Span trace for a single action execution.
+
+    Records monotonic (perf_counter) durations for each stage: parse,
+    rate_limit_wait, map_action, mcp_spawn, mcp_call, retry_wait, log, move
+    and dashboard.
+    """
+
+    def __init__(self, file_name: str):
+        """
+        Initialize trace.
+
+        Args:
+            file_name: Name of the action file being processed
+        """
+        self.file_name = file_name
+        self.action_type = 'unknown'
+        self.outcome = None
+        self.spans: List[Tuple[str, float]] = []
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+        self.total = 0.0
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((stage, time.perf_counter() - start))
+
+    def add(self, stage: str, seconds: float):
+        """Record a stage measured elsewhere."""
+        self.spans.append((stage, seconds))
+
+    def finish(self, outcome: str):
+        """Close the trace with its outcome (completed, failed, error)."""
+        self.outcome = outcome
+        self.total = time.perf_counter() - self._start
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert trace to a JSON-serializable dict (milliseconds)."""
+        return {
+            'file': self.file_name,
+            'action_type': self.action_type,
+            'outcome': self.outcome,
+            'started_at': self.started_at,
+            'total_ms': round(self.total * 1000, 3),
+            'spans': [
+                {'stage': stage, 'ms': round(seconds * 1000, 3)}
+                for stage, seconds in self.spans
+            ]
+        }
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear latency histogram.
+
+    Values (microseconds) are bucketed by power of two, each split into
+    2**sub_bucket_bits linear sub-buckets, giving a bounded relative error
+    with a few hundred buckets covering microseconds to hours.
+    """
+
+    def __init__(self, sub_bucket_bits: int = HISTOGRAM_SUB_BUCKET_BITS):
+        """
+        Initialize histogram.
+
+        Args:
+            sub_bucket_bits: Precision bits per power-of-two range
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Dict[Tuple[int, int], int] = {}
+        self.count = 0
+        self.max_us = 0
+
+    def record(self, seconds: float):
+        """Record a duration in seconds."""
+        value = max(0, int(seconds * 1_000_000))
+        # Keep sub_bucket_bits bits below the leading one: 2**bits sub-buckets
+        shift = max(0, value.bit_length() - self.sub_bucket_bits - 1)
+        bucket = (shift, value >> shift)
+
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.max_us = max(self.max_us, value)
+
+    def percentile(self, pct: float) -> float:
+        """
+        Get the value at a percentile.
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the matching bucket in milliseconds
+        """
+        if not self.count:
+            return 0.0
+
+        target = max(1, int(round(pct / 100 * self.count)))
+        seen = 0
+        for shift, sub in sorted(self.counts, key=lambda b: b[1] << b[0]):
+            seen += self.counts[(shift, sub)]
+            if seen >= target:
+                upper = ((sub + 1) << shift) - 1
+                return min(upper, self.max_us) / 1000
+
+        return self.max_us / 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert histogram to a JSON-serializable dict."""
+        return {
+            'sub_bucket_bits': self.sub_bucket_bits,
+            'count': self.count,
+            'max_us': self.max_us,
+            'buckets': {f"{shift}:{sub}": n for (shift, sub), n in self.counts.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        """Restore a histogram saved with to_dict."""
+        histogram = cls(data.get('sub_bucket_bits', HISTOGRAM_SUB_BUCKET_BITS))
+        histogram.count = data.get('count', 0)
+        histogram.max_us = data.get('max_us', 0)
+        for key, n in data.get('buckets', {}).items():
+            shift, sub = key.split(':')
+            histogram.counts[(int(shift), int(sub))] = n
+        return histogram
+
+
+class ExecutionStats:
+    """
+    Per-action-type, per-stage latency histograms.
+
+    Persisted to Logs/executor_metrics.json after every recorded trace so
+    `--stats` can report on a running (or stopped) executor.
+    """
+
+    def __init__(self, metrics_file: Path = METRICS_FILE):
+        """
+        Initialize stats, loading any previously saved metrics.
+
+        Args:
+            metrics_file: JSON file metrics are persisted to
+        """
+        self.metrics_file = metrics_file
+        self.histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.outcomes: Dict[str, Dict[str, int]] = {}
+        self.recent = deque(maxlen=RECENT_TRACES)
+        self._load()
+
+    def record(self, trace: ActionTrace):
+        """
+        Add a finished trace to the histograms and persist.
+
+        Args:
+            trace: Finished action trace
+        """
+        stages = self.histograms.setdefault(trace.action_type, {})
+        for stage, seconds in trace.spans + [('total', trace.total)]:
+            stages.setdefault(stage, LatencyHistogram()).record(seconds)
+
+        outcomes = self.outcomes.setdefault(trace.action_type, {})
+        outcomes[trace.outcome] = outcomes.get(trace.outcome, 0) + 1
+
+        self.recent.append(trace.to_dict())
+        self._save()
+
+    def render(self) -> str:
+        """Render a latency table for all action types and stages."""
+        if not self.histograms:
+            return "No execution metrics recorded yet."
+
+        header = f"{'action / stage':<32}{'count':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"
+        lines = [header, "-" * len(header)]
+
+        for action_type in sorted(self.histograms):
+            outcomes = ', '.join(
+                f"{k}={v}" for k, v in sorted(self.outcomes.get(action_type, {}).items())
+            )
+            lines.append(f"{action_type} ({outcomes})")
+
+            stages = self.histograms[action_type]
+            for stage in sorted(stages, key=lambda name: (name == 'total', name)):
+                h = stages[stage]
+                lines.append(
+                    f"  {stage:<30}{h.count:>8}"
+                    f"{h.percentile(50):>9.1f}ms{h.percentile(90):>8.1f}ms"
+                    f"{h.percentile(99):>8.1f}ms{h.max_us / 1000:>8.1f}ms"
+                )
+
+        return '\n'.join(lines)
+
+    def _load(self):
+        """Load persisted metrics, if any."""
+        if not self.metrics_file.exists():
+            return
+
+        try:
+            with open(self.metrics_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable metrics file: {e}")
+            return
+
+        for action_type, stages in data.get('histograms', {}).items():
+            self.histograms[action_type] = {
+                stage: LatencyHistogram.from_dict(h) for stage, h in stages.items()
+            }
+        self.outcomes = data.get('outcomes', {})
+        self.recent.extend(data.get('recent_traces', []))
+
+    def _save(self):
+        """Persist metrics atomically."""
+        data = {
+            'updated_at': datetime.now().isoformat(),
+            'histograms': {
+                action_type: {stage: h.to_dict() for stage, h in stages.items()}
+                for action_type, stages in self.histograms.items()
+            },
+            'outcomes': self.outcomes,
+            'recent_traces': list(self.recent)
+        }
+
+        try:
+            self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.metrics_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.metrics_file)
+        except OSError as e:
+            logger.warning(f"Failed to save metrics: {e}")
+
+
 # =============================================================================
 # MCP CLIENT
 # =============================================================================
@@ -203,7 +591,8 @@ class MCPClient:
         self,
         tool_name: str,
         arguments: Dict[str, Any],
-        timeout: int = 30
+        timeout: int = 30,
+        trace: Optional[ActionTrace] = None
     ) -> Dict[str, Any]:
         """
         Execute an MCP tool.
@@ -212,6 +601,7 @@ class MCPClient:
             tool_name: Name of the tool to execute
             arguments: Tool arguments
             timeout: Execution timeout in seconds
+            trace: Optional trace to record spawn/call timings on
 
         Returns:
             Dict containing result or error
@@ -235,16 +625,19 @@ class MCPClient:
             logger.info(f"Executing MCP tool: {tool_name}")
             logger.debug(f"Arguments: {json.dumps(arguments, indent=2)}")
 
+            trace = trace or ActionTrace(tool_name)
+
             # Start the MCP server process
             # Note: This is a simplified implementation
             # Real implementation would use JSON-RPC over stdio
-            process = await asyncio.create_subprocess_exec(
-                'node',
-                str(self.server_path),
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            with trace.span('mcp_spawn'):
+                process = await asyncio.create_subprocess_exec(
+                    'node',
+                    str(self.server_path),
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
 
             # Build JSON-RPC request
             request = {
@@ -259,10 +652,11 @@ class MCPClient:
 
             # Send request and get response
             request_json = json.dumps(request) + '\n'
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(request_json.encode()),
-                timeout=timeout
-            )
+            with trace.span('mcp_call'):
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(request_json.encode()),
+                    timeout=timeout
+                )
 
             if process.returncode != 0:
                 error_msg = stderr.decode() if stderr else "Unknown error"
@@ -389,6 +783,302 @@ class ActionFileParser:
             raise ValueError(f"Unsupported action type: {action}")
 
 
+# =============================================================================
+# CONTENT FINGERPRINT INDEX
+# =============================================================================
+
+class ContentFingerprintIndex:
+    """
+    Persistent fingerprint index of drafted/posted LinkedIn content.
+
+    Each entry stores a SHA-1 of the normalized text (exact matches) and a
+    MinHash signature (near-duplicates). Signatures are split into LSH bands,
+    so a lookup only compares against entries sharing at least one band
+    instead of re-reading every draft file in history.
+    """
+
+    _PRIME = (1 << 61) - 1
+
+    def __init__(
+        self,
+        index_file: Path = CONTENT_INDEX_FILE,
+        drafts_path: Path = LINKEDIN_DRAFTS_PATH,
+        retention_days: int = DUPLICATE_CHECK_DAYS,
+        num_perm: int = MINHASH_PERMUTATIONS,
+        bands: int = LSH_BANDS
+    ):
+        """
+        Initialize fingerprint index.
+
+        Args:
+            index_file: JSON file the index is persisted to
+            drafts_path: LinkedIn_Drafts folder to reconcile against
+            retention_days: Entries older than this are ignored and pruned
+            num_perm: Number of MinHash permutations
+            bands: Number of LSH bands (must divide num_perm)
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.index_file = index_file
+        self.drafts_path = drafts_path
+        self.retention_days = retention_days
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        # Fixed seed so signatures stay comparable across runs
+        rng = random.Random(0x5EED)
+        self._perms = [
+            (rng.randrange(1, self._PRIME), rng.randrange(0, self._PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._by_sha: Dict[str, str] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], set] = {}
+        # Draft file name -> [size, mtime_ns] when it was last read
+        self._draft_signatures: Dict[str, List[int]] = {}
+
+        self._load()
+
+    @staticmethod
+    def normalize(content: str) -> str:
+        """Normalize content for comparison (case and whitespace)."""
+        return ' '.join(content.lower().split())
+
+    def signature(self, normalized: str) -> List[int]:
+        """
+        Compute the MinHash signature of normalized content.
+
+        Args:
+            normalized: Normalized text
+
+        Returns:
+            List of num_perm minimum hash values
+        """
+        words = set(normalized.split())
+        if not words:
+            return [self._PRIME] * self.num_perm
+
+        hashes = [
+            int.from_bytes(hashlib.blake2b(w.encode('utf-8'), digest_size=8).digest(), 'big')
+            for w in words
+        ]
+
+        return [
+            min((a * h + b) % self._PRIME for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def add(self, key: str, content: str, timestamp: Optional[str] = None):
+        """
+        Add content to the index and persist it.
+
+        Args:
+            key: Draft ID (or other unique identifier)
+            content: Post content
+            timestamp: ISO timestamp of the draft (defaults to now)
+        """
+        self._add(key, content, timestamp or datetime.now().isoformat())
+        self._save()
+
+    def find_duplicate(
+        self,
+        content: str,
+        exclude: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up exact and near-duplicate content.
+
+        Args:
+            content: Post content to check
+            exclude: Key to ignore (e.g. the draft being posted)
+
+        Returns:
+            None if unique, otherwise a dict with key, timestamp, similarity
+            and exact (True for an exact normalized match)
+        """
+        self._reconcile()
+
+        normalized = self.normalize(content)
+        sha = hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+        cutoff = self._cutoff()
+
+        key = self._by_sha.get(sha)
+        if key and key != exclude and self.entries[key]['timestamp'] >= cutoff:
+            return {
+                'key': key,
+                'timestamp': self.entries[key]['timestamp'],
+                'similarity': 1.0,
+                'exact': True
+            }
+
+        sig = self.signature(normalized)
+        candidates = set()
+        for band_key in self._band_keys(sig):
+            candidates |= self._buckets.get(band_key, set())
+        candidates.discard(exclude)
+
+        best = None
+        for key in candidates:
+            entry = self.entries[key]
+            if entry['timestamp'] < cutoff:
+                continue
+
+            matches = sum(1 for x, y in zip(sig, entry['signature']) if x == y)
+            similarity = matches / self.num_perm
+            if best is None or similarity > best['similarity']:
+                best = {
+                    'key': key,
+                    'timestamp': entry['timestamp'],
+                    'similarity': similarity,
+                    'exact': entry['sha'] == sha
+                }
+
+        return best
+
+    def _add(self, key: str, content: str, timestamp: str):
+        """Add an entry to the in-memory structures."""
+        if key in self.entries:
+            self._remove(key)
+
+        normalized = self.normalize(content)
+        sig = self.signature(normalized)
+        sha = hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+        self.entries[key] = {'sha': sha, 'signature': sig, 'timestamp': timestamp}
+        self._index_entry(key)
+
+    def _index_entry(self, key: str):
+        """Register an entry in the SHA map and LSH buckets."""
+        entry = self.entries[key]
+        self._by_sha[entry['sha']] = key
+        for band_key in self._band_keys(entry['signature']):
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def _remove(self, key: str):
+        """Remove an entry from all in-memory structures."""
+        entry = self.entries.pop(key)
+        if self._by_sha.get(entry['sha']) == key:
+            del self._by_sha[entry['sha']]
+        for band_key in self._band_keys(entry['signature']):
+            bucket = self._buckets.get(band_key)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def _band_keys(self, sig: List[int]):
+        """Yield the LSH bucket key for each band of a signature."""
+        for band in range(self.bands):
+            start = band * self.rows
+            yield (band, tuple(sig[start:start + self.rows]))
+
+    def _cutoff(self) -> str:
+        """ISO timestamp before which entries are ignored."""
+        return (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+
+    def _reconcile(self):
+        """
+        Pick up drafts created or edited outside the executor (e.g. directly via MCP).
+
+        Compares each draft file's size and mtime with the version last read
+        (editing a draft in place does not change the folder's mtime), so
+        only new or changed drafts are read.
+        """
+        if not self.drafts_path.exists():
+            return
+
+        cutoff = self._cutoff()
+        signatures = {}
+        added = 0
+        for draft_file in self.drafts_path.glob("*.json"):
+            try:
+                stat_result = draft_file.stat()
+            except OSError:
+                continue
+
+            signature = [stat_result.st_size, stat_result.st_mtime_ns]
+            signatures[draft_file.name] = signature
+            if self._draft_signatures.get(draft_file.name) == signature:
+                continue
+
+            try:
+                with open(draft_file, 'r', encoding='utf-8') as f:
+                    draft_data = json.load(f)
+            except Exception as e:
+                logger.debug(f"Error reading draft {draft_file}: {e}")
+                continue
+
+            timestamp = self._local_iso(draft_data.get('createdAt'))
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(stat_result.st_mtime).isoformat()
+            if timestamp < cutoff:
+                continue
+
+            self._add(draft_file.stem, draft_data.get('content', ''), timestamp)
+            added += 1
+
+        if signatures == self._draft_signatures:
+            return
+
+        self._draft_signatures = signatures
+        if added:
+            logger.debug(f"Indexed {added} new or edited LinkedIn draft(s)")
+        self._save()
+
+    @staticmethod
+    def _local_iso(value: Any) -> Optional[str]:
+        """Convert an ISO timestamp (possibly UTC 'Z') to naive local time."""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed.isoformat()
+
+    def _load(self):
+        """Load the persisted index, discarding it if the format changed."""
+        if not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable content index: {e}")
+            return
+
+        if data.get('num_perm') != self.num_perm:
+            return
+
+        self.entries = data.get('entries', {})
+        self._draft_signatures = data.get('draft_signatures', {})
+        for key in self.entries:
+            self._index_entry(key)
+
+    def _save(self):
+        """Persist the index, pruning entries outside the retention window."""
+        cutoff = self._cutoff()
+        for key in [k for k, e in self.entries.items() if e['timestamp'] < cutoff]:
+            self._remove(key)
+
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'num_perm': self.num_perm,
+                    'draft_signatures': self._draft_signatures,
+                    'entries': self.entries
+                }, f)
+        except OSError as e:
+            logger.warning(f"Failed to save content index: {e}")
+
+
 # =============================================================================
 # ACTION EXECUTOR
 # =============================================================================
@@ -405,7 +1095,8 @@ class ActionExecutor:
         mcp_client: MCPClient,
         rate_limiter: RateLimiter,
         dry_run: bool = False,
-        linkedin_client: Optional[MCPClient] = None
+        linkedin_client: Optional[MCPClient] = None,
+        content_index: Optional[ContentFingerprintIndex] = None
     ):
         """
         Initialize action executor.
@@ -415,18 +1106,33 @@ class ActionExecutor:
             rate_limiter: Rate limiter for throttling
             dry_run: If True, simulate actions
             linkedin_client: Optional MCP client for LinkedIn server
+            content_index: Fingerprint index for LinkedIn duplicate checks
+                (created on first use if not provided)
         """
         self.mcp_client = mcp_client
         self.linkedin_client = linkedin_client
         self.rate_limiter = rate_limiter
         self.dry_run = dry_run
+        self._content_index = content_index
+
+    @property
+    def content_index(self) -> ContentFingerprintIndex:
+        """Fingerprint index, loaded lazily on the first LinkedIn action."""
+        if self._content_index is None:
+            self._content_index = ContentFingerprintIndex()
+        return self._content_index
 
-    async def execute_action(self, action_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_action(
+        self,
+        action_data: Dict[str, Any],
+        trace: Optional[ActionTrace] = None
+    ) -> Dict[str, Any]:
         """
         Execute an approved action with retry logic.
 
         Args:
             action_data: Parsed action data from file
+            trace: Optional trace to record stage timings on
 
         Returns:
             Dict containing execution result
@@ -449,20 +1155,45 @@ class ActionExecutor:
             }
 
         # Execute with retry
-        result = await self._execute_with_retry(action_data)
+        result = await self._execute_with_retry(
+            action_data,
+            trace or ActionTrace(action_data['file_name'])
+        )
 
         # Record action if successful
         if result.get('success'):
             self.rate_limiter.record_action()
 
+            if action_type == 'post_linkedin' and not self.dry_run:
+                self._index_linkedin_content(action_data, result)
+
         return result
 
-    async def _execute_with_retry(self, action_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _index_linkedin_content(self, action_data: Dict[str, Any], result: Dict[str, Any]):
+        """Add newly drafted LinkedIn content to the fingerprint index."""
+        metadata = action_data['metadata']
+        content = self._resolve_linkedin_content(metadata, action_data['body'])
+
+        mcp_result = result.get('result')
+        draft_id = mcp_result.get('draftId') if isinstance(mcp_result, dict) else None
+        key = draft_id or metadata.get('draft_id') or f"action_{action_data['file_name']}"
+
+        try:
+            self.content_index.add(key, content)
+        except Exception as e:
+            logger.warning(f"Failed to index LinkedIn content: {e}")
+
+    async def _execute_with_retry(
+        self,
+        action_data: Dict[str, Any],
+        trace: ActionTrace
+    ) -> Dict[str, Any]:
         """
         Execute action with exponential backoff retry.
 
         Args:
             action_data: Parsed action data
+            trace: Trace to record stage timings on
 
         Returns:
             Dict containing execution result
@@ -478,7 +1209,8 @@ class ActionExecutor:
                 logger.info(f"Attempt {attempt}/{MAX_RETRIES} for {action_type}")
 
                 # Map action to MCP tool
-                tool_name, arguments = self._map_action_to_tool(action_data)
+                with trace.span('map_action'):
+                    tool_name, arguments = self._map_action_to_tool(action_data)
 
                 # Select appropriate MCP client based on action type
                 if action_type == 'post_linkedin':
@@ -489,7 +1221,7 @@ class ActionExecutor:
                     client = self.mcp_client
 
                 # Execute via MCP
-                result = await client.execute_tool(tool_name, arguments)
+                result = await client.execute_tool(tool_name, arguments, trace=trace)
 
                 # Success
                 logger.info(f"Action {action_type} completed successfully")
@@ -506,7 +1238,8 @@ class ActionExecutor:
 
                 if attempt < MAX_RETRIES:
                     logger.info(f"Retrying in {retry_delay}s...")
-                    await asyncio.sleep(retry_delay)
+                    with trace.span('retry_wait'):
+                        await asyncio.sleep(retry_delay)
                     retry_delay *= BACKOFF_MULTIPLIER
 
         # All retries exhausted
@@ -597,23 +1330,14 @@ class ActionExecutor:
             Tuple of (tool_name, arguments)
         """
         # Extract content from draft_id or use body
-        draft_id = metadata.get('draft_id')
-        content = body
-
-        if draft_id:
-            # Read content from LinkedIn draft file
-            draft_path = LINKEDIN_DRAFTS_PATH / f"{draft_id}.json"
-            if draft_path.exists():
-                with open(draft_path, 'r', encoding='utf-8') as f:
-                    draft_data = json.load(f)
-                    content = draft_data.get('content', body)
+        content = self._resolve_linkedin_content(metadata, body)
 
         # Validate content
         self._validate_linkedin_content(content, metadata)
 
         # Check for duplicates
         if not metadata.get('skip_duplicate_check', False):
-            self._check_duplicate_content(content)
+            self._check_duplicate_content(content, exclude=metadata.get('draft_id'))
 
         # Build arguments for LinkedIn MCP
         arguments = {
@@ -634,6 +1358,21 @@ class ActionExecutor:
 
         return ('create_linkedin_post', arguments)
 
+    def _resolve_linkedin_content(self, metadata: Dict[str, Any], body: str) -> str:
+        """Get post content from the referenced draft file, falling back to body."""
+        draft_id = metadata.get('draft_id')
+        if not draft_id:
+            return body
+
+        # Read content from LinkedIn draft file
+        draft_path = LINKEDIN_DRAFTS_PATH / f"{draft_id}.json"
+        if draft_path.exists():
+            with open(draft_path, 'r', encoding='utf-8') as f:
+                draft_data = json.load(f)
+                return draft_data.get('content', body)
+
+        return body
+
     def _validate_linkedin_content(self, content: str, metadata: Dict[str, Any]):
         """
         Validate LinkedIn post content.
@@ -696,91 +1435,38 @@ class ActionExecutor:
 
         logger.info(f"✓ Content validation passed: {len(content)} chars, {len(hashtags)} hashtags")
 
-    def _check_duplicate_content(self, content: str):
+    def _check_duplicate_content(self, content: str, exclude: Optional[str] = None):
         """
         Check for duplicate LinkedIn content.
 
-        Prevents posting the same content multiple times by checking:
-        1. Recent posts in logs
-        2. Existing drafts in LinkedIn_Drafts/
+        Prevents posting the same content multiple times by querying the
+        fingerprint index of content drafted/posted in the last
+        DUPLICATE_CHECK_DAYS days.
 
         Args:
             content: Post content to check
+            exclude: Draft ID to ignore (the draft this action posts from)
 
         Raises:
             ValueError: If duplicate content is found
         """
-        # Normalize content for comparison (remove whitespace variations)
-        normalized_content = ' '.join(content.lower().split())
+        match = self.content_index.find_duplicate(content, exclude=exclude)
 
-        # Check recent posts in logs
-        today = datetime.now()
-        for days_back in range(7):  # Check last 7 days
-            check_date = today - timedelta(days=days_back)
-            log_file = LOGS_PATH / f"{check_date.strftime('%Y-%m-%d')}.json"
-
-            if log_file.exists():
-                try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        logs = json.load(f)
-
-                    for log_entry in logs:
-                        if log_entry.get('source') == 'linkedin_mcp':
-                            if log_entry.get('action') in ['draft_created', 'post_created']:
-                                # Get content from log or draft file
-                                draft_id = log_entry.get('draftId')
-                                if draft_id:
-                                    draft_path = LINKEDIN_DRAFTS_PATH / f"{draft_id}.json"
-                                    if draft_path.exists():
-                                        with open(draft_path, 'r', encoding='utf-8') as df:
-                                            draft_data = json.load(df)
-                                            existing_content = draft_data.get('content', '')
-                                            normalized_existing = ' '.join(existing_content.lower().split())
-
-                                            # Check similarity (exact match or very close)
-                                            if normalized_content == normalized_existing:
-                                                raise ValueError(
-                                                    f"Duplicate content detected! This content was already posted/drafted on "
-                                                    f"{log_entry.get('timestamp', 'unknown date')}. Draft ID: {draft_id}"
-                                                )
-
-                                            # Check for very similar content (80%+ overlap)
-                                            similarity = self._calculate_similarity(normalized_content, normalized_existing)
-                                            if similarity > 0.8:
-                                                logger.warning(
-                                                    f"Very similar content detected ({similarity*100:.0f}% match) from "
-                                                    f"{log_entry.get('timestamp')}. Draft ID: {draft_id}"
-                                                )
+        if match:
+            if match['exact']:
+                raise ValueError(
+                    f"Duplicate content detected! This content was already posted/drafted on "
+                    f"{match['timestamp']}. Draft ID: {match['key']}"
+                )
 
-                except Exception as e:
-                    logger.debug(f"Error checking log file {log_file}: {e}")
+            if match['similarity'] > SIMILARITY_THRESHOLD:
+                logger.warning(
+                    f"Very similar content detected ({match['similarity']*100:.0f}% match) from "
+                    f"{match['timestamp']}. Draft ID: {match['key']}"
+                )
 
         logger.info("✓ Duplicate check passed: Content is unique")
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """
-        Calculate similarity between two texts.
-
-        Simple word-overlap based similarity metric.
-
-        Args:
-            text1: First text
-            text2: Second text
-
-        Returns:
-            Similarity score between 0 and 1
-        """
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        return len(intersection) / len(union) if union else 0.0
-
 
 # =============================================================================
 # FILE PROCESSOR
@@ -796,7 +1482,9 @@ class FileProcessor:
     def __init__(
         self,
         action_executor: ActionExecutor,
-        dry_run: bool = False
+        dry_run: bool = False,
+        scheduler: Optional[ActionScheduler] = None,
+        stats: Optional[ExecutionStats] = None
     ):
         """
         Initialize file processor.
@@ -804,9 +1492,16 @@ class FileProcessor:
         Args:
             action_executor: Executor for actions
             dry_run: If True, don't move files
+            scheduler: Optional scheduler for deferring rate-limited and
+                scheduled actions (without it they are moved to Failed/)
+            stats: Optional latency histograms fed with each action's trace
         """
         self.action_executor = action_executor
         self.dry_run = dry_run
+        self.scheduler = scheduler
+        self.stats = stats
+        self._rate_limited_since: Dict[Path, float] = {}
+        self._deferred_files: Set[Path] = set()
 
     async def process_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -819,22 +1514,51 @@ class FileProcessor:
             Dict containing processing result
         """
         logger.info(f"Processing file: {file_path.name}")
+        trace = ActionTrace(file_path.name)
 
         try:
             # Parse file
-            action_data = ActionFileParser.parse_file(file_path)
+            with trace.span('parse'):
+                action_data = ActionFileParser.parse_file(file_path)
+            trace.action_type = action_data['metadata']['action']
+
+            # Honor schedule_time by parking the action until it is due
+            if self.scheduler is not None:
+                schedule_at = parse_schedule_time(action_data['metadata'].get('schedule_time'))
+                if schedule_at is not None and schedule_at > time.time():
+                    return self._defer(action_data, schedule_at, 'scheduled')
 
             # Execute action
-            result = await self.action_executor.execute_action(action_data)
+            result = await self.action_executor.execute_action(action_data, trace=trace)
+
+            # Park rate-limited actions until capacity frees up
+            if result.get('rate_limited') and self.scheduler is not None:
+                self._rate_limited_since.setdefault(file_path, time.perf_counter())
+                return self._defer(
+                    action_data,
+                    time.time() + result.get('wait_time', 0),
+                    'rate_limited'
+                )
+
+            self._deferred_files.discard(file_path)
+
+            # Time spent parked behind the rate limit
+            if file_path in self._rate_limited_since:
+                trace.add('rate_limit_wait', time.perf_counter() - self._rate_limited_since.pop(file_path))
 
             # Log result
-            self._log_result(action_data, result)
+            with trace.span('log'):
+                self._log_result(action_data, result)
 
             # Move file based on result
-            destination = self._move_file(file_path, result)
+            with trace.span('move'):
+                destination = self._move_file(file_path, result)
 
             # Update dashboard
-            self._update_dashboard(action_data, result, destination)
+            with trace.span('dashboard'):
+                self._update_dashboard(action_data, result, destination)
+
+            self._record_trace(trace, 'completed' if result.get('success') else 'failed')
 
             return {
                 'success': result.get('success', False),
@@ -846,6 +1570,8 @@ class FileProcessor:
 
         except Exception as e:
             logger.error(f"Failed to process {file_path.name}: {e}")
+            self._rate_limited_since.pop(file_path, None)
+            self._deferred_files.discard(file_path)
 
             # Log failure
             self._log_error(file_path, str(e))
@@ -853,6 +1579,8 @@ class FileProcessor:
             # Move to Failed
             destination = self._move_file(file_path, {'success': False, 'error': str(e)})
 
+            self._record_trace(trace, 'error')
+
             return {
                 'success': False,
                 'file': file_path.name,
@@ -860,6 +1588,104 @@ class FileProcessor:
                 'destination': destination
             }
 
+    def repark_if_rate_limited(self, file_path: Path) -> bool:
+        """
+        Park a woken rate-limited file again, unprocessed, if there is no capacity.
+
+        The whole rate-limited backlog wakes when a slot frees up and goes
+        back through the priority queue; the highest-value file takes the
+        slot and the rest are re-parked here without being parsed or logged.
+
+        Args:
+            file_path: Path to action file
+
+        Returns:
+            True if the file was re-parked
+        """
+        if self.scheduler is None or file_path not in self._rate_limited_since:
+            return False
+
+        rate_limiter = self.action_executor.rate_limiter
+        if rate_limiter.can_execute():
+            return False
+
+        self.scheduler.schedule(file_path, time.time() + rate_limiter.get_wait_time())
+        return True
+
+    def _record_trace(self, trace: ActionTrace, outcome: str):
+        """Finish a trace and feed it to the latency histograms."""
+        trace.finish(outcome)
+        logger.debug(f"Trace: {json.dumps(trace.to_dict())}")
+
+        if self.stats is not None:
+            self.stats.record(trace)
+
+    def _defer(
+        self,
+        action_data: Dict[str, Any],
+        eligible_at: float,
+        reason: str
+    ) -> Dict[str, Any]:
+        """
+        Park an action in the scheduler, leaving its file in Approved/.
+
+        Only a file's first deferral is written to the daily log; re-parking
+        it after a wake-up is logged at debug level.
+
+        Args:
+            action_data: Parsed action data
+            eligible_at: Unix timestamp when the action may run
+            reason: Why the action was deferred (rate_limited, scheduled)
+
+        Returns:
+            Dict containing processing result
+        """
+        file_path = action_data['file_path']
+        self.scheduler.schedule(file_path, eligible_at)
+
+        eligible_iso = datetime.fromtimestamp(eligible_at).isoformat()
+        if file_path in self._deferred_files:
+            logger.debug(f"Re-deferred {file_path.name} ({reason}) until {eligible_iso}")
+        else:
+            self._deferred_files.add(file_path)
+            logger.info(f"Deferred {file_path.name} ({reason}) until {eligible_iso}")
+
+            self._append_log({
+                'timestamp': datetime.now().isoformat(),
+                'action': 'defer_approved_action',
+                'file': action_data['file_name'],
+                'action_type': action_data['metadata']['action'],
+                'reason': reason,
+                'eligible_at': eligible_iso,
+            })
+
+        return {
+            'success': False,
+            'deferred': True,
+            'file': file_path.name,
+            'action': action_data['metadata']['action'],
+            'reason': reason,
+            'eligible_at': eligible_at
+        }
+
+    def _append_log(self, log_entry: Dict[str, Any]):
+        """Append a single entry to today's log file."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        log_file = LOGS_PATH / f"{today}.json"
+
+        logs = []
+        if log_file.exists():
+            try:
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    logs = json.load(f)
+            except json.JSONDecodeError:
+                logs = []
+
+        logs.append(log_entry)
+
+        with open(log_file, 'w', encoding='utf-8') as f:
+            json.dump(logs, f, indent=2, ensure_ascii=False)
+
     def _log_result(self, action_data: Dict[str, Any], result: Dict[str, Any]):
         """Log action result to daily log file."""
         today = datetime.now().strftime("%Y-%m-%d")
@@ -1088,6 +1914,232 @@ class FileProcessor:
             logger.warning(f"Failed to update dashboard: {e}")
 
 
+# =============================================================================
+# PRIORITY QUEUE
+# =============================================================================
+
+class ActionPriorityQueue:
+    """
+    Priority queue of approved action files.
+
+    Score = priority weight + action type weight + age weight * age in hours.
+    Every queued item ages at the same rate, so relative order never changes
+    over time and the heap can be keyed on the static part of the score
+    (base - age_weight * created_hour) while still aging exactly.
+    """
+
+    def __init__(
+        self,
+        priority_weights: Optional[Dict[str, float]] = None,
+        action_weights: Optional[Dict[str, float]] = None,
+        age_weight: float = AGE_WEIGHT_PER_HOUR
+    ):
+        """
+        Initialize priority queue.
+
+        Args:
+            priority_weights: Score per `priority` metadata value
+            action_weights: Score per action type
+            age_weight: Score added per hour since approval/creation
+        """
+        self.priority_weights = priority_weights or PRIORITY_WEIGHTS
+        self.action_weights = action_weights or ACTION_TYPE_WEIGHTS
+        self.age_weight = age_weight
+        self._heap: List[Tuple[float, int, Path]] = []
+        self._counter = itertools.count()
+        self._queued = set()
+
+    def push(self, file_path: Path) -> bool:
+        """
+        Queue an action file (no-op if already queued).
+
+        Args:
+            file_path: Path to action file
+
+        Returns:
+            True if the file was added
+        """
+        if file_path in self._queued:
+            return False
+
+        key = -self._static_score(file_path)
+        heapq.heappush(self._heap, (key, next(self._counter), file_path))
+        self._queued.add(file_path)
+        return True
+
+    def pop(self) -> Optional[Path]:
+        """Remove and return the highest-value file, or None if empty."""
+        if not self._heap:
+            return None
+
+        _, _, file_path = heapq.heappop(self._heap)
+        self._queued.discard(file_path)
+        return file_path
+
+    def __contains__(self, file_path: Path) -> bool:
+        return file_path in self._queued
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _static_score(self, file_path: Path) -> float:
+        """Score minus the time-varying age term shared by all items."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                metadata = ActionFileParser._extract_metadata(f.read())
+        except OSError:
+            metadata = {}
+
+        priority = str(metadata.get('priority', 'normal')).lower()
+        base = (
+            self.priority_weights.get(priority, self.priority_weights.get('normal', 0))
+            + self.action_weights.get(metadata.get('action', ''), 0)
+        )
+
+        created = self._created_at(file_path, metadata)
+        return base - self.age_weight * created / 3600
+
+    @staticmethod
+    def _created_at(file_path: Path, metadata: Dict[str, Any]) -> float:
+        """Get approval/creation time from metadata, falling back to file mtime."""
+        for field in ('approvedAt', 'createdAt'):
+            value = metadata.get(field)
+            if value:
+                try:
+                    return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+                except ValueError:
+                    pass
+
+        try:
+            return file_path.stat().st_mtime
+        except OSError:
+            return time.time()
+
+
+# =============================================================================
+# FOLDER EVENTS
+# =============================================================================
+
+class FolderEvents:
+    """
+    asyncio-native inotify watch on a single directory (Linux only).
+
+    The inotify fd is registered with the event loop via add_reader, so an
+    idle executor blocks in the loop's selector and uses no CPU. Files moved
+    into the folder (API approve, Obsidian drag-and-drop) or written directly
+    are reported as soon as the kernel sees them.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    _EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, path: Path):
+        """
+        Initialize folder events.
+
+        Args:
+            path: Directory to watch
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Path] = []
+        self._overflow = False
+        self._ready = asyncio.Event()
+
+    @staticmethod
+    def available() -> bool:
+        """Check if inotify can be used on this platform."""
+        return sys.platform.startswith('linux')
+
+    def start(self):
+        """
+        Create the inotify watch and register it with the running loop.
+
+        Raises:
+            OSError: If inotify cannot be initialized
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+
+        fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        wd = libc.inotify_add_watch(
+            fd,
+            os.fsencode(str(self.path)),
+            self.IN_MOVED_TO | self.IN_CLOSE_WRITE
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, os.strerror(errno))
+
+        self._fd = fd
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._on_readable)
+
+    def close(self):
+        """Unregister and close the inotify fd."""
+        if self._fd is None:
+            return
+
+        self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
+    async def wait(self, timeout: Optional[float] = None) -> Tuple[List[Path], bool]:
+        """
+        Wait for events.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Tuple of (paths reported since last call, overflow flag). Both
+            are empty/False on timeout. Overflow means events were lost and
+            the caller should rescan the folder.
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        paths, overflow = self._pending, self._overflow
+        self._pending, self._overflow = [], False
+        self._ready.clear()
+
+        return paths, overflow
+
+    def _on_readable(self):
+        """Read and decode all queued inotify events."""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset + self._EVENT_HEADER.size <= len(data):
+            _, mask, _, name_len = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+
+            if mask & self.IN_Q_OVERFLOW:
+                self._overflow = True
+            elif name:
+                self._pending.append(self.path / os.fsdecode(name))
+
+        if self._pending or self._overflow:
+            self._ready.set()
+
+
 # =============================================================================
 # FOLDER WATCHER
 # =============================================================================
@@ -1102,7 +2154,8 @@ class FolderWatcher:
     def __init__(
         self,
         file_processor: FileProcessor,
-        watch_interval: int = WATCH_INTERVAL
+        watch_interval: int = WATCH_INTERVAL,
+        queue: Optional[ActionPriorityQueue] = None
     ):
         """
         Initialize folder watcher.
@@ -1110,25 +2163,88 @@ class FolderWatcher:
         Args:
             file_processor: Processor for files
             watch_interval: Seconds between checks
+            queue: Priority queue deciding execution order
         """
         self.file_processor = file_processor
         self.watch_interval = watch_interval
         self.processed_files = set()
+        self.scheduler = file_processor.scheduler
+        self.queue = queue or ActionPriorityQueue()
 
     async def watch(self):
         """
         Watch folder continuously for new files.
 
+        Uses inotify events where available and falls back to polling.
         Runs until interrupted.
         """
         logger.info(f"Watching {APPROVED_PATH} for approved actions...")
         logger.info(f"Press Ctrl+C to stop")
 
+        events = None
+        if FolderEvents.available():
+            try:
+                events = FolderEvents(APPROVED_PATH)
+                events.start()
+                logger.info("Using inotify events (no polling)")
+            except OSError as e:
+                logger.warning(f"inotify unavailable ({e}), falling back to polling")
+                events = None
+
+        if events is None:
+            await self._poll_loop()
+            return
+
+        try:
+            await self._event_loop(events)
+        finally:
+            events.close()
+
+    async def _poll_loop(self):
+        """Rescan the folder every watch_interval seconds."""
         while True:
             try:
                 await self._check_folder()
+                await asyncio.sleep(self._next_sleep())
+
+            except KeyboardInterrupt:
+                logger.info("Stopping watcher...")
+                break
+
+            except Exception as e:
+                logger.error(f"Error in watch loop: {e}")
                 await asyncio.sleep(self.watch_interval)
 
+    async def _event_loop(self, events: FolderEvents):
+        """
+        Process files as inotify reports them.
+
+        Blocks until a file arrives or the next deferred action is due.
+        """
+        # Pick up anything approved while the executor was down
+        await self._check_folder()
+
+        while True:
+            try:
+                timeout = self.scheduler.time_until_next() if self.scheduler else None
+                paths, overflow = await events.wait(timeout)
+
+                if overflow:
+                    logger.warning("inotify queue overflow, rescanning folder")
+                    await self._check_folder()
+                    continue
+
+                md_files = []
+                for path in paths:
+                    if path.suffix != '.md' or path in md_files:
+                        continue
+                    # A new arrival under a previously seen name is a new action
+                    self.processed_files.discard(path)
+                    md_files.append(path)
+
+                self._enqueue([f for f in md_files if f.exists()])
+                await self._drain_queue()
+
             except KeyboardInterrupt:
                 logger.info("Stopping watcher...")
                 break
@@ -1137,6 +2253,17 @@ class FolderWatcher:
                 logger.error(f"Error in watch loop: {e}")
                 await asyncio.sleep(self.watch_interval)
 
+    def _next_sleep(self) -> float:
+        """Sleep until the next scan or the next deferred action, whichever is sooner."""
+        if self.scheduler is None:
+            return self.watch_interval
+
+        wait = self.scheduler.time_until_next()
+        if wait is None:
+            return self.watch_interval
+
+        return min(self.watch_interval, wait)
+
     async def process_once(self):
         """
         Process all files in folder once (no watching).
@@ -1159,26 +2286,66 @@ class FolderWatcher:
             logger.warning(f"Approved folder does not exist: {APPROVED_PATH}")
             return 0
 
-        # Get all markdown files
-        files = list(APPROVED_PATH.glob("*.md"))
+        self._enqueue(list(APPROVED_PATH.glob("*.md")))
 
-        # Filter out already processed
-        new_files = [f for f in files if f not in self.processed_files]
+        return await self._drain_queue()
 
-        if not new_files:
-            return 0
+    def _enqueue(self, files: List[Path]):
+        """
+        Queue due deferred actions and new candidate files.
 
-        logger.info(f"Found {len(new_files)} new file(s) to process")
+        Args:
+            files: Candidate files from a folder scan or inotify events
+        """
+        # Deferred actions that are now eligible
+        due_files = []
+        if self.scheduler is not None:
+            due_files = [f for f in self.scheduler.pop_due() if f.exists()]
+
+        # Filter out already processed and still-parked files
+        new_files = [
+            f for f in files
+            if f not in self.processed_files
+            and f not in due_files
+            and f not in self.queue
+            and not (self.scheduler is not None and self.scheduler.is_scheduled(f))
+        ]
+
+        if due_files:
+            logger.info(f"Resuming {len(due_files)} deferred file(s)")
+        if new_files:
+            logger.info(f"Found {len(new_files)} new file(s) to process")
+
+        for file_path in due_files + new_files:
+            self.queue.push(file_path)
+
+    async def _drain_queue(self) -> int:
+        """
+        Process queued files in priority order.
 
-        # Process files
+        Returns:
+            Number of files processed successfully
+        """
         processed_count = 0
-        for file_path in new_files:
+        while len(self.queue):
+            file_path = self.queue.pop()
+            if not file_path.exists():
+                continue
+
+            # Rate-limited backlog that lost this slot to a higher-value file
+            if self.file_processor.repark_if_rate_limited(file_path):
+                continue
+
             try:
                 result = await self.file_processor.process_file(file_path)
 
                 if result['success']:
                     processed_count += 1
 
+                # Deferred files stay eligible for a later pass
+                if result.get('deferred'):
+                    continue
+
                 # Mark as processed
                 self.processed_files.add(file_path)
 
@@ -1213,7 +2380,17 @@ async def main():
         '--interval',
         type=int,
         default=WATCH_INTERVAL,
-        help=f'Watch interval in seconds (default: {WATCH_INTERVAL})'
+        help=f'Polling interval in seconds when inotify is unavailable (default: {WATCH_INTERVAL})'
+    )
+    parser.add_argument(
+        '--priority-weights',
+        type=Path,
+        help='JSON file overriding queue weights (priority, action_type, age_per_hour)'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Print latency statistics from the metrics file and exit'
     )
     parser.add_argument(
         '--debug',
@@ -1227,6 +2404,10 @@ async def main():
     if args.debug:
         logger.setLevel(logging.DEBUG)
 
+    if args.stats:
+        print(ExecutionStats().render())
+        return
+
     # Print configuration
     logger.info("=" * 70)
     logger.info("Approval Executor - MCP Action Dispatcher")
@@ -1262,8 +2443,24 @@ async def main():
         dry_run=args.dry_run,
         linkedin_client=linkedin_client
     )
-    file_processor = FileProcessor(action_executor, dry_run=args.dry_run)
-    watcher = FolderWatcher(file_processor, watch_interval=args.interval)
+    scheduler = ActionScheduler()
+    file_processor = FileProcessor(
+        action_executor,
+        dry_run=args.dry_run,
+        scheduler=scheduler,
+        stats=ExecutionStats()
+    )
+
+    weights = {}
+    if args.priority_weights:
+        with open(args.priority_weights, 'r', encoding='utf-8') as f:
+            weights = json.load(f)
+    queue = ActionPriorityQueue(
+        priority_weights=weights.get('priority'),
+        action_weights=weights.get('action_type'),
+        age_weight=weights.get('age_per_hour', AGE_WEIGHT_PER_HOUR)
+    )
+    watcher = FolderWatcher(file_processor, watch_interval=args.interval, queue=queue)
 
     # Run
     try:
@@ -1271,6 +2468,8 @@ async def main():
             # Process once and exit
             count = await watcher.process_once()
             logger.info(f"Processed {count} file(s)")
+            if len(scheduler):
+                logger.info(f"{len(scheduler)} deferred file(s) left in Approved/ for the next run")
         else:
             # Watch continuously
             await watcher.watch()
@@ -3,18 +3,41 @@
 CEO Briefing Generator - Implementation
 Analyzes system data to generate executive briefings with actionable insights.
 
+This is the single briefing engine: build_briefing() runs every analysis
+once and the RENDERERS (markdown, JSON, CSV) all render that result.
+scripts/generate_briefing.py and the API use it.
+
+Closed days archived by log_archive.py are read transparently, including
+entries written to a day after it was archived.
+
+Per-day log analysis and task-file timestamps are cached in
+Logs/.briefing_cache.json, so repeated briefings only re-read days and
+task files that changed.
+
+Task latencies (creation, categorization, approval, completion) are joined
+per task id across days and summarized as p50/p90/p99 with a streaming
+quantile sketch.
+
 Version: 1.0.0
 Author: AI Employee System
 """
 
 import os
+import re
+import io
+import csv
 import json
+import math
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import statistics
 
+from log_archive import day_log_files, is_archive, merge_day_entries, read_archive
+
 
 # ============================================================================
 # CONFIGURATION
@@ -25,10 +48,42 @@ NEEDS_ACTION_PATH = VAULT_PATH / "Needs_Action"
 HIGH_PRIORITY_PATH = VAULT_PATH / "High_Priority"
 PENDING_APPROVAL_PATH = VAULT_PATH / "Pending_Approval"
 APPROVED_PATH = VAULT_PATH / "Approved"
+REJECTED_PATH = VAULT_PATH / "Rejected"
 DONE_PATH = VAULT_PATH / "Done"
 FAILED_PATH = VAULT_PATH / "Failed"
 LOGS_PATH = VAULT_PATH / "Logs"
 REPORTS_PATH = VAULT_PATH / "Reports"
+ANALYSIS_CACHE_FILE = LOGS_PATH / ".briefing_cache.json"
+
+# Bump when the per-day analysis format changes to invalidate old entries
+ANALYSIS_CACHE_VERSION = 3
+
+# Log files are parsed incrementally in chunks of this many characters
+LOG_READ_CHUNK = 64 * 1024
+
+# Day files are parsed in a process pool when there is enough to parse
+LOG_PARSE_WORKERS = os.cpu_count() or 1
+PARALLEL_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+# Task lifecycle events joined per task id for latency metrics
+CREATION_ACTIONS = {'move_to_inbox', 'move_to_needs_action'}
+CATEGORY_LABELS = {
+    'high_priority': 'High Priority',
+    'requires_approval': 'Approval Required',
+    'auto_complete': 'Auto-Completed',
+    'categorized': 'Normal'
+}
+DECISION_ACTIONS = {'approve', 'reject'}
+
+# Latency quantiles are reported within this relative error
+LATENCY_SKETCH_ACCURACY = 0.01
+LATENCY_QUANTILES = (0.5, 0.9, 0.99)
+
+# Folders counted in the queue snapshot
+SNAPSHOT_FOLDERS = (
+    NEEDS_ACTION_PATH, HIGH_PRIORITY_PATH, PENDING_APPROVAL_PATH,
+    APPROVED_PATH, REJECTED_PATH, DONE_PATH, FAILED_PATH
+)
 
 # Thresholds
 APPROVAL_BOTTLENECK_HOURS = 48
@@ -78,6 +133,112 @@ def parse_yaml_frontmatter(file_path: Path) -> Dict:
         return {}
 
 
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_log_entries(log_file: Path, chunk_size: int = LOG_READ_CHUNK) -> Iterator[Any]:
+    """
+    Stream the entries of a JSON array log file one at a time.
+
+    Only the current chunk and entry are held in memory, however large the
+    file is. Archived days (see log_archive.py) are decompressed a day at a
+    time instead.
+
+    Args:
+        log_file: Daily log file containing a JSON array, or its archive
+        chunk_size: Characters read per refill
+
+    Yields:
+        Decoded array elements, in order
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array
+    """
+    if is_archive(log_file):
+        yield from read_archive(log_file)
+        return
+
+    decoder = json.JSONDecoder()
+
+    with open(log_file, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+        state = 'start'  # start -> first -> (value -> sep)* -> done
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+
+            if pos >= len(buffer):
+                if eof:
+                    if state == 'done':
+                        return
+                    raise ValueError(f"Unexpected end of log file: {log_file}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+
+            char = buffer[pos]
+
+            if state == 'start':
+                if char != '[':
+                    raise ValueError(f"Log file is not a JSON array: {log_file}")
+                pos += 1
+                state = 'first'
+
+            elif state == 'done':
+                raise ValueError(f"Extra data after JSON array: {log_file}")
+
+            elif char == ']' and state in ('first', 'sep'):
+                pos += 1
+                state = 'done'
+
+            elif state == 'sep':
+                if char != ',':
+                    raise ValueError(f"Expected ',' in log file: {log_file}")
+                pos += 1
+                state = 'value'
+
+            else:
+                try:
+                    entry, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    end = None
+
+                # Incomplete value, or one that might continue in the next
+                # chunk (e.g. a split number): read more and retry
+                if end is not None:
+                    following = _WHITESPACE.match(buffer, end).end()
+                if not eof and (end is None or buffer[following:following + 1] not in (',', ']')):
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                if end is None:
+                    raise ValueError(f"Malformed entry in log file: {log_file}")
+
+                yield entry
+                pos = end
+                state = 'sep'
+
+
+def iter_day_entries(log_files: List[Path]) -> Iterator[Any]:
+    """
+    Stream a day's entries from the files returned by day_log_files().
+
+    Entries written after the day was archived follow the archived ones.
+
+    Raises:
+        ValueError: If a file is malformed
+    """
+    if len(log_files) == 1:
+        yield from iter_log_entries(log_files[0])
+        return
+
+    yield from merge_day_entries(list(read_archive(log_files[0])), iter_log_entries(log_files[1]))
+
+
 def format_timedelta(td: timedelta) -> str:
     """Format timedelta as human-readable string."""
     hours = td.total_seconds() / 3600
@@ -90,14 +251,453 @@ def format_timedelta(td: timedelta) -> str:
         return f"{days} day{'s' if days != 1 else ''}"
 
 
+def format_duration(seconds: float) -> str:
+    """Format a latency in seconds compactly (e.g. 45s, 12.5m, 3.5h, 2.0d)."""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    elif seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    elif seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    else:
+        return f"{seconds / 86400:.1f}d"
+
+
+def folder_label(folder: str) -> str:
+    """Display name for a vault folder id (e.g. pending_approval)."""
+    return folder.replace('_', ' ').title()
+
+
+# ============================================================================
+# LATENCY SKETCH
+# ============================================================================
+
+class LatencySketch:
+    """
+    Streaming quantile sketch for latencies (DDSketch-style).
+
+    Values are counted in logarithmic buckets, so any quantile is accurate
+    to within the relative error given at construction, and memory grows
+    with the spread of the values rather than their number.
+    """
+
+    def __init__(self, accuracy: float = LATENCY_SKETCH_ACCURACY):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = defaultdict(int)
+        self.zero_count = 0  # Latencies under a second
+        self.count = 0
+
+    def add(self, value: float):
+        """Add one latency in seconds."""
+        self.count += 1
+        if value < 1:
+            self.zero_count += 1
+        else:
+            self.buckets[math.ceil(math.log(value) / self.log_gamma)] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds, or None if nothing was added
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(i-1), gamma^i]
+                return 2 * self.gamma ** index / (self.gamma + 1)
+
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+# ============================================================================
+# ANALYSIS CACHE
+# ============================================================================
+
+# Last cache loaded or saved by this process, with the file signature it matches
+_cache_memo = {'signature': None, 'cache': None}
+
+
+def load_analysis_cache() -> Dict:
+    """
+    Load the analysis cache, starting fresh if missing or outdated.
+
+    The parsed cache is kept in memory while the file is unchanged, so the
+    log and task-age analyses of one briefing share a single load.
+    """
+    try:
+        signature = file_signature(ANALYSIS_CACHE_FILE.stat())
+        if signature == _cache_memo['signature']:
+            return _cache_memo['cache']
+
+        with open(ANALYSIS_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get('version') == ANALYSIS_CACHE_VERSION:
+            cache.setdefault('days', {})
+            cache.setdefault('task_files', {})
+            _cache_memo.update(signature=signature, cache=cache)
+            return cache
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    return {'version': ANALYSIS_CACHE_VERSION, 'days': {}, 'task_files': {}}
+
+
+def save_analysis_cache(cache: Dict):
+    """Write the analysis cache atomically (briefings may run concurrently)."""
+    tmp_file = ANALYSIS_CACHE_FILE.with_name(f"{ANALYSIS_CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, ANALYSIS_CACHE_FILE)
+        _cache_memo.update(signature=file_signature(ANALYSIS_CACHE_FILE.stat()), cache=cache)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def file_signature(stat_result: os.stat_result) -> List[int]:
+    """Cache key for a file's contents: [size, mtime_ns]."""
+    return [stat_result.st_size, stat_result.st_mtime_ns]
+
+
 # ============================================================================
 # CORE ANALYSIS FUNCTIONS
 # ============================================================================
 
+def analyze_day(log_files: List[Path]) -> Optional[Dict]:
+    """
+    Analyze one day's log files (see day_log_files) into partial counts.
+
+    Entries are streamed through running counters and discarded, so memory
+    does not grow with the number of entries. Partials from consecutive
+    days are combined by merge_day_analyses.
+
+    Returns:
+        Partial aggregate, or None if the file can't be read
+    """
+    task_count = 0
+    total_tasks = 0
+    completed_tasks = 0
+    auto_completed = 0
+    failed_count = 0
+    categories = defaultdict(int)
+    failed_tasks = []
+    task_events = {}
+    entry_count = 0
+    error_count = 0
+    detail_categories = defaultdict(int)
+    priorities = defaultdict(int)
+
+    try:
+        for log in iter_day_entries(log_files):
+            action = log.get('action', '')
+            record_task_event(task_events, log)
+
+            entry_count += 1
+            if action == 'error':
+                error_count += 1
+
+            # Category and priority assigned by the runner
+            details = log.get('details')
+            if isinstance(details, dict):
+                if 'category' in details:
+                    detail_categories[details['category']] += 1
+                if 'priority' in details:
+                    priorities[details['priority']] += 1
+
+            # Count tasks for this day
+            if 'task' in action.lower():
+                task_count += 1
+
+            # Count task processing events
+            if action in ['high_priority', 'requires_approval', 'auto_complete', 'categorized']:
+                total_tasks += 1
+
+                if action == 'auto_complete':
+                    auto_completed += 1
+
+                if log.get('success', True):
+                    completed_tasks += 1
+
+                # Categorize
+                if action == 'high_priority':
+                    categories['High Priority'] += 1
+                elif action == 'requires_approval':
+                    categories['Approval Required'] += 1
+                elif action == 'auto_complete':
+                    categories['Auto-Completed'] += 1
+                else:
+                    categories['Normal'] += 1
+
+            # Track failed tasks (only the first 10 can ever be reported)
+            if 'error' in action or 'failed' in action or not log.get('success', True):
+                if 'file' in log and len(failed_tasks) < 10:
+                    failed_tasks.append({
+                        'file': log.get('file'),
+                        'error': log.get('error', 'Unknown error'),
+                        'timestamp': log.get('timestamp')
+                    })
+                failed_count += 1
+
+            # Track email actions for categorization
+            if 'email' in action:
+                if 'send' in action:
+                    categories['Email - Send'] += 1
+                elif 'draft' in action:
+                    categories['Email - Draft'] += 1
+                elif 'search' in action:
+                    categories['Email - Search'] += 1
+                elif 'categorize' in action:
+                    categories['Email - Categorize'] += 1
+
+    except (json.JSONDecodeError, Exception):
+        # Unreadable or malformed day: skipped entirely, as before
+        return None
+
+    return {
+        'task_count': task_count,
+        'total_tasks': total_tasks,
+        'completed': completed_tasks,
+        'auto_completed': auto_completed,
+        'failed': failed_count,
+        'categories': dict(categories),
+        'failed_tasks': failed_tasks,
+        'task_events': task_events,
+        'entries': entry_count,
+        'errors': error_count,
+        'detail_categories': dict(detail_categories),
+        'priorities': dict(priorities)
+    }
+
+
+def record_task_event(task_events: Dict[str, Dict], log: Dict):
+    """
+    Fold one log entry into its task's lifecycle timestamps.
+
+    Tasks are keyed by file name without the .md suffix (the web API logs
+    bare task ids). Only the first occurrence of each event is kept, in
+    whole seconds; logs are appended in time order.
+
+    Args:
+        task_events: Task id -> lifecycle dict, updated in place
+        log: Log entry
+    """
+    action = log.get('action')
+    if not (action in CREATION_ACTIONS or action in CATEGORY_LABELS
+            or action in DECISION_ACTIONS or action == 'complete'):
+        return
+
+    task_id = log.get('file')
+    if not isinstance(task_id, str) or not task_id:
+        return
+    if task_id.endswith('.md'):
+        task_id = task_id[:-3]
+
+    try:
+        timestamp = int(datetime.fromisoformat(log.get('timestamp')).timestamp())
+    except (TypeError, ValueError):
+        return
+
+    details = log.get('details')
+    folder = details.get('source') if isinstance(details, dict) else None
+
+    task = task_events.setdefault(task_id, {})
+    if action in CREATION_ACTIONS:
+        task.setdefault('created', timestamp)
+    elif action in CATEGORY_LABELS:
+        if 'processed' not in task:
+            task['processed'] = timestamp
+            task['category'] = CATEGORY_LABELS[action]
+        if action == 'auto_complete':
+            task.setdefault('done', timestamp)
+    elif action in DECISION_ACTIONS:
+        if 'decided' not in task:
+            task['decided'] = timestamp
+            task['decided_from'] = folder or 'unknown'
+    elif 'done' not in task:
+        task['done'] = timestamp
+        task['done_from'] = folder or 'unknown'
+
+
+def compute_latencies(task_events: Dict[str, Dict]) -> List[Dict]:
+    """
+    Join task lifecycle events into latency quantiles.
+
+    Stages:
+        Created → Processed: per category, against TARGET_PROCESSING_MINUTES
+        Awaiting Approval: per folder the decision was made from, against
+            TARGET_APPROVAL_HOURS
+        Processed → Done: per folder the task was completed from
+        Created → Done: per category
+
+    Args:
+        task_events: Task id -> lifecycle dict from record_task_event
+
+    Returns:
+        One row per (stage, group) with count, p50/p90/p99 in seconds and
+        the SLA target in seconds (None if the stage has none)
+    """
+    stage_targets = {
+        'Created → Processed': TARGET_PROCESSING_MINUTES * 60,
+        'Awaiting Approval': TARGET_APPROVAL_HOURS * 3600,
+        'Processed → Done': None,
+        'Created → Done': None
+    }
+    sketches = defaultdict(LatencySketch)
+
+    def observe(stage, group, start, end):
+        if start is not None and end is not None and end >= start:
+            sketches[(stage, group)].add(end - start)
+
+    for task in task_events.values():
+        created = task.get('created')
+        processed = task.get('processed')
+        category = task.get('category', 'Uncategorized')
+
+        observe('Created → Processed', category, created, processed)
+        if 'decided' in task:
+            observe('Awaiting Approval', folder_label(task['decided_from']), processed, task['decided'])
+        if 'done_from' in task:
+            observe('Processed → Done', folder_label(task['done_from']),
+                    task.get('decided', processed), task['done'])
+        observe('Created → Done', category, created, task.get('done'))
+
+    stage_order = list(stage_targets)
+    rows = []
+    for (stage, group) in sorted(sketches, key=lambda k: (stage_order.index(k[0]), k[1])):
+        sketch = sketches[(stage, group)]
+        row = {'stage': stage, 'group': group, 'count': sketch.count}
+        for q in LATENCY_QUANTILES:
+            row[f'p{int(q * 100)}'] = round(sketch.quantile(q), 1)
+        row['target'] = stage_targets[stage]
+        rows.append(row)
+
+    return rows
+
+
+def merge_day_analyses(day_analyses: List[Tuple[str, Dict]]) -> Dict:
+    """
+    Combine per-day partials (in date order) into the analyze_logs result.
+
+    Args:
+        day_analyses: (date string, partial) pairs for days with readable logs
+
+    Returns:
+        Same structure as analyze_logs
+    """
+    daily_counts = {}
+    daily_activity = {}
+    categories = defaultdict(int)
+    detail_categories = defaultdict(int)
+    priorities = defaultdict(int)
+    failed_tasks = []
+    task_events = {}
+    total_tasks = completed_tasks = auto_completed = failed_count = error_count = 0
+
+    for date_str, day in day_analyses:
+        daily_counts[date_str] = day['task_count']
+        daily_activity[date_str] = day['entries']
+        error_count += day['errors']
+        for category, count in day['detail_categories'].items():
+            detail_categories[category] += count
+        for priority, count in day['priorities'].items():
+            priorities[priority] += count
+        total_tasks += day['total_tasks']
+        completed_tasks += day['completed']
+        auto_completed += day['auto_completed']
+        failed_count += day['failed']
+        for category, count in day['categories'].items():
+            categories[category] += count
+        failed_tasks.extend(day['failed_tasks'][:10 - len(failed_tasks)])
+
+        # Join lifecycles across days; earlier days win
+        for task_id, events in day['task_events'].items():
+            task = task_events.setdefault(task_id, {})
+            for key, value in events.items():
+                task.setdefault(key, value)
+
+    # Calculate rates
+    completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    automation_rate = (auto_completed / total_tasks * 100) if total_tasks > 0 else 0
+
+    return {
+        'total_tasks': total_tasks,
+        'completed': completed_tasks,
+        'failed': failed_count,
+        'auto_completed': auto_completed,
+        'daily_breakdown': daily_counts,
+        'category_breakdown': dict(categories),
+        'completion_rate': round(completion_rate, 1),
+        'automation_rate': round(automation_rate, 1),
+        'failed_tasks': failed_tasks[:10],  # Top 10
+        'processing_times': compute_latencies(task_events),
+        'days_analyzed': len(daily_counts),
+        'daily_activity': daily_activity,
+        'errors': error_count,
+        'by_category': dict(detail_categories),
+        'by_priority': dict(priorities)
+    }
+
+
+def map_day_files(func, day_files: List[List[Path]]) -> List:
+    """
+    Apply func to each day's log files, in a process pool when worthwhile.
+
+    Small workloads (or a single core) are parsed in-process, since worker
+    startup would outweigh the parsing. Falls back to sequential parsing if
+    the pool can't be started.
+
+    Args:
+        func: Module-level function taking a day's log file paths (must be
+            picklable)
+        day_files: Each day's files, as returned by day_log_files()
+
+    Returns:
+        func results, in the same order as day_files
+    """
+    workers = min(LOG_PARSE_WORKERS, len(day_files))
+    if workers > 1:
+        total_bytes = 0
+        for log_files in day_files:
+            for log_file in log_files:
+                try:
+                    total_bytes += log_file.stat().st_size
+                except OSError:
+                    pass
+        if total_bytes >= PARALLEL_PARSE_MIN_BYTES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(func, day_files))
+            except (OSError, BrokenProcessPool):
+                pass
+
+    return [func(log_files) for log_files in day_files]
+
+
 def analyze_logs(days: int = 7) -> Dict:
     """
     Analyze log files for past N days.
 
+    Each day's partial analysis is cached keyed by the size and mtime of its
+    log files (plain and archived); only new or changed days are re-read, in a process pool when
+    there are enough of them.
+
     Returns:
         {
             'total_tasks': int,
@@ -108,7 +708,12 @@ def analyze_logs(days: int = 7) -> Dict:
             'completion_rate': float,
             'automation_rate': float,
             'failed_tasks': list,
-            'processing_times': list
+            'processing_times': list,  # Latency rows from compute_latencies
+            'days_analyzed': int,
+            'daily_activity': dict,  # Log entries per day
+            'errors': int,  # 'error' actions
+            'by_category': dict,  # Runner-assigned category
+            'by_priority': dict
         }
     """
     ensure_directories()
@@ -116,106 +721,102 @@ def analyze_logs(days: int = 7) -> Dict:
     now = datetime.now()
     start_date = now - timedelta(days=days)
 
-    all_logs = []
-    daily_counts = defaultdict(int)
-    categories = defaultdict(int)
-    failed_tasks = []
-    processing_times = []
+    cache = load_analysis_cache()
+    cache_changed = False
+    day_dates = []
+    stale_days = []
 
-    # Load logs for each day
+    # Find each day's log file and whether its cached analysis is current
     for i in range(days):
         date = start_date + timedelta(days=i)
-        log_file = LOGS_PATH / f"{date.strftime('%Y-%m-%d')}.json"
+        date_str = date.strftime("%Y-%m-%d")
+        log_files = day_log_files(date_str, LOGS_PATH)
 
-        if not log_file.exists():
+        try:
+            signature = [file_signature(log_file.stat()) for log_file in log_files] or None
+        except OSError:
+            signature = None
+        if signature is None:
+            if cache['days'].pop(date_str, None) is not None:
+                cache_changed = True
             continue
 
-        try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                daily_logs = json.load(f)
-                all_logs.extend(daily_logs)
+        day_dates.append(date_str)
+        cached = cache['days'].get(date_str)
+        if not (cached and cached['signature'] == signature):
+            stale_days.append((date_str, log_files, signature))
 
-                # Count tasks for this day
-                date_str = date.strftime("%Y-%m-%d")
-                task_count = len([l for l in daily_logs if 'task' in l.get('action', '').lower()])
-                daily_counts[date_str] = task_count
+    # Parse new or changed days (in parallel when there's enough work)
+    analyses = map_day_files(analyze_day, [log_files for _, log_files, _ in stale_days])
+    for (date_str, _, signature), analysis in zip(stale_days, analyses):
+        cache['days'][date_str] = {'signature': signature, 'analysis': analysis}
+        cache_changed = True
 
-        except (json.JSONDecodeError, Exception):
-            continue
+    day_analyses = []
+    for date_str in day_dates:
+        analysis = cache['days'][date_str]['analysis']
+        if analysis is not None:
+            day_analyses.append((date_str, analysis))
 
-    # Analyze all logs
-    total_tasks = 0
-    completed_tasks = 0
-    auto_completed = 0
-    failed_count = 0
+    if cache_changed:
+        save_analysis_cache(cache)
 
-    for log in all_logs:
-        action = log.get('action', '')
+    return merge_day_analyses(day_analyses)
 
-        # Count task processing events
-        if action in ['high_priority', 'requires_approval', 'auto_complete', 'categorized']:
-            total_tasks += 1
 
-            if action == 'auto_complete':
-                auto_completed += 1
+def scan_task_timestamps(folder: Path, keys: Tuple[str, ...], cache: Dict) -> Tuple[List[Tuple[str, str]], bool]:
+    """
+    Get each task file's creation timestamp, parsing only changed files.
 
-            if log.get('success', True):
-                completed_tasks += 1
+    Args:
+        folder: Folder to scan for *.md task files
+        keys: Frontmatter keys to try, in order
+        cache: Analysis cache ('task_files' section is used and updated)
 
-            # Categorize
-            if action == 'high_priority':
-                categories['High Priority'] += 1
-            elif action == 'requires_approval':
-                categories['Approval Required'] += 1
-            elif action == 'auto_complete':
-                categories['Auto-Completed'] += 1
+    Returns:
+        ([(file name, timestamp string)], whether the cache changed)
+    """
+    task_cache = cache['task_files']
+    prefix = f"{folder.name}/"
+    seen = set()
+    changed = False
+    results = []
+
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".md") or not entry.is_file():
+                continue
+
+            key = prefix + entry.name
+            seen.add(key)
+            signature = file_signature(entry.stat())
+
+            cached = task_cache.get(key)
+            if cached and cached[0] == signature:
+                created_at = cached[1]
             else:
-                categories['Normal'] += 1
-
-        # Track failed tasks
-        if 'error' in action or 'failed' in action or not log.get('success', True):
-            if 'file' in log:
-                failed_tasks.append({
-                    'file': log.get('file'),
-                    'error': log.get('error', 'Unknown error'),
-                    'timestamp': log.get('timestamp')
-                })
-            failed_count += 1
-
-        # Track email actions for categorization
-        if 'email' in action:
-            if 'send' in action:
-                categories['Email - Send'] += 1
-            elif 'draft' in action:
-                categories['Email - Draft'] += 1
-            elif 'search' in action:
-                categories['Email - Search'] += 1
-            elif 'categorize' in action:
-                categories['Email - Categorize'] += 1
+                metadata = parse_yaml_frontmatter(Path(entry.path))
+                created_at = next((metadata[k] for k in keys if k in metadata), '')
+                task_cache[key] = [signature, created_at]
+                changed = True
 
-    # Calculate rates
-    completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-    automation_rate = (auto_completed / total_tasks * 100) if total_tasks > 0 else 0
+            results.append((entry.name, created_at))
 
-    return {
-        'total_tasks': total_tasks,
-        'completed': completed_tasks,
-        'failed': failed_count,
-        'auto_completed': auto_completed,
-        'daily_breakdown': dict(daily_counts),
-        'category_breakdown': dict(categories),
-        'completion_rate': round(completion_rate, 1),
-        'automation_rate': round(automation_rate, 1),
-        'failed_tasks': failed_tasks[:10],  # Top 10
-        'processing_times': processing_times,
-        'days_analyzed': len(daily_counts)
-    }
+    # Forget files that left the folder
+    for key in [k for k in task_cache if k.startswith(prefix) and k not in seen]:
+        del task_cache[key]
+        changed = True
+
+    return results, changed
 
 
 def analyze_task_ages() -> Dict:
     """
     Analyze age of tasks in all folders.
 
+    Task file timestamps are cached by file size and mtime, so unchanged
+    folders are only stat()ed.
+
     Returns:
         {
             'stale_tasks': list,
@@ -232,11 +833,15 @@ def analyze_task_ages() -> Dict:
     high_priority_delayed = []
     folder_ages = defaultdict(list)
 
-    # Analyze Pending_Approval
-    for task_file in PENDING_APPROVAL_PATH.glob("*.md"):
-        metadata = parse_yaml_frontmatter(task_file)
-        created_at = metadata.get('created_at', '')
+    cache = load_analysis_cache()
+    pending, pending_changed = scan_task_timestamps(PENDING_APPROVAL_PATH, ('created_at',), cache)
+    needs_action, needs_changed = scan_task_timestamps(NEEDS_ACTION_PATH, ('createdAt', 'created_at'), cache)
+    high_priority, high_changed = scan_task_timestamps(HIGH_PRIORITY_PATH, ('createdAt', 'created_at'), cache)
+    if pending_changed or needs_changed or high_changed:
+        save_analysis_cache(cache)
 
+    # Analyze Pending_Approval
+    for file_name, created_at in pending:
         if created_at:
             try:
                 created = datetime.fromisoformat(created_at)
@@ -245,7 +850,7 @@ def analyze_task_ages() -> Dict:
 
                 if age.total_seconds() > (APPROVAL_BOTTLENECK_HOURS * 3600):
                     approval_bottlenecks.append({
-                        'file': task_file.name,
+                        'file': file_name,
                         'age': format_timedelta(age),
                         'age_hours': int(age.total_seconds() / 3600),
                         'created_at': created_at
@@ -254,10 +859,7 @@ def analyze_task_ages() -> Dict:
                 pass
 
     # Analyze Needs_Action
-    for task_file in NEEDS_ACTION_PATH.glob("*.md"):
-        metadata = parse_yaml_frontmatter(task_file)
-        created_at = metadata.get('createdAt', metadata.get('created_at', ''))
-
+    for file_name, created_at in needs_action:
         if created_at:
             try:
                 created = datetime.fromisoformat(created_at)
@@ -266,7 +868,7 @@ def analyze_task_ages() -> Dict:
 
                 if age.total_seconds() > (STALE_TASK_DAYS * 86400):
                     stale_tasks.append({
-                        'file': task_file.name,
+                        'file': file_name,
                         'age': format_timedelta(age),
                         'age_days': int(age.total_seconds() / 86400),
                         'created_at': created_at
@@ -275,10 +877,7 @@ def analyze_task_ages() -> Dict:
                 pass
 
     # Analyze High_Priority
-    for task_file in HIGH_PRIORITY_PATH.glob("*.md"):
-        metadata = parse_yaml_frontmatter(task_file)
-        created_at = metadata.get('createdAt', metadata.get('created_at', ''))
-
+    for file_name, created_at in high_priority:
         if created_at:
             try:
                 created = datetime.fromisoformat(created_at)
@@ -287,7 +886,7 @@ def analyze_task_ages() -> Dict:
 
                 if age.total_seconds() > (HIGH_PRIORITY_THRESHOLD_HOURS * 3600):
                     high_priority_delayed.append({
-                        'file': task_file.name,
+                        'file': file_name,
                         'age': format_timedelta(age),
                         'age_hours': int(age.total_seconds() / 3600),
                         'created_at': created_at
@@ -316,6 +915,28 @@ def analyze_task_ages() -> Dict:
     }
 
 
+def count_folder_tasks() -> Dict[str, int]:
+    """
+    Count task files currently in each workflow folder.
+
+    Returns:
+        Folder name -> number of .md files (0 if the folder is missing)
+    """
+    counts = {}
+    for folder in SNAPSHOT_FOLDERS:
+        count = 0
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.md') and entry.is_file():
+                        count += 1
+        except OSError:
+            pass
+        counts[folder.name] = count
+
+    return counts
+
+
 def detect_patterns(logs_data: Dict) -> List[Dict]:
     """
     Detect patterns in task data.
@@ -446,6 +1067,68 @@ def generate_suggestions(analysis: Dict, age_analysis: Dict) -> List[Dict]:
     return suggestions
 
 
+# ============================================================================
+# BRIEFING ENGINE
+# ============================================================================
+
+def build_briefing(days: int = 7, verbose: bool = False) -> Dict:
+    """
+    Run every analysis once and collect the results for the renderers.
+
+    Args:
+        days: Number of days to analyze
+        verbose: Print progress for each step
+
+    Returns:
+        {
+            'generated_at': str,  # ISO timestamp
+            'period': {'start': str, 'end': str, 'days': int},
+            'logs': dict,  # analyze_logs
+            'ages': dict,  # analyze_task_ages
+            'folders': dict,  # count_folder_tasks
+            'patterns': list,
+            'suggestions': list
+        }
+    """
+    def progress(message):
+        if verbose:
+            print(message)
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+
+    progress("[1/5] Analyzing log files...")
+    logs_analysis = analyze_logs(days)
+    progress(f"      Found {logs_analysis['total_tasks']} tasks across {logs_analysis['days_analyzed']} days")
+
+    progress("[2/5] Analyzing task ages...")
+    age_analysis = analyze_task_ages()
+    folders = count_folder_tasks()
+    progress(f"      Identified {len(age_analysis['approval_bottlenecks'])} approval bottlenecks")
+
+    progress("[3/5] Detecting patterns...")
+    patterns = detect_patterns(logs_analysis)
+    progress(f"      Detected {len(patterns)} patterns")
+
+    progress("[4/5] Generating suggestions...")
+    suggestions = generate_suggestions(logs_analysis, age_analysis)
+    progress(f"      Generated {len(suggestions)} actionable suggestions")
+
+    return {
+        'generated_at': end_date.isoformat(timespec='seconds'),
+        'period': {
+            'start': start_date.strftime('%Y-%m-%d'),
+            'end': end_date.strftime('%Y-%m-%d'),
+            'days': days
+        },
+        'logs': logs_analysis,
+        'ages': age_analysis,
+        'folders': folders,
+        'patterns': patterns,
+        'suggestions': suggestions
+    }
+
+
 # ============================================================================
 # REPORT RENDERING
 # ============================================================================
@@ -505,6 +1188,27 @@ def render_metrics_table(analysis: Dict) -> str:
 | Days Analyzed | {analysis['days_analyzed']} |
 """
 
+    latencies = analysis['processing_times']
+    if latencies:
+        content += """
+### Latency (p50 / p90 / p99)
+
+| Stage | Group | Tasks | p50 | p90 | p99 | SLA (p90) |
+|-------|-------|-------|-----|-----|-----|-----------|
+"""
+        for row in latencies:
+            if row['target'] is None:
+                sla = "-"
+            elif row['p90'] <= row['target']:
+                sla = f"✅ ≤ {format_duration(row['target'])}"
+            else:
+                sla = f"⚠️ > {format_duration(row['target'])}"
+            content += (
+                f"| {row['stage']} | {row['group']} | {row['count']} | "
+                f"{format_duration(row['p50'])} | {format_duration(row['p90'])} | "
+                f"{format_duration(row['p99'])} | {sla} |\n"
+            )
+
     return content
 
 
@@ -671,63 +1375,38 @@ def render_action_items(suggestions: List[Dict]) -> str:
     return content
 
 
-# ============================================================================
-# MAIN BRIEFING GENERATOR
-# ============================================================================
+def render_queue_snapshot(briefing: Dict) -> str:
+    """Render current folder counts and the priority mix."""
+    content = "\n### Current Queue\n\n"
+    content += "| Folder | Tasks |\n"
+    content += "|--------|-------|\n"
+    for folder, count in briefing['folders'].items():
+        content += f"| {folder.replace('_', ' ')} | {count} |\n"
 
-def generate_ceo_briefing(days: int = 7) -> Dict:
-    """
-    Generate CEO briefing report.
+    priorities = briefing['logs']['by_priority']
+    if priorities:
+        content += "\n### By Priority\n\n"
+        for priority, count in sorted(priorities.items(), key=lambda x: x[1], reverse=True):
+            content += f"- **{str(priority).upper()}**: {count} tasks\n"
 
-    Args:
-        days: Number of days to analyze
+    return content
 
-    Returns:
-        {
-            'success': bool,
-            'report_file': str,
-            'metrics': dict
-        }
-    """
-    ensure_directories()
 
-    print("=" * 60)
-    print("CEO Briefing Generator")
-    print("=" * 60)
-    print(f"\nAnalyzing data for the past {days} days...\n")
+def render_markdown(briefing: Dict) -> str:
+    """Render the full markdown briefing."""
+    logs_analysis = briefing['logs']
+    age_analysis = briefing['ages']
+    suggestions = briefing['suggestions']
+    days = briefing['period']['days']
 
-    try:
-        # Step 1: Analyze logs
-        print("[1/5] Analyzing log files...")
-        logs_analysis = analyze_logs(days)
-        print(f"      Found {logs_analysis['total_tasks']} tasks across {logs_analysis['days_analyzed']} days")
-
-        # Step 2: Analyze task ages
-        print("[2/5] Analyzing task ages...")
-        age_analysis = analyze_task_ages()
-        print(f"      Identified {len(age_analysis['approval_bottlenecks'])} approval bottlenecks")
-
-        # Step 3: Detect patterns
-        print("[3/5] Detecting patterns...")
-        patterns = detect_patterns(logs_analysis)
-        print(f"      Detected {len(patterns)} patterns")
-
-        # Step 4: Generate suggestions
-        print("[4/5] Generating suggestions...")
-        suggestions = generate_suggestions(logs_analysis, age_analysis)
-        print(f"      Generated {len(suggestions)} actionable suggestions")
-
-        # Step 5: Render report
-        print("[5/5] Rendering report...")
-
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        report_content = f"""# Executive Briefing
+    generated_at = datetime.fromisoformat(briefing['generated_at'])
+    end_date = generated_at
+    start_date = end_date - timedelta(days=days)
+
+    return f"""# Executive Briefing
 ## {start_date.strftime('%B %d')} - {end_date.strftime('%B %d, %Y')}
 
-📊 **Report Generated:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
+📊 **Report Generated:** {generated_at.strftime('%B %d, %Y at %I:%M %p')}
 👤 **Prepared For:** Executive Leadership
 📈 **Period:** {days} days ({start_date.strftime('%B %d')} - {end_date.strftime('%B %d')})
 
@@ -745,6 +1424,8 @@ def generate_ceo_briefing(days: int = 7) -> Dict:
 
 {render_category_breakdown(logs_analysis)}
 
+{render_queue_snapshot(briefing)}
+
 ---
 
 {render_bottlenecks(age_analysis)}
@@ -785,24 +1466,136 @@ def generate_ceo_briefing(days: int = 7) -> Dict:
 *Next briefing: {(end_date + timedelta(days=7)).strftime('%B %d, %Y')}*
 """
 
-        # Save report
-        report_filename = f"CEO_Briefing_{end_date.strftime('%Y-%m-%d')}.md"
-        report_path = REPORTS_PATH / report_filename
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
+def render_json(briefing: Dict) -> str:
+    """Render the briefing data as JSON (used by the frontend reports page)."""
+    return json.dumps(briefing, indent=2, ensure_ascii=False)
+
+
+def render_csv(briefing: Dict) -> str:
+    """
+    Render the briefing metrics as CSV for spreadsheets.
+
+    One metric per row: section, name, metric, value.
+    """
+    logs_analysis = briefing['logs']
+    age_analysis = briefing['ages']
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['section', 'name', 'metric', 'value'])
+
+    for key in ('total_tasks', 'completed', 'failed', 'auto_completed', 'errors',
+                'completion_rate', 'automation_rate', 'days_analyzed'):
+        writer.writerow(['summary', key, 'value', logs_analysis[key]])
+
+    for date_str, count in sorted(logs_analysis['daily_breakdown'].items()):
+        writer.writerow(['daily', date_str, 'tasks', count])
+    for date_str, count in sorted(logs_analysis['daily_activity'].items()):
+        writer.writerow(['daily', date_str, 'actions', count])
+
+    for category, count in logs_analysis['category_breakdown'].items():
+        writer.writerow(['category', category, 'count', count])
+    for priority, count in logs_analysis['by_priority'].items():
+        writer.writerow(['priority', priority, 'count', count])
+
+    for row in logs_analysis['processing_times']:
+        name = f"{row['stage']} / {row['group']}"
+        writer.writerow(['latency', name, 'count', row['count']])
+        for q in LATENCY_QUANTILES:
+            metric = f"p{int(q * 100)}"
+            writer.writerow(['latency', name, f"{metric}_seconds", row[metric]])
+
+    for folder, count in briefing['folders'].items():
+        writer.writerow(['folder', folder, 'tasks', count])
+    for folder, age in age_analysis['avg_age_by_folder'].items():
+        unit = 'days' if folder == 'Needs_Action' else 'hours'
+        writer.writerow(['folder', folder, f"avg_age_{unit}", age])
+
+    for key in ('approval_bottlenecks', 'stale_tasks', 'high_priority_delayed'):
+        writer.writerow(['bottleneck', key, 'count', len(age_analysis[key])])
+
+    for suggestion in briefing['suggestions']:
+        writer.writerow(['suggestion', suggestion['title'], 'priority', suggestion['priority']])
+
+    return output.getvalue()
+
+
+# Output format -> (file extension, renderer). Add an entry to plug in a
+# new format; every renderer receives the same build_briefing() result.
+RENDERERS = {
+    'markdown': ('md', render_markdown),
+    'json': ('json', render_json),
+    'csv': ('csv', render_csv)
+}
+
+
+# ============================================================================
+# MAIN BRIEFING GENERATOR
+# ============================================================================
+
+def generate_ceo_briefing(days: int = 7, formats: Tuple[str, ...] = ('markdown',)) -> Dict:
+    """
+    Generate CEO briefing report.
+
+    The vault is analyzed once and the result rendered in every requested
+    format, saved as Reports/CEO_Briefing_<date>.<ext>.
+
+    Args:
+        days: Number of days to analyze
+        formats: Output formats (keys of RENDERERS)
+
+    Returns:
+        {
+            'success': bool,
+            'report_file': str,  # First requested format
+            'report_files': dict,  # Format -> path
+            'metrics': dict
+        }
+    """
+    unknown = [fmt for fmt in formats if fmt not in RENDERERS]
+    if unknown or not formats:
+        return {
+            "success": False,
+            "error": f"Unknown report format(s): {', '.join(unknown) or 'none given'}"
+        }
+
+    ensure_directories()
+
+    print("=" * 60)
+    print("CEO Briefing Generator")
+    print("=" * 60)
+    print(f"\nAnalyzing data for the past {days} days...\n")
+
+    try:
+        briefing = build_briefing(days, verbose=True)
+        logs_analysis = briefing['logs']
+        age_analysis = briefing['ages']
+
+        # Step 5: Render report in each format
+        print(f"[5/5] Rendering report ({', '.join(formats)})...")
+
+        report_files = {}
+        for fmt in formats:
+            extension, renderer = RENDERERS[fmt]
+            report_path = REPORTS_PATH / f"CEO_Briefing_{briefing['period']['end']}.{extension}"
+
+            with open(report_path, "w", encoding="utf-8", newline="") as f:
+                f.write(renderer(briefing))
 
-        print(f"\n[OK] Report generated: {report_path}")
+            report_files[fmt] = str(report_path)
+            print(f"\n[OK] Report generated: {report_path}")
 
         return {
             "success": True,
-            "report_file": str(report_path),
+            "report_file": report_files[formats[0]],
+            "report_files": report_files,
             "metrics": {
                 "total_tasks": logs_analysis['total_tasks'],
                 "completion_rate": logs_analysis['completion_rate'],
                 "automation_rate": logs_analysis['automation_rate'],
                 "bottlenecks": len(age_analysis['approval_bottlenecks']) + len(age_analysis['stale_tasks']),
-                "suggestions": len(suggestions)
+                "suggestions": len(briefing['suggestions'])
             }
         }
 
@@ -825,13 +1618,15 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate CEO briefing report")
     parser.add_argument('--days', type=int, default=7, help='Number of days to analyze (default: 7)')
     parser.add_argument('--dry-run', action='store_true', help='Analyze without generating report')
+    parser.add_argument('--format', action='append', choices=list(RENDERERS), dest='formats',
+                        help='Output format, repeatable (default: markdown)')
 
     args = parser.parse_args()
 
     if args.dry_run:
         print("DRY RUN MODE - No report will be generated\n")
 
-    result = generate_ceo_briefing(days=args.days)
+    result = generate_ceo_briefing(days=args.days, formats=tuple(args.formats or ['markdown']))
 
     if result['success']:
         print("\n" + "=" * 60)
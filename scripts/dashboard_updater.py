@@ -13,6 +13,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from log_archive import day_log_files, load_day_entries
+
 
 # ============================================================================
 # CONFIGURATION
@@ -491,9 +493,10 @@ def calculate_completion_rate(date: str = "today") -> Dict:
     if date == "today":
         date = datetime.now().strftime("%Y-%m-%d")
 
-    log_file = LOGS_PATH / f"{date}.json"
+    # Older days may have been compacted by log_archive.py
+    log_files = day_log_files(date, LOGS_PATH)
 
-    if not log_file.exists():
+    if not log_files:
         return {
             'total_processed': 0,
             'completed': 0,
@@ -505,8 +508,7 @@ def calculate_completion_rate(date: str = "today") -> Dict:
         }
 
     try:
-        with open(log_file, "r", encoding="utf-8") as f:
-            logs = json.load(f)
+        logs = load_day_entries(log_files)
     except:
         return {
             'total_processed': 0,
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Log Archiver - Implementation
+Compacts closed days of Logs/YYYY-MM-DD.json into compressed columnar
+archives and reads them back transparently.
+
+Archives live in Logs/archive/YYYY-MM-DD.json.gz: gzip-compressed JSON with
+one column per log field. Low-cardinality columns (action, source,
+destination, file) are dictionary-encoded, and each entry's key order is
+kept as a dictionary-encoded "shape", so a day round-trips exactly.
+
+Readers should locate a day with day_log_files() and read it with
+load_day_entries(). A day can have both files when entries were written
+after it was archived; readers see the archived entries followed by the
+plain ones, exactly as the next archive run will merge them.
+
+Version: 1.0.0
+Author: AI Employee System
+"""
+
+import os
+import gzip
+import json
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+VAULT_PATH = Path("./AI_Employee_Vault")
+LOGS_PATH = VAULT_PATH / "Logs"
+ARCHIVE_DIR_NAME = "archive"
+ARCHIVE_SUFFIX = ".json.gz"
+
+ARCHIVE_FORMAT = "ai-employee-log-archive"
+ARCHIVE_VERSION = 1
+
+# Columns stored as a value dictionary plus integer codes
+DICTIONARY_COLUMNS = ("action", "source", "destination", "file")
+
+# Days newer than this stay as plain JSON (today is never archived)
+DEFAULT_KEEP_DAYS = 7
+
+
+# ============================================================================
+# LOCATING DAY LOGS
+# ============================================================================
+
+def archive_path(date_str: str, logs_path: Path = LOGS_PATH) -> Path:
+    """Path of the archive for a day (Logs/archive/YYYY-MM-DD.json.gz)."""
+    return logs_path / ARCHIVE_DIR_NAME / f"{date_str}{ARCHIVE_SUFFIX}"
+
+
+def is_archive(log_file: Path) -> bool:
+    """Whether a day log path is an archive rather than plain JSON."""
+    return log_file.name.endswith(ARCHIVE_SUFFIX)
+
+
+def day_log_files(date_str: str, logs_path: Path = LOGS_PATH) -> List[Path]:
+    """
+    Locate the files holding a day's log.
+
+    Both exist when entries were written after the day was archived (the
+    next archive run merges them).
+
+    Args:
+        date_str: Day as YYYY-MM-DD
+        logs_path: Logs folder
+
+    Returns:
+        The day's archive and/or plain JSON file, archive first (empty if
+        the day has no log)
+    """
+    candidates = (archive_path(date_str, logs_path), logs_path / f"{date_str}.json")
+    return [log_file for log_file in candidates if log_file.exists()]
+
+
+def merge_day_entries(archived: List[Dict], entries: Iterable) -> Iterator:
+    """
+    Combine a day's archived entries with those in its plain file.
+
+    Plain entries follow the archived ones, unless the plain file already
+    starts with them (e.g. after an interrupted archive run).
+
+    Args:
+        archived: Entries read from the archive
+        entries: Entries from the plain file, in order (may be a stream)
+
+    Yields:
+        The day's entries, in order
+    """
+    entries = iter(entries)
+    head = list(islice(entries, len(archived)))
+
+    if head != archived:
+        yield from archived
+    yield from head
+    yield from entries
+
+
+# ============================================================================
+# COLUMNAR ENCODING
+# ============================================================================
+
+def _dictionary_key(value: Any):
+    """Hashable key for dictionary encoding (keeps True and 1 apart)."""
+    return (type(value).__name__, value)
+
+
+def encode_entries(entries: List[Dict], date_str: str) -> Dict:
+    """
+    Encode a day's log entries into the columnar archive layout.
+
+    Args:
+        entries: Log entries (JSON objects)
+        date_str: Day the entries belong to
+
+    Returns:
+        Archive document (JSON-serializable)
+
+    Raises:
+        ValueError: If an entry is not a JSON object
+    """
+    shapes = []
+    shape_codes = {}
+    entry_shapes = []
+    columns = {}
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Log entry is not an object: {entry!r}")
+
+        keys = tuple(entry)
+        code = shape_codes.get(keys)
+        if code is None:
+            code = shape_codes[keys] = len(shapes)
+            shapes.append(list(keys))
+        entry_shapes.append(code)
+
+        for key, value in entry.items():
+            columns.setdefault(key, []).append(value)
+
+    encoded_columns = {}
+    for key, values in columns.items():
+        encoded_columns[key] = {"values": values}
+
+        if key in DICTIONARY_COLUMNS:
+            dictionary = []
+            index = {}
+            codes = []
+            try:
+                for value in values:
+                    value_key = _dictionary_key(value)
+                    value_code = index.get(value_key)
+                    if value_code is None:
+                        value_code = index[value_key] = len(dictionary)
+                        dictionary.append(value)
+                    codes.append(value_code)
+            except TypeError:
+                continue  # Unhashable values (nested objects): keep plain
+            encoded_columns[key] = {"dictionary": dictionary, "codes": codes}
+
+    return {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "date": date_str,
+        "count": len(entries),
+        "shapes": shapes,
+        "shape": entry_shapes,
+        "columns": encoded_columns
+    }
+
+
+def decode_entries(archive: Dict) -> Iterator[Dict]:
+    """
+    Rebuild log entries from an archive document, in original order.
+
+    Raises:
+        ValueError: If the document is not a supported archive
+    """
+    if not isinstance(archive, dict) or archive.get("format") != ARCHIVE_FORMAT:
+        raise ValueError("Not a log archive")
+    if archive.get("version") != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported log archive version: {archive.get('version')}")
+
+    columns = {}
+    for key, column in archive["columns"].items():
+        if "codes" in column:
+            dictionary = column["dictionary"]
+            columns[key] = iter([dictionary[code] for code in column["codes"]])
+        else:
+            columns[key] = iter(column["values"])
+
+    shapes = archive["shapes"]
+    for code in archive["shape"]:
+        yield {key: next(columns[key]) for key in shapes[code]}
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+def read_archive(archive_file: Path) -> Iterator[Dict]:
+    """
+    Stream the entries of an archived day.
+
+    The day's columns are decompressed together; entries are rebuilt one at
+    a time.
+
+    Raises:
+        ValueError: If the file is not a valid archive
+        OSError: If the file can't be read
+    """
+    try:
+        with gzip.open(archive_file, "rt", encoding="utf-8") as f:
+            archive = json.load(f)
+    except (EOFError, gzip.BadGzipFile) as e:
+        raise ValueError(f"Corrupt log archive {archive_file}: {e}")
+
+    return decode_entries(archive)
+
+
+def load_log_entries(log_file: Path) -> Any:
+    """
+    Load a day log file, plain JSON or archived.
+
+    Returns:
+        Parsed plain JSON (normally a list of entries) or the archived entries
+
+    Raises:
+        ValueError: If the file can't be parsed
+        OSError: If the file can't be read
+    """
+    if is_archive(log_file):
+        return list(read_archive(log_file))
+
+    with open(log_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_day_entries(log_files: List[Path]) -> List:
+    """
+    Load a day's entries from the files returned by day_log_files().
+
+    Returns:
+        Archived entries followed by any written after archiving
+
+    Raises:
+        ValueError: If a file can't be parsed
+        OSError: If a file can't be read
+    """
+    if len(log_files) == 1:
+        return load_log_entries(log_files[0])
+
+    archived = list(read_archive(log_files[0]))
+    entries = load_log_entries(log_files[1])
+    if not isinstance(entries, list):
+        raise ValueError(f"{log_files[1].name} is not a JSON array")
+
+    return list(merge_day_entries(archived, entries))
+
+
+# ============================================================================
+# ARCHIVING
+# ============================================================================
+
+def write_archive(entries: List[Dict], date_str: str, logs_path: Path = LOGS_PATH) -> Path:
+    """
+    Write a day's entries to its archive atomically.
+
+    Returns:
+        Archive path
+    """
+    target = archive_path(date_str, logs_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    document = encode_entries(entries, date_str)
+    tmp_file = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with gzip.open(tmp_file, "wt", encoding="utf-8", compresslevel=9) as f:
+            json.dump(document, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_file, target)
+    except BaseException:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+        raise
+
+    return target
+
+
+def archive_day(date_str: str, logs_path: Path = LOGS_PATH, dry_run: bool = False) -> Optional[Dict]:
+    """
+    Archive one closed day and remove its plain JSON file.
+
+    If the day was already archived, entries in the plain file are appended
+    to the archived ones (unless the plain file already contains them, e.g.
+    after an interrupted run). The archive is read back and compared before
+    the plain file is deleted.
+
+    Args:
+        date_str: Day as YYYY-MM-DD
+        logs_path: Logs folder
+        dry_run: Report what would happen without writing
+
+    Returns:
+        {'date', 'entries', 'original_bytes', 'archived_bytes'}, or None if
+        the day has no plain log
+
+    Raises:
+        ValueError: If the day's log is malformed or fails verification
+    """
+    log_file = logs_path / f"{date_str}.json"
+    if not log_file.exists():
+        return None
+
+    original_bytes = log_file.stat().st_size
+    with open(log_file, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{log_file.name} is not a JSON array")
+
+    existing = archive_path(date_str, logs_path)
+    if existing.exists():
+        entries = list(merge_day_entries(list(read_archive(existing)), entries))
+
+    if dry_run:
+        document = json.dumps(encode_entries(entries, date_str), ensure_ascii=False, separators=(",", ":"))
+        archived_bytes = len(gzip.compress(document.encode("utf-8"), compresslevel=9))
+    else:
+        target = write_archive(entries, date_str, logs_path)
+        if list(read_archive(target)) != entries:
+            raise ValueError(f"Archive verification failed for {date_str}")
+        archived_bytes = target.stat().st_size
+        log_file.unlink()
+
+    return {
+        "date": date_str,
+        "entries": len(entries),
+        "original_bytes": original_bytes,
+        "archived_bytes": archived_bytes
+    }
+
+
+def closed_days(keep_days: int = DEFAULT_KEEP_DAYS, logs_path: Path = LOGS_PATH) -> List[str]:
+    """
+    List plain day logs old enough to archive, oldest first.
+
+    Args:
+        keep_days: Most recent days to leave as plain JSON (at least 1, so
+            today's file is never touched)
+        logs_path: Logs folder
+    """
+    cutoff = (datetime.now() - timedelta(days=max(keep_days, 1) - 1)).strftime("%Y-%m-%d")
+
+    days = []
+    for log_file in logs_path.glob("????-??-??.json"):
+        date_str = log_file.stem
+        try:
+            datetime.strptime(date_str, "%Y-%m-%d")
+        except ValueError:
+            continue
+        if date_str < cutoff:
+            days.append(date_str)
+
+    return sorted(days)
+
+
+def archive_closed_days(keep_days: int = DEFAULT_KEEP_DAYS, logs_path: Path = LOGS_PATH,
+                        dry_run: bool = False) -> Dict:
+    """
+    Archive every closed day older than keep_days.
+
+    Returns:
+        {
+            'archived': list,  # archive_day results
+            'skipped': list,  # {'date', 'error'} for days left untouched
+            'original_bytes': int,
+            'archived_bytes': int
+        }
+    """
+    archived = []
+    skipped = []
+
+    for date_str in closed_days(keep_days, logs_path):
+        try:
+            result = archive_day(date_str, logs_path, dry_run=dry_run)
+        except (OSError, ValueError) as e:
+            skipped.append({"date": date_str, "error": str(e)})
+            continue
+        if result:
+            archived.append(result)
+
+    return {
+        "archived": archived,
+        "skipped": skipped,
+        "original_bytes": sum(r["original_bytes"] for r in archived),
+        "archived_bytes": sum(r["archived_bytes"] for r in archived)
+    }
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Archive closed days of Logs/ into compressed columnar files")
+    parser.add_argument('--keep-days', type=int, default=DEFAULT_KEEP_DAYS,
+                        help=f'Recent days to keep as plain JSON (default: {DEFAULT_KEEP_DAYS})')
+    parser.add_argument('--dry-run', action='store_true', help='Report savings without writing')
+
+    args = parser.parse_args()
+
+    if args.dry_run:
+        print("DRY RUN MODE - No files will be changed\n")
+
+    summary = archive_closed_days(keep_days=args.keep_days, dry_run=args.dry_run)
+
+    for result in summary['archived']:
+        ratio = result['original_bytes'] / max(result['archived_bytes'], 1)
+        print(f"[OK] {result['date']}: {result['entries']} entries, "
+              f"{result['original_bytes']:,} -> {result['archived_bytes']:,} bytes ({ratio:.1f}x)")
+
+    for skipped in summary['skipped']:
+        print(f"[SKIP] {skipped['date']}: {skipped['error']}")
+
+    if summary['archived']:
+        ratio = summary['original_bytes'] / max(summary['archived_bytes'], 1)
+        print(f"\nArchived {len(summary['archived'])} days: "
+              f"{summary['original_bytes']:,} -> {summary['archived_bytes']:,} bytes ({ratio:.1f}x smaller)")
+    else:
+        print("No closed days to archive")
+
+    sys.exit(1 if summary['skipped'] else 0)
@@ -7,18 +7,23 @@ centralized logging, and a real-time status dashboard.
 
 Features:
 - Start/stop all watchers with one command
-- Monitor health and auto-restart on crashes
-- Aggregate logs from all watchers
-- Real-time terminal dashboard
+- Monitor health and auto-restart on crashes or stale heartbeats
+- Aggregate logs from all watchers (batched appends to the daily log)
+- Real-time terminal dashboard with per-watcher memory, CPU, fd and I/O usage
+  (redrawn only when something changes; headless mode for services)
+- Soft resource limits per watcher (restart or throttle when exceeded)
 - Graceful shutdown (Ctrl+C)
 - Configuration file for enabling/disabling watchers
-- Process isolation with multiprocessing
+- Hot reload of the configuration (SIGHUP or file change) without
+  restarting unaffected watchers
+- Watchers run as asyncio subprocesses supervised from a single event loop
 
 Usage:
     python scripts/watcher_manager.py                  # Start all enabled watchers
     python scripts/watcher_manager.py --status         # Show status only
     python scripts/watcher_manager.py --stop           # Stop all watchers
     python scripts/watcher_manager.py --config         # Show configuration
+    python scripts/watcher_manager.py --headless       # No dashboard (systemd)
 
 Version: 1.0.0
 Author: AI Employee System
@@ -29,14 +34,14 @@ import sys
 import time
 import json
 import signal
+import asyncio
 import argparse
-import subprocess
-import multiprocessing as mp
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
-from queue import Queue, Empty
+from collections import deque
+from itertools import islice
 from threading import Thread
 
 # Try to import rich for beautiful terminal output
@@ -65,6 +70,38 @@ LOGS_PATH = VAULT_PATH / "Logs"
 CONFIG_FILE = PROJECT_ROOT / "config" / "watcher_config.json"
 PID_FILE = PROJECT_ROOT / ".watcher_manager.pid"
 
+# Longest single output line accepted from a watcher (asyncio stream limit)
+MAX_LINE_BYTES = 1024 * 1024
+
+# Aggregated log sink: flush after this many entries or seconds, whichever
+# comes first; entries beyond LOG_MAX_PENDING are dropped and counted
+LOG_QUEUE_SIZE = 1000
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 1.0
+LOG_MAX_PENDING = 10000
+
+# Heartbeat protocol: watchers write one JSON object per line to the fd named
+# in WATCHER_HEARTBEAT_FD, e.g. {"processed": 12, "errors": 0, "next_within": 30}.
+# A watcher is restarted if no heartbeat arrives within next_within plus grace.
+HEARTBEAT_ENV = "WATCHER_HEARTBEAT_FD"
+HEARTBEAT_GRACE = 10  # seconds
+THROUGHPUT_WINDOW = 300  # seconds of heartbeats used for the rate
+
+# Resource limits: consecutive over-limit samples before acting, and the
+# nice value applied when a watcher is throttled for CPU
+LIMIT_GRACE_SAMPLES = 3
+THROTTLE_NICE = 19
+MIN_CPU_WINDOW = 0.25  # seconds
+
+# Dashboard redraws on state changes (status, pid, restarts, counters, limit
+# breaches); time-based and sampled cells (uptime, heartbeat age, resources,
+# rate) alone only refresh it this often
+DASHBOARD_STALE_INTERVAL = 15.0  # seconds
+
+# Watcher settings that only take effect by relaunching the process; all
+# other watcher settings are applied to the running watcher on reload
+RESTART_KEYS = {"script"}
+
 # Default configuration
 DEFAULT_CONFIG = {
     "watchers": {
@@ -75,7 +112,13 @@ DEFAULT_CONFIG = {
             "restart_on_crash": True,
             "max_restarts": 5,
             "restart_delay": 10,
-            "health_check_interval": 30
+            "health_check_interval": 30,
+            "limits": {
+                "max_rss_mb": 200,
+                "max_cpu_percent": 40,
+                "max_open_fds": 256,
+                "cpu_action": "throttle"
+            }
         },
         "gmail_watcher": {
             "enabled": True,
@@ -84,7 +127,13 @@ DEFAULT_CONFIG = {
             "restart_on_crash": True,
             "max_restarts": 5,
             "restart_delay": 10,
-            "health_check_interval": 30
+            "health_check_interval": 30,
+            "limits": {
+                "max_rss_mb": 200,
+                "max_cpu_percent": 40,
+                "max_open_fds": 256,
+                "cpu_action": "throttle"
+            }
         },
         "linkedin_watcher": {
             "enabled": False,
@@ -93,14 +142,22 @@ DEFAULT_CONFIG = {
             "restart_on_crash": True,
             "max_restarts": 5,
             "restart_delay": 10,
-            "health_check_interval": 30
+            "health_check_interval": 30,
+            "limits": {
+                "max_rss_mb": 200,
+                "max_cpu_percent": 40,
+                "max_open_fds": 256,
+                "cpu_action": "throttle"
+            }
         }
     },
     "manager": {
         "log_aggregation": True,
         "status_update_interval": 2,
         "max_log_lines": 100,
-        "dashboard_refresh_rate": 1.0
+        "dashboard_refresh_rate": 1.0,
+        "log_batch_size": LOG_BATCH_SIZE,
+        "log_flush_interval": LOG_FLUSH_INTERVAL
     }
 }
 
@@ -122,6 +179,15 @@ class WatcherStatus:
     last_heartbeat: Optional[datetime] = None
     processed_count: int = 0
     error_count: int = 0
+    dropped_logs: int = 0
+    reported_errors: int = 0
+    throughput: float = 0.0  # items per minute, from heartbeats
+    rss_bytes: int = 0
+    cpu_percent: float = 0.0
+    open_fds: int = 0
+    io_read_bytes: int = 0
+    io_write_bytes: int = 0
+    throttled: bool = False
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -133,6 +199,197 @@ class WatcherStatus:
         return data
 
 
+# ============================================================================
+# LOG SINK
+# ============================================================================
+
+class LogSink:
+    """
+    Batched writer for the aggregated daily log.
+
+    Entries are buffered and appended to Logs/YYYY-MM-DD.json in one write
+    per flush. The file stays a JSON array: each flush rewrites only the
+    closing bracket, so the cost is proportional to the batch rather than
+    the size of the day's log.
+    """
+
+    def __init__(
+        self,
+        logs_path: Path,
+        batch_size: int = LOG_BATCH_SIZE,
+        max_pending: int = LOG_MAX_PENDING
+    ):
+        """
+        Initialize log sink.
+
+        Args:
+            logs_path: Directory holding the daily log files
+            batch_size: Pending entries that trigger an immediate flush
+            max_pending: Cap on buffered entries; extras are dropped
+        """
+        self.logs_path = logs_path
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.pending: deque = deque()
+        self.dropped = 0
+        self.written = 0
+        self._reported_drops = 0
+
+    def add(self, entries: List[Dict]):
+        """Buffer entries, dropping (and counting) any beyond max_pending."""
+        room = self.max_pending - len(self.pending)
+        if room < len(entries):
+            self.dropped += len(entries) - max(room, 0)
+            entries = entries[:max(room, 0)]
+        self.pending.extend(entries)
+
+    def is_full(self) -> bool:
+        """Check if enough entries are buffered to flush now."""
+        return len(self.pending) >= self.batch_size
+
+    def flush(self) -> int:
+        """
+        Append all buffered entries to their daily log files.
+
+        Returns:
+            Number of entries written
+        """
+        if self.dropped > self._reported_drops:
+            self.pending.append({
+                "timestamp": datetime.now().isoformat(),
+                "watcher": "watcher_manager",
+                "level": "warning",
+                "message": f"Log sink dropped {self.dropped - self._reported_drops} entries"
+            })
+            self._reported_drops = self.dropped
+
+        if not self.pending:
+            return 0
+
+        by_day: Dict[str, List[Dict]] = {}
+        for entry in self.pending:
+            by_day.setdefault(entry['timestamp'][:10], []).append(entry)
+
+        written = 0
+        for day, entries in by_day.items():
+            try:
+                self._append_entries(self.logs_path / f"{day}.json", entries)
+                written += len(entries)
+            except Exception as e:
+                print(f"[ERROR] Failed to write log: {e}")
+                self.dropped += len(entries)
+                self._reported_drops += len(entries)
+
+        self.pending.clear()
+        self.written += written
+        return written
+
+    @staticmethod
+    def _append_entries(log_file: Path, entries: List[Dict]):
+        """
+        Append entries to a JSON array file in place.
+
+        Output matches json.dump(..., indent=2) of the whole array. Falls back
+        to a full rewrite if the file does not end with a JSON array.
+
+        Args:
+            log_file: Daily log file
+            entries: Entries to append
+        """
+        body = ",\n".join(
+            "  " + json.dumps(entry, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+            for entry in entries
+        ).encode('utf-8')
+
+        if not log_file.exists() or log_file.stat().st_size == 0:
+            with open(log_file, 'wb') as f:
+                f.write(b"[\n" + body + b"\n]")
+            return
+
+        with open(log_file, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            tail_start = max(0, size - 4096)
+            f.seek(tail_start)
+            tail = f.read()
+
+            stripped = tail.rstrip()
+            if stripped.endswith(b"]"):
+                before = stripped[:-1].rstrip()
+                if before:
+                    f.seek(tail_start + len(before))
+                    f.truncate()
+                    separator = b"\n" if before.endswith(b"[") else b",\n"
+                    f.write(separator + body + b"\n]")
+                    return
+
+        # Not a well-formed array tail: rewrite the whole file
+        logs = []
+        try:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                logs = json.load(f)
+        except (OSError, ValueError):
+            logs = []
+        if not isinstance(logs, list):
+            logs = []
+
+        logs.extend(entries)
+        with open(log_file, 'w', encoding='utf-8') as f:
+            json.dump(logs, f, indent=2, ensure_ascii=False)
+
+
+# ============================================================================
+# RESOURCE ACCOUNTING
+# ============================================================================
+
+@dataclass
+class ResourceUsage:
+    """Point-in-time resource usage of a process, read from /proc."""
+    rss_bytes: int
+    cpu_seconds: float
+    open_fds: int
+    read_bytes: int = 0
+    write_bytes: int = 0
+
+
+def read_proc_usage(pid: int) -> Optional[ResourceUsage]:
+    """
+    Sample a process's resource usage from /proc.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        ResourceUsage, or None if /proc is unavailable or the process is gone
+    """
+    proc = Path("/proc") / str(pid)
+    try:
+        with open(proc / "stat", 'r') as f:
+            # Fields after the parenthesized command name start at field 3
+            fields = f.read().rsplit(')', 1)[1].split()
+        ticks = os.sysconf('SC_CLK_TCK')
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / ticks
+        rss_bytes = int(fields[21]) * os.sysconf('SC_PAGE_SIZE')
+        open_fds = len(os.listdir(proc / "fd"))
+    except (OSError, IndexError, ValueError):
+        return None
+
+    usage = ResourceUsage(rss_bytes=rss_bytes, cpu_seconds=cpu_seconds, open_fds=open_fds)
+
+    # I/O counters may be restricted; usage is still useful without them
+    try:
+        with open(proc / "io", 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key == 'read_bytes':
+                    usage.read_bytes = int(value)
+                elif key == 'write_bytes':
+                    usage.write_bytes = int(value)
+    except (OSError, ValueError):
+        pass
+
+    return usage
+
+
 # ============================================================================
 # WATCHER PROCESS WRAPPER
 # ============================================================================
@@ -140,7 +397,13 @@ class WatcherStatus:
 class WatcherProcess:
     """Wrapper for a watcher process with health monitoring."""
 
-    def __init__(self, name: str, config: Dict, log_queue: mp.Queue):
+    def __init__(
+        self,
+        name: str,
+        config: Dict,
+        log_queue: asyncio.Queue,
+        on_exit: Optional[Callable[['WatcherProcess'], None]] = None
+    ):
         """
         Initialize watcher process.
 
@@ -148,23 +411,38 @@ class WatcherProcess:
             name: Watcher name
             config: Watcher configuration
             log_queue: Queue for aggregated logging
+            on_exit: Called from the event loop when the child exits
         """
         self.name = name
         self.config = config
         self.log_queue = log_queue
-        self.process: Optional[mp.Process] = None
+        self.on_exit = on_exit
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.status = WatcherStatus(name=name)
         self.start_time: Optional[datetime] = None
-        self.should_stop = mp.Event()
+        self._tasks: List[asyncio.Task] = []
 
-    def start(self) -> bool:
+        # Heartbeat state per source; empty until the watcher sends one
+        self._deadlines: Dict[str, float] = {}
+        self._counters: Dict[str, Tuple[int, int]] = {}
+        self._throughput_samples: deque = deque()
+
+        # Resource sampling state
+        self._cpu_sample: Optional[Tuple[float, float]] = None
+        self._limit_strikes = 0
+        self._cpu_strikes = 0
+
+    async def start(self) -> bool:
         """
-        Start the watcher process.
+        Start the watcher as an asyncio subprocess.
+
+        stdout/stderr are read by tasks on the event loop and exit is detected
+        by awaiting the child, so no helper process or polling is needed.
 
         Returns:
             True if started successfully, False otherwise
         """
-        if self.process and self.process.is_alive():
+        if self.is_alive():
             self.log("warning", "Already running")
             return False
 
@@ -179,19 +457,48 @@ class WatcherProcess:
             self.status.status = "starting"
             self.start_time = datetime.now()
 
-            # Create process
-            self.process = mp.Process(
-                target=self._run_watcher,
-                args=(script_path,),
-                name=f"watcher_{self.name}",
-                daemon=True
-            )
+            # Unbuffered so lines reach the manager as they are printed
+            env = dict(os.environ, PYTHONUNBUFFERED="1")
+            self._reset_heartbeat()
+            self._reset_resources()
+
+            # Heartbeat pipe (fd passing is not available on Windows)
+            hb_read = hb_write = None
+            if os.name != 'nt':
+                hb_read, hb_write = os.pipe()
+                env[HEARTBEAT_ENV] = str(hb_write)
+
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    sys.executable, str(script_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(PROJECT_ROOT),
+                    env=env,
+                    limit=MAX_LINE_BYTES,
+                    pass_fds=(hb_write,) if hb_write is not None else ()
+                )
+            except Exception:
+                if hb_read is not None:
+                    os.close(hb_read)
+                raise
+            finally:
+                # Only the child keeps the write end, so EOF follows its exit
+                if hb_write is not None:
+                    os.close(hb_write)
 
-            self.process.start()
             self.status.pid = self.process.pid
             self.status.status = "running"
             self.status.last_heartbeat = datetime.now()
 
+            self._tasks = [
+                asyncio.create_task(self._read_stream(self.process.stdout, "info")),
+                asyncio.create_task(self._read_stream(self.process.stderr, "error")),
+                asyncio.create_task(self._wait_exit(self.process)),
+            ]
+            if hb_read is not None:
+                self._tasks.append(asyncio.create_task(self._read_heartbeats(hb_read)))
+
             self.log("info", f"Started with PID {self.process.pid}")
             return True
 
@@ -201,60 +508,230 @@ class WatcherProcess:
             self.status.last_error = str(e)
             return False
 
-    def _run_watcher(self, script_path: Path):
+    async def _read_stream(self, stream: asyncio.StreamReader, level: str):
         """
-        Run the watcher script as a subprocess.
+        Forward lines from a child stream to the aggregated log.
 
         Args:
-            script_path: Path to watcher script
+            stream: Child stdout or stderr
+            level: Log level for lines from this stream
         """
-        try:
-            # Run the watcher script
-            process = subprocess.Popen(
-                [sys.executable, str(script_path)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                cwd=str(PROJECT_ROOT)
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Line longer than MAX_LINE_BYTES; the stream skips past it
+                self.log("warning", "Dropped oversized output line")
+                continue
+
+            if not line:
+                break
+
+            # Awaiting a full queue pushes back on the child's pipe instead of dropping
+            await self.log_queue.put(
+                self._log_entry(level, line.decode('utf-8', errors='replace').strip())
             )
+            if level == "error":
+                self.status.error_count += 1
+            elif not self._deadlines:
+                # Output counts as liveness only for watchers without heartbeats
+                self.status.last_heartbeat = datetime.now()
 
-            # Monitor output
-            while not self.should_stop.is_set():
-                # Check if process ended
-                if process.poll() is not None:
-                    break
+    async def _read_heartbeats(self, fd: int):
+        """
+        Read JSON heartbeats from the watcher's heartbeat pipe.
+
+        Args:
+            fd: Read end of the heartbeat pipe
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(fd, 'rb', 0)
+        )
 
-                # Read stdout
-                line = process.stdout.readline()
-                if line:
-                    self.log("info", line.strip())
-                    self.status.last_heartbeat = datetime.now()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    continue
+                if not line:
+                    break
 
-                # Check stderr
                 try:
-                    # Non-blocking read
-                    import select
-                    if select.select([process.stderr], [], [], 0)[0]:
-                        err_line = process.stderr.readline()
-                        if err_line:
-                            self.log("error", err_line.strip())
-                            self.status.error_count += 1
-                except:
-                    pass
-
-                time.sleep(0.1)
-
-            # Process ended or stopped
-            if process.poll() is None:
-                process.terminate()
-                process.wait(timeout=5)
+                    beat = json.loads(line)
+                except ValueError:
+                    self.log("warning", "Malformed heartbeat ignored")
+                    continue
+                if isinstance(beat, dict):
+                    self.record_heartbeat(beat)
+        finally:
+            transport.close()
+
+    def record_heartbeat(self, beat: Dict):
+        """
+        Apply a heartbeat: extend the liveness deadline and update counters.
 
-        except Exception as e:
-            self.log("error", f"Watcher crashed: {e}")
-            self.status.last_error = str(e)
+        Watchers that run several workers (e.g. one per account) tag beats
+        with "source"; each source has its own deadline and counters are
+        summed across sources.
 
-    def stop(self, timeout: int = 10) -> bool:
+        Args:
+            beat: Decoded heartbeat message
+        """
+        now = time.monotonic()
+        interval = self.config.get('health_check_interval', 30)
+        grace = self.config.get('heartbeat_grace', HEARTBEAT_GRACE)
+        try:
+            next_within = float(beat.get('next_within', interval))
+            processed = int(beat.get('processed', 0))
+            errors = int(beat.get('errors', 0))
+        except (TypeError, ValueError):
+            self.log("warning", "Malformed heartbeat ignored")
+            return
+
+        source = str(beat.get('source', ''))
+        self._deadlines[source] = now + next_within + grace
+        self.status.last_heartbeat = datetime.now()
+
+        self._counters[source] = (processed, errors)
+        self.status.processed_count = sum(p for p, _ in self._counters.values())
+        self.status.reported_errors = sum(e for _, e in self._counters.values())
+
+        # Rate over the last THROUGHPUT_WINDOW seconds
+        samples = self._throughput_samples
+        samples.append((now, self.status.processed_count))
+        while len(samples) > 2 and now - samples[1][0] >= THROUGHPUT_WINDOW:
+            samples.popleft()
+        span = now - samples[0][0]
+        if span > 0:
+            self.status.throughput = (self.status.processed_count - samples[0][1]) / span * 60
+
+    def _reset_heartbeat(self):
+        """Forget heartbeat state from a previous run of the watcher."""
+        self._deadlines = {}
+        self._counters = {}
+        self._throughput_samples.clear()
+        self.status.processed_count = 0
+        self.status.reported_errors = 0
+        self.status.throughput = 0.0
+
+    def sample_resources(self):
+        """Update memory, CPU, fd and I/O usage from /proc."""
+        if not self.is_alive():
+            return
+
+        usage = read_proc_usage(self.process.pid)
+        if usage is None:
+            return
+
+        # CPU time has clock-tick resolution; skip windows too short to measure
+        now = time.monotonic()
+        if self._cpu_sample is None:
+            self._cpu_sample = (now, usage.cpu_seconds)
+        elif now - self._cpu_sample[0] >= MIN_CPU_WINDOW:
+            sampled_at, cpu_seconds = self._cpu_sample
+            self.status.cpu_percent = (usage.cpu_seconds - cpu_seconds) / (now - sampled_at) * 100
+            self._cpu_sample = (now, usage.cpu_seconds)
+
+        self.status.rss_bytes = usage.rss_bytes
+        self.status.open_fds = usage.open_fds
+        self.status.io_read_bytes = usage.read_bytes
+        self.status.io_write_bytes = usage.write_bytes
+
+    def _reset_resources(self):
+        """Forget resource samples from a previous run of the watcher."""
+        self._cpu_sample = None
+        self._limit_strikes = 0
+        self._cpu_strikes = 0
+        self.status.rss_bytes = 0
+        self.status.cpu_percent = 0.0
+        self.status.open_fds = 0
+        self.status.io_read_bytes = 0
+        self.status.io_write_bytes = 0
+        self.status.throttled = False
+
+    def over_limit(self) -> Optional[str]:
+        """
+        Check the latest sample against the watcher's soft limits.
+
+        Limits must be exceeded for LIMIT_GRACE_SAMPLES consecutive samples.
+        Memory and fd overuse need a restart; CPU overuse lowers the
+        watcher's scheduling priority instead unless cpu_action is "restart".
+
+        Returns:
+            Reason for a restart, or None
+        """
+        limits = self.config.get('limits', {})
+        grace = limits.get('grace_samples', LIMIT_GRACE_SAMPLES)
+        if not limits or self._cpu_sample is None:
+            return None
+
+        breaches = []
+        max_rss_mb = limits.get('max_rss_mb')
+        if max_rss_mb and self.status.rss_bytes > max_rss_mb * 1024 * 1024:
+            breaches.append(f"RSS {self.status.rss_bytes / 1024 / 1024:.0f}MB > {max_rss_mb}MB")
+
+        max_open_fds = limits.get('max_open_fds')
+        if max_open_fds and self.status.open_fds > max_open_fds:
+            breaches.append(f"{self.status.open_fds} open fds > {max_open_fds}")
+
+        max_cpu = limits.get('max_cpu_percent')
+        if max_cpu and self.status.cpu_percent > max_cpu:
+            self._cpu_strikes += 1
+            if limits.get('cpu_action', 'throttle') == 'restart':
+                breaches.append(f"CPU {self.status.cpu_percent:.0f}% > {max_cpu}%")
+            elif self._cpu_strikes >= grace and not self.status.throttled:
+                self.throttle(f"CPU {self.status.cpu_percent:.0f}% > {max_cpu}%")
+        else:
+            self._cpu_strikes = 0
+
+        self._limit_strikes = self._limit_strikes + 1 if breaches else 0
+        if self._limit_strikes >= grace:
+            return ", ".join(breaches)
+        return None
+
+    def throttle(self, reason: str):
+        """
+        Lower the watcher's CPU priority for the rest of its run.
+
+        Args:
+            reason: Why the watcher is being throttled
+        """
+        try:
+            os.setpriority(os.PRIO_PROCESS, self.process.pid, THROTTLE_NICE)
+        except (AttributeError, OSError) as e:
+            self.log("warning", f"Could not throttle ({reason}): {e}")
+            return
+
+        self.status.throttled = True
+        self.log("warning", f"Throttled to nice {THROTTLE_NICE}: {reason}")
+
+    def heartbeat_overdue(self) -> bool:
+        """Check if any heartbeat source of the watcher missed its deadline."""
+        now = time.monotonic()
+        return any(now > deadline for deadline in self._deadlines.values())
+
+    async def _wait_exit(self, process: asyncio.subprocess.Process):
+        """
+        Wait for the child to exit and report unexpected exits immediately.
+
+        Args:
+            process: Child process to wait for
+        """
+        returncode = await process.wait()
+
+        if self.status.status != "stopping":
+            self.status.status = "crashed"
+            self.status.last_error = f"Process exited with code {returncode}"
+            self.log("error", f"Exited unexpectedly (code {returncode})")
+
+        if self.on_exit:
+            self.on_exit(self)
+
+    async def stop(self, timeout: int = 10) -> bool:
         """
         Stop the watcher process gracefully.
 
@@ -264,29 +741,28 @@ class WatcherProcess:
         Returns:
             True if stopped successfully, False otherwise
         """
-        if not self.process or not self.process.is_alive():
+        if not self.is_alive():
+            await self._join_tasks()
             self.status.status = "stopped"
+            self.status.pid = None
             return True
 
         try:
             self.status.status = "stopping"
-            self.should_stop.set()
-
             self.log("info", "Stopping...")
 
-            # Wait for graceful shutdown
-            self.process.join(timeout=timeout)
+            self.process.terminate()
 
-            if self.process.is_alive():
-                # Force terminate
+            # Wait for graceful shutdown
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Force kill
                 self.log("warning", "Forcing termination...")
-                self.process.terminate()
-                self.process.join(timeout=5)
+                self.process.kill()
+                await asyncio.wait_for(self.process.wait(), timeout=5)
 
-                if self.process.is_alive():
-                    # Force kill
-                    self.process.kill()
-                    self.process.join(timeout=2)
+            await self._join_tasks()
 
             self.status.status = "stopped"
             self.status.pid = None
@@ -297,9 +773,15 @@ class WatcherProcess:
             self.log("error", f"Failed to stop: {e}")
             return False
 
+    async def _join_tasks(self):
+        """Wait for the stream reader and exit tasks to finish."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+
     def is_alive(self) -> bool:
         """Check if watcher process is alive."""
-        return self.process is not None and self.process.is_alive()
+        return self.process is not None and self.process.returncode is None
 
     def get_uptime(self) -> float:
         """Get uptime in seconds."""
@@ -318,7 +800,20 @@ class WatcherProcess:
         if not self.is_alive() and self.status.status == "running":
             return True
 
-        # Check for stale heartbeat
+        reason = self.over_limit()
+        if reason:
+            self.log("warning", f"Resource limit exceeded: {reason}")
+            self.status.last_error = f"Resource limit exceeded: {reason}"
+            return True
+
+        # Watchers speaking the heartbeat protocol must meet their own deadline
+        if self._deadlines:
+            if self.heartbeat_overdue():
+                self.log("warning", "Heartbeat overdue - watcher appears hung")
+                return True
+            return False
+
+        # Otherwise fall back to output activity
         if self.status.last_heartbeat:
             age = (datetime.now() - self.status.last_heartbeat).total_seconds()
             if age > self.config.get('health_check_interval', 30) * 3:
@@ -342,18 +837,18 @@ class WatcherProcess:
 
         return True
 
-    def restart(self) -> bool:
+    async def restart(self) -> bool:
         """Restart the watcher process."""
         self.log("info", "Restarting...")
 
         # Stop first
-        self.stop(timeout=5)
+        await self.stop(timeout=5)
 
         # Wait a bit
-        time.sleep(2)
+        await asyncio.sleep(2)
 
         # Start again
-        if self.start():
+        if await self.start():
             self.status.restarts += 1
             self.status.last_restart = datetime.now()
             return True
@@ -369,15 +864,18 @@ class WatcherProcess:
             message: Log message
         """
         try:
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "watcher": self.name,
-                "level": level,
-                "message": message
-            }
-            self.log_queue.put_nowait(log_entry)
-        except:
-            pass  # Queue full or closed
+            self.log_queue.put_nowait(self._log_entry(level, message))
+        except asyncio.QueueFull:
+            self.status.dropped_logs += 1
+
+    def _log_entry(self, level: str, message: str) -> Dict:
+        """Build an aggregated log entry for this watcher."""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "watcher": self.name,
+            "level": level,
+            "message": message
+        }
 
     def update_status(self):
         """Update status information."""
@@ -396,20 +894,38 @@ class WatcherProcess:
 class WatcherManager:
     """Manages all watcher processes."""
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, headless: bool = False):
         """
         Initialize watcher manager.
 
         Args:
             config_path: Path to configuration file
+            headless: Supervise without any dashboard (e.g. under systemd)
         """
         self.config_path = config_path or CONFIG_FILE
         self.config = self.load_config()
+        self._config_mtime = self._get_config_mtime()
+        self._reload_requested = False
         self.watchers: Dict[str, WatcherProcess] = {}
-        self.log_queue = mp.Queue(maxsize=1000)
-        self.log_buffer: List[Dict] = []
+        self.log_queue: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        self.log_buffer: deque = deque(maxlen=self.config['manager'].get('max_log_lines', 100))
+        self.log_sink = LogSink(
+            LOGS_PATH,
+            batch_size=self.config['manager'].get('log_batch_size', LOG_BATCH_SIZE)
+        )
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
         self.running = False
-        self.console = Console() if RICH_AVAILABLE else None
+        self.headless = headless
+        self.console = Console() if RICH_AVAILABLE and not headless else None
+
+        # Dashboard redraw state: watcher state last drawn, when, and
+        # whether new logs arrived since
+        self._drawn_state: Optional[List[Tuple]] = None
+        self._drawn_at = 0.0
+        self._logs_dirty = True
+
+        # Set when a child exits or shutdown is requested, to wake the monitor loop
+        self._wake: Optional[asyncio.Event] = None
 
         # Ensure directories exist
         LOGS_PATH.mkdir(parents=True, exist_ok=True)
@@ -440,6 +956,117 @@ class WatcherManager:
         except Exception as e:
             print(f"[ERROR] Failed to save config: {e}")
 
+    def _get_config_mtime(self) -> Optional[float]:
+        """Get the config file's modification time, if it exists."""
+        try:
+            return self.config_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def request_reload(self):
+        """Ask the monitor loop to reload the configuration (e.g. on SIGHUP)."""
+        self._reload_requested = True
+        if self._wake:
+            self._wake.set()
+
+    async def apply_config_changes(self):
+        """Reload the configuration if requested or if the file changed."""
+        mtime = self._get_config_mtime()
+        if not self._reload_requested and (mtime is None or mtime == self._config_mtime):
+            return
+
+        self._reload_requested = False
+        self._config_mtime = mtime
+        await self.reload_config()
+
+    async def reload_config(self) -> bool:
+        """
+        Reload the configuration and apply only what changed.
+
+        Watchers that were removed or disabled are stopped, new or enabled
+        ones are started, and watchers whose RESTART_KEYS changed are
+        relaunched. Other watcher settings and all manager settings are
+        applied in place, so unaffected watchers keep running.
+
+        Returns:
+            True if the new configuration was applied
+        """
+        try:
+            with open(self.config_path, 'r') as f:
+                new_config = json.load(f)
+            if not isinstance(new_config.get('watchers'), dict) or \
+                    not isinstance(new_config.get('manager'), dict):
+                raise ValueError("'watchers' and 'manager' sections are required")
+            for name, wconfig in new_config['watchers'].items():
+                if wconfig.get('enabled', False) and 'script' not in wconfig:
+                    raise ValueError(f"watcher '{name}' has no script")
+        except Exception as e:
+            self._manager_log("error", f"Config reload failed, keeping current config: {e}")
+            return False
+
+        old_watchers = self.config.get('watchers', {})
+        self.config = new_config
+
+        started, stopped, restarted, updated = [], [], [], []
+        for name in sorted(set(old_watchers) | set(new_config['watchers'])):
+            wconfig = new_config['watchers'].get(name)
+            enabled = bool(wconfig and wconfig.get('enabled', False))
+            watcher = self.watchers.get(name)
+
+            if watcher and not enabled:
+                await watcher.stop()
+                del self.watchers[name]
+                stopped.append(name)
+
+            elif enabled and not watcher:
+                watcher = WatcherProcess(name, wconfig, self.log_queue, on_exit=self._on_watcher_exit)
+                self.watchers[name] = watcher
+                await watcher.start()
+                started.append(name)
+
+            elif watcher and wconfig != watcher.config:
+                if any(wconfig.get(k) != watcher.config.get(k) for k in RESTART_KEYS):
+                    # Fresh status: restart counters belong to the old definition
+                    await watcher.stop()
+                    watcher = WatcherProcess(name, wconfig, self.log_queue, on_exit=self._on_watcher_exit)
+                    self.watchers[name] = watcher
+                    await watcher.start()
+                    restarted.append(name)
+                else:
+                    watcher.config = wconfig
+                    updated.append(name)
+
+        # Manager settings are read from self.config on each use; the log
+        # sink and the log ring buffer keep their own sizes
+        self.log_sink.batch_size = new_config['manager'].get('log_batch_size', LOG_BATCH_SIZE)
+        max_lines = new_config['manager'].get('max_log_lines', 100)
+        if max_lines != self.log_buffer.maxlen:
+            self.log_buffer = deque(self.log_buffer, maxlen=max_lines)
+        self._drawn_state = None
+
+        changes = [
+            f"{label}: {', '.join(names)}"
+            for label, names in (
+                ("started", started), ("stopped", stopped),
+                ("restarted", restarted), ("updated", updated)
+            )
+            if names
+        ]
+        self._manager_log("info", f"Config reloaded ({'; '.join(changes) or 'no watcher changes'})")
+        return True
+
+    def _manager_log(self, level: str, message: str):
+        """Send a manager message to the aggregated log."""
+        try:
+            self.log_queue.put_nowait({
+                "timestamp": datetime.now().isoformat(),
+                "watcher": "watcher_manager",
+                "level": level,
+                "message": message
+            })
+        except asyncio.QueueFull:
+            self.log_sink.dropped += 1
+
     def initialize_watchers(self):
         """Initialize all enabled watchers."""
         watcher_configs = self.config.get('watchers', {})
@@ -448,10 +1075,24 @@ class WatcherManager:
             if not wconfig.get('enabled', False):
                 continue
 
-            watcher = WatcherProcess(name, wconfig, self.log_queue)
+            watcher = WatcherProcess(name, wconfig, self.log_queue, on_exit=self._on_watcher_exit)
             self.watchers[name] = watcher
 
-    def start_all(self) -> int:
+    def _on_watcher_exit(self, watcher: WatcherProcess):
+        """Wake the monitor loop so a crashed watcher is handled without delay."""
+        if self._wake:
+            self._wake.set()
+
+    async def _wait_for_tick(self):
+        """Sleep until the next status update or until woken by an event."""
+        interval = self.config['manager'].get('status_update_interval', 2)
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def start_all(self) -> int:
         """
         Start all enabled watchers.
 
@@ -467,16 +1108,16 @@ class WatcherManager:
         started = 0
         for name, watcher in self.watchers.items():
             print(f"[INFO] Starting {name}...")
-            if watcher.start():
+            if await watcher.start():
                 started += 1
             else:
                 print(f"[ERROR] Failed to start {name}")
 
         return started
 
-    def stop_all(self, timeout: int = 10) -> int:
+    async def stop_all(self, timeout: int = 10) -> int:
         """
-        Stop all running watchers.
+        Stop all running watchers concurrently.
 
         Args:
             timeout: Timeout in seconds per watcher
@@ -484,69 +1125,69 @@ class WatcherManager:
         Returns:
             Number of watchers stopped successfully
         """
-        stopped = 0
+        running = [w for w in self.watchers.values() if w.is_alive()]
+        for watcher in running:
+            print(f"[INFO] Stopping {watcher.name}...")
 
-        for name, watcher in self.watchers.items():
-            if watcher.is_alive():
-                print(f"[INFO] Stopping {name}...")
-                if watcher.stop(timeout=timeout):
-                    stopped += 1
+        results = await asyncio.gather(*(w.stop(timeout=timeout) for w in running))
 
-        return stopped
+        # Let reader tasks of already-exited watchers drain
+        await asyncio.gather(*(w.stop() for w in self.watchers.values() if w not in running))
 
-    def monitor_health(self):
+        return sum(1 for ok in results if ok)
+
+    async def monitor_health(self):
         """Monitor health of all watchers and restart if needed."""
         for name, watcher in self.watchers.items():
             watcher.update_status()
+            watcher.sample_resources()
 
             if watcher.needs_restart():
                 if watcher.can_restart():
                     print(f"\n[WARNING] {name} needs restart - restarting...")
-                    watcher.restart()
+                    await watcher.restart()
                 else:
                     print(f"\n[ERROR] {name} cannot be restarted (max restarts reached)")
 
     def process_logs(self):
-        """Process logs from queue into buffer."""
+        """Drain queued log entries into the buffer and the log sink."""
+        batch = []
         try:
             while True:
-                log_entry = self.log_queue.get_nowait()
-                self.log_buffer.append(log_entry)
-
-                # Keep buffer size limited
-                max_lines = self.config['manager'].get('max_log_lines', 100)
-                if len(self.log_buffer) > max_lines:
-                    self.log_buffer.pop(0)
-
-                # Also write to daily log file
-                self.write_log_to_file(log_entry)
-
-        except Empty:
+                batch.append(self.log_queue.get_nowait())
+        except asyncio.QueueEmpty:
             pass
 
-    def write_log_to_file(self, log_entry: Dict):
-        """Write log entry to daily log file."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        log_file = LOGS_PATH / f"{today}.json"
-
-        # Read existing logs
-        logs = []
-        if log_file.exists():
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-            except:
-                logs = []
-
-        # Append new log
-        logs.append(log_entry)
-
-        # Write back
-        try:
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"[ERROR] Failed to write log: {e}")
+        if batch:
+            self._consume_logs(batch)
+
+    def _consume_logs(self, batch: List[Dict]):
+        """Add a batch of entries to the buffer and schedule a sink flush."""
+        # Ring buffer: the oldest lines fall off as new ones arrive
+        self.log_buffer.extend(batch)
+        self._logs_dirty = True
+
+        # Also write to daily log file, batched by size or time
+        self.log_sink.add(batch)
+        if self.log_sink.is_full():
+            self.flush_logs()
+        elif self._flush_handle is None:
+            interval = self.config['manager'].get('log_flush_interval', LOG_FLUSH_INTERVAL)
+            self._flush_handle = asyncio.get_running_loop().call_later(interval, self.flush_logs)
+
+    def flush_logs(self):
+        """Write buffered log entries to the daily log file."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self.log_sink.flush()
+
+    async def _pump_logs(self):
+        """Consume log entries as watchers produce them."""
+        while True:
+            entry = await self.log_queue.get()
+            self._consume_logs([entry])
+            self.process_logs()
 
     def get_status_summary(self) -> Dict:
         """Get summary of all watcher statuses."""
@@ -556,7 +1197,8 @@ class WatcherManager:
             "stopped": 0,
             "crashed": 0,
             "total_restarts": 0,
-            "total_errors": 0
+            "total_errors": 0,
+            "dropped_logs": self.log_sink.dropped
         }
 
         for watcher in self.watchers.values():
@@ -568,30 +1210,14 @@ class WatcherManager:
                 summary["crashed"] += 1
 
             summary["total_restarts"] += watcher.status.restarts
-            summary["total_errors"] += watcher.status.error_count
+            summary["total_errors"] += watcher.status.error_count + watcher.status.reported_errors
+            summary["dropped_logs"] += watcher.status.dropped_logs
 
         return summary
 
-    def create_dashboard(self) -> Table:
-        """Create rich dashboard table."""
-        if not RICH_AVAILABLE:
-            return None
-
-        table = Table(
-            title="[bold cyan]Watcher Manager Dashboard[/bold cyan]",
-            box=box.ROUNDED,
-            show_header=True,
-            header_style="bold magenta"
-        )
-
-        table.add_column("Watcher", style="cyan", no_wrap=True)
-        table.add_column("Status", justify="center")
-        table.add_column("PID", justify="right", style="yellow")
-        table.add_column("Uptime", justify="right", style="green")
-        table.add_column("Restarts", justify="center", style="blue")
-        table.add_column("Errors", justify="center", style="red")
-        table.add_column("Last Heartbeat", style="dim")
-
+    def dashboard_rows(self) -> List[Tuple[str, ...]]:
+        """Build the dashboard cells for every watcher."""
+        rows = []
         for name, watcher in sorted(self.watchers.items()):
             status = watcher.status
 
@@ -629,25 +1255,63 @@ class WatcherManager:
             else:
                 hb_str = "-"
 
-            table.add_row(
+            rows.append((
                 name,
                 status_text,
                 pid_str,
                 uptime_str,
                 str(status.restarts),
-                str(status.error_count),
+                str(status.error_count + status.reported_errors),
+                str(status.processed_count),
+                f"{status.throughput:.1f}/min",
+                *self.format_resources(watcher),
                 hb_str
-            )
+            ))
+
+        return rows
+
+    def create_dashboard(self, rows: Optional[List[Tuple[str, ...]]] = None) -> Optional['Table']:
+        """Create rich dashboard table."""
+        if not RICH_AVAILABLE:
+            return None
+
+        table = Table(
+            title="[bold cyan]Watcher Manager Dashboard[/bold cyan]",
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold magenta"
+        )
+
+        table.add_column("Watcher", style="cyan", no_wrap=True)
+        table.add_column("Status", justify="center")
+        table.add_column("PID", justify="right", style="yellow")
+        table.add_column("Uptime", justify="right", style="green")
+        table.add_column("Restarts", justify="center", style="blue")
+        table.add_column("Errors", justify="center", style="red")
+        table.add_column("Processed", justify="right")
+        table.add_column("Rate", justify="right")
+        table.add_column("RSS", justify="right")
+        table.add_column("CPU", justify="right")
+        table.add_column("FDs", justify="right")
+        table.add_column("I/O R/W", justify="right", style="dim")
+        table.add_column("Last Heartbeat", style="dim")
+
+        for row in rows if rows is not None else self.dashboard_rows():
+            table.add_row(*row)
 
         return table
 
-    def create_log_panel(self) -> Panel:
+    def recent_logs(self, count: int) -> List[Dict]:
+        """Get the newest log entries from the ring buffer, oldest first."""
+        return list(islice(reversed(self.log_buffer), count))[::-1]
+
+    def create_log_panel(self) -> Optional['Panel']:
         """Create log panel showing recent logs."""
         if not RICH_AVAILABLE:
             return None
 
         # Get last N log entries
-        recent_logs = self.log_buffer[-20:]
+        recent_logs = self.recent_logs(20)
 
         log_lines = []
         for log in recent_logs:
@@ -674,6 +1338,50 @@ class WatcherManager:
             border_style="blue"
         )
 
+    def limit_breaches(self, watcher: WatcherProcess) -> Tuple[bool, bool, bool]:
+        """Whether the last RSS, CPU and fd samples are over the watcher's limits."""
+        status = watcher.status
+        if not watcher.is_alive() or not status.rss_bytes:
+            return (False, False, False)
+
+        limits = watcher.config.get('limits', {})
+
+        def over(value: float, limit: Optional[float]) -> bool:
+            return bool(limit) and value > limit
+
+        return (
+            over(status.rss_bytes / 1024 / 1024, limits.get('max_rss_mb')),
+            over(status.cpu_percent, limits.get('max_cpu_percent')),
+            over(status.open_fds, limits.get('max_open_fds'))
+        )
+
+    def format_resources(self, watcher: WatcherProcess) -> Tuple[str, str, str, str]:
+        """Format RSS, CPU, fd and I/O cells, highlighting values over limits."""
+        status = watcher.status
+        if not watcher.is_alive() or not status.rss_bytes:
+            return ("-", "-", "-", "-")
+
+        def mark(text: str, breached: bool) -> str:
+            return f"[bold red]{text}[/bold red]" if breached else text
+
+        rss_over, cpu_over, fds_over = self.limit_breaches(watcher)
+        rss_mb = status.rss_bytes / 1024 / 1024
+        cpu = f"{status.cpu_percent:.0f}%" + (" (niced)" if status.throttled else "")
+        return (
+            mark(f"{rss_mb:.0f}MB", rss_over),
+            mark(cpu, cpu_over),
+            mark(str(status.open_fds), fds_over),
+            f"{self.format_bytes(status.io_read_bytes)}/{self.format_bytes(status.io_write_bytes)}"
+        )
+
+    def format_bytes(self, count: int) -> str:
+        """Format a byte count in human-readable format."""
+        for unit in ("B", "K", "M", "G"):
+            if count < 1024:
+                return f"{count:.0f}{unit}"
+            count /= 1024
+        return f"{count:.0f}T"
+
     def format_duration(self, seconds: float) -> str:
         """Format duration in human-readable format."""
         if seconds < 60:
@@ -685,40 +1393,113 @@ class WatcherManager:
             minutes = int((seconds % 3600) / 60)
             return f"{hours}h {minutes}m"
 
-    def run_dashboard(self):
+    def dashboard_state(self) -> List[Tuple]:
+        """
+        Get the watcher state behind the dashboard.
+
+        Only discrete fields are included; uptime, heartbeat age, resource
+        samples and rates change every tick and are left out.
+        """
+        return [
+            (
+                name,
+                watcher.status.status,
+                watcher.status.pid,
+                watcher.status.restarts,
+                watcher.status.error_count + watcher.status.reported_errors,
+                watcher.status.processed_count,
+                watcher.status.throttled,
+                self.limit_breaches(watcher)
+            )
+            for name, watcher in sorted(self.watchers.items())
+        ]
+
+    def needs_redraw(self) -> Optional[List[Tuple[str, ...]]]:
+        """
+        Check whether the dashboard shows anything new.
+
+        A redraw is needed when the watcher state changed, new logs arrived,
+        or the time-based cells are DASHBOARD_STALE_INTERVAL old.
+
+        Returns:
+            Current rows if a redraw is needed, otherwise None
+        """
+        stale = time.monotonic() - self._drawn_at >= DASHBOARD_STALE_INTERVAL
+        if not stale and not self._logs_dirty and self.dashboard_state() == self._drawn_state:
+            return None
+        return self.dashboard_rows()
+
+    def _mark_drawn(self):
+        """Remember what was drawn so unchanged ticks are skipped."""
+        self._drawn_state = self.dashboard_state()
+        self._drawn_at = time.monotonic()
+        self._logs_dirty = False
+
+    async def run_dashboard(self):
         """Run live dashboard."""
+        if self.headless:
+            await self.run_headless()
+            return
+
         if not RICH_AVAILABLE:
             print("[WARNING] Rich not available. Using basic monitoring.")
-            self.run_basic_monitoring()
+            await self.run_basic_monitoring()
             return
 
         try:
-            with Live(
-                self.create_dashboard(),
-                refresh_per_second=self.config['manager'].get('dashboard_refresh_rate', 1.0),
-                console=self.console
-            ) as live:
+            # No background refresh: the screen is redrawn only when a tick
+            # changed something, at most dashboard_refresh_rate times a second
+            with Live(self.create_dashboard(), auto_refresh=False, console=self.console) as live:
+                last_draw = 0.0
                 while self.running:
-                    # Process logs
-                    self.process_logs()
+                    # Apply config changes
+                    await self.apply_config_changes()
 
                     # Monitor health
-                    self.monitor_health()
+                    await self.monitor_health()
 
                     # Update dashboard
-                    layout = Layout()
-                    layout.split_column(
-                        Layout(self.create_dashboard(), size=len(self.watchers) + 5),
-                        Layout(self.create_log_panel())
-                    )
-                    live.update(layout)
-
-                    time.sleep(self.config['manager'].get('status_update_interval', 2))
+                    refresh_rate = self.config['manager'].get('dashboard_refresh_rate', 1.0)
+                    rows = self.needs_redraw()
+                    if rows is not None and time.monotonic() - last_draw >= 1 / max(refresh_rate, 0.01):
+                        layout = Layout()
+                        layout.split_column(
+                            Layout(self.create_dashboard(rows), size=len(self.watchers) + 5),
+                            Layout(self.create_log_panel())
+                        )
+                        live.update(layout, refresh=True)
+                        self._mark_drawn()
+                        last_draw = time.monotonic()
+
+                    await self._wait_for_tick()
 
         except KeyboardInterrupt:
             pass
 
-    def run_basic_monitoring(self):
+    async def run_headless(self):
+        """Supervise without a dashboard, printing a line when the summary changes."""
+        print("[INFO] Running headless (no dashboard)")
+
+        last_summary = None
+        while self.running:
+            # Apply config changes
+            await self.apply_config_changes()
+
+            # Monitor health
+            await self.monitor_health()
+
+            summary = self.get_status_summary()
+            if summary != last_summary:
+                print(
+                    f"[INFO] Watchers: {summary['running']}/{summary['total']} running, "
+                    f"{summary['crashed']} crashed, {summary['total_restarts']} restarts, "
+                    f"{summary['total_errors']} errors"
+                )
+                last_summary = summary
+
+            await self._wait_for_tick()
+
+    async def run_basic_monitoring(self):
         """Run basic monitoring without rich."""
         print("\n" + "=" * 70)
         print("Watcher Manager - Basic Monitoring Mode")
@@ -727,13 +1508,19 @@ class WatcherManager:
 
         try:
             while self.running:
-                # Process logs
-                self.process_logs()
+                # Apply config changes
+                await self.apply_config_changes()
 
                 # Monitor health
-                self.monitor_health()
+                await self.monitor_health()
+
+                # Print status only when it changed
+                rows = self.needs_redraw()
+                if rows is None:
+                    await self._wait_for_tick()
+                    continue
+                self._mark_drawn()
 
-                # Print status
                 os.system('cls' if os.name == 'nt' else 'clear')
                 print("\n" + "=" * 70)
                 print(f"Watcher Status - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -747,24 +1534,30 @@ class WatcherManager:
                     print(f"  PID: {status.pid if status.pid else '-'}")
                     print(f"  Uptime: {uptime}")
                     print(f"  Restarts: {status.restarts}")
-                    print(f"  Errors: {status.error_count}")
+                    print(f"  Errors: {status.error_count + status.reported_errors}")
+                    print(f"  Processed: {status.processed_count} ({status.throughput:.1f}/min)")
+                    print(
+                        f"  Resources: {status.rss_bytes / 1024 / 1024:.0f}MB RSS, "
+                        f"{status.cpu_percent:.0f}% CPU{' (niced)' if status.throttled else ''}, "
+                        f"{status.open_fds} fds"
+                    )
 
                 print("\n" + "=" * 70)
                 print("Recent logs:")
                 print("-" * 70)
 
-                for log in self.log_buffer[-10:]:
+                for log in self.recent_logs(10):
                     timestamp = log['timestamp'][11:19]
                     print(f"{timestamp} [{log['watcher']}] {log['level'].upper()}: {log['message'][:50]}")
 
                 print("\n")
 
-                time.sleep(self.config['manager'].get('status_update_interval', 2))
+                await self._wait_for_tick()
 
         except KeyboardInterrupt:
             pass
 
-    def run(self):
+    def run(self) -> int:
         """Run watcher manager with dashboard."""
         self.running = True
 
@@ -775,43 +1568,77 @@ class WatcherManager:
         except:
             pass
 
+        return asyncio.run(self._run())
+
+    async def _run(self) -> int:
+        """Supervise all watchers from the event loop."""
+        self._wake = asyncio.Event()
+
         # Setup signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._request_shutdown)
+            except (NotImplementedError, RuntimeError):
+                # Windows: no loop signal handlers
+                signal.signal(signum, self._signal_handler)
+
+        # SIGHUP reloads the configuration (file changes are also detected)
+        if hasattr(signal, 'SIGHUP'):
+            try:
+                loop.add_signal_handler(signal.SIGHUP, self.request_reload)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        log_pump = asyncio.create_task(self._pump_logs())
 
         # Start all watchers
-        started = self.start_all()
+        started = await self.start_all()
 
         if started == 0:
             print("[ERROR] No watchers started")
+            await self.cleanup(log_pump)
             return 1
 
         print(f"\n[SUCCESS] Started {started} watcher(s)")
         print("[INFO] Starting dashboard...\n")
 
-        time.sleep(2)
+        await asyncio.sleep(2)
 
         # Run dashboard
-        self.run_dashboard()
+        await self.run_dashboard()
 
         # Cleanup
-        self.cleanup()
+        await self.cleanup(log_pump)
 
         return 0
 
+    def _request_shutdown(self):
+        """Stop the monitor loop (called on the event loop)."""
+        print("\n\n[INFO] Received shutdown signal")
+        self.running = False
+        if self._wake:
+            self._wake.set()
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         print("\n\n[INFO] Received shutdown signal")
         self.running = False
 
-    def cleanup(self):
+    async def cleanup(self, log_pump: Optional[asyncio.Task] = None):
         """Cleanup on shutdown."""
         print("\n[INFO] Shutting down...")
 
         # Stop all watchers
-        stopped = self.stop_all(timeout=10)
+        stopped = await self.stop_all(timeout=10)
         print(f"[INFO] Stopped {stopped} watcher(s)")
 
+        # Drain remaining log lines
+        if log_pump:
+            log_pump.cancel()
+        self.process_logs()
+        self.flush_logs()
+
         # Remove PID file
         try:
             if PID_FILE.exists():
@@ -913,6 +1740,11 @@ def main():
         action='store_true',
         help='Show current configuration'
     )
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        help='Run without a dashboard (default when stdout is not a terminal)'
+    )
 
     args = parser.parse_args()
 
@@ -929,8 +1761,8 @@ def main():
         show_config()
         return 0
 
-    # Start manager
-    manager = WatcherManager()
+    # Start manager; under systemd stdout is the journal, not a terminal
+    manager = WatcherManager(headless=args.headless or not sys.stdout.isatty())
     return manager.run()
 
 
@@ -6,9 +6,16 @@ Monitors Gmail inbox for important emails and automatically creates task files
 in Needs_Action/ for processing by the task processor.
 
 Features:
-- Polls every 2 minutes for new unread important emails
+- Adaptive polling: fast after new mail, backs off while idle or throttled
+- Incremental sync via the Gmail History API (full search as fallback)
 - Filters by importance, sender, and keywords
 - Creates task files with email metadata
+- Batched message fetch and batchModify mark-as-read
+- Metadata-only fetch; full bodies retrieved on demand
+- Optional asyncio pipeline (fetch -> parse -> write -> ack) with backpressure
+- Message-id ledger to skip already-processed emails and merge threads
+- Several Gmail accounts in one process (config/gmail_accounts.json)
+- Compiled, hot-reloadable filters (config/gmail_filters.json)
 - Marks emails as read after processing
 - Rate limiting (max 50 emails/hour)
 - OAuth token refresh handling
@@ -20,6 +27,9 @@ Usage:
     python watchers/gmail_watcher.py --test           # Test mode (no marking as read)
     python watchers/gmail_watcher.py --dry-run        # Dry run (no task creation)
     python watchers/gmail_watcher.py --once           # Process once and exit
+    python watchers/gmail_watcher.py --full           # Fetch full message payloads
+    python watchers/gmail_watcher.py --pipeline       # Concurrent async pipeline
+    python watchers/gmail_watcher.py --accounts       # All accounts in config/gmail_accounts.json
 
 Requirements:
     pip install google-auth-oauthlib google-auth-httplib2 google-api-python-client
@@ -29,13 +39,22 @@ Author: AI Employee System
 """
 
 import os
+import re
+import asyncio
 import sys
 import time
 import json
+import base64
+import random
+import sqlite3
 import argparse
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 # Try to import Google libraries
 try:
@@ -59,12 +78,23 @@ PROJECT_ROOT = Path(__file__).parent.parent
 VAULT_PATH = PROJECT_ROOT / "AI_Employee_Vault"
 NEEDS_ACTION_PATH = VAULT_PATH / "Needs_Action"
 LOGS_PATH = VAULT_PATH / "Logs"
+SYNC_STATE_FILE = LOGS_PATH / "gmail_sync_state.json"
+LEDGER_FILE = LOGS_PATH / "gmail_ledger.sqlite3"
+METRICS_FILE = LOGS_PATH / "gmail_watcher_metrics.json"
+LEDGER_RETENTION_DAYS = 90
 
 # Gmail API credentials paths
 MCP_EMAIL_DIR = PROJECT_ROOT / "mcp_servers" / "email"
 CREDENTIALS_FILE = MCP_EMAIL_DIR / "config.json"
 TOKEN_FILE = MCP_EMAIL_DIR / "token.json"
 
+# Multi-account configuration (--accounts). Format:
+# {"accounts": [{"name": "work", "token_file": "mcp_servers/email/token_work.json",
+#                "credentials_file": "mcp_servers/email/config.json"}]}
+# Relative paths are resolved against the project root.
+ACCOUNTS_FILE = PROJECT_ROOT / "config" / "gmail_accounts.json"
+DEFAULT_ACCOUNT = "default"
+
 # Gmail API scopes (must match the OAuth setup)
 SCOPES = [
     'https://www.googleapis.com/auth/gmail.readonly',
@@ -72,8 +102,43 @@ SCOPES = [
 ]
 
 # Polling configuration
-POLL_INTERVAL = 120  # seconds (2 minutes)
+POLL_INTERVAL = 120      # seconds (2 minutes), starting interval
+MIN_POLL_INTERVAL = 30   # right after new mail arrives
+MAX_POLL_INTERVAL = 900  # ceiling while idle
+IDLE_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.1        # +/- 10% to avoid synchronized polling
+ERROR_BACKOFF_BASE = 60  # first delay after 429/5xx without Retry-After
+MAX_ERROR_BACKOFF = 3600
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Gmail API quota units per call
+QUOTA_UNITS = {
+    'history.list': 2,
+    'getProfile': 1,
+    'messages.list': 5,
+    'messages.get': 5,
+    'messages.modify': 5,
+    'messages.batchModify': 50,
+}
 MAX_RESULTS = 50     # max emails to fetch per poll
+HISTORY_PAGE_SIZE = 500  # max history records per history.list page
+FETCH_BATCH_SIZE = 50    # messages.get calls per batch HTTP request
+MODIFY_BATCH_SIZE = 1000 # max IDs per messages.batchModify call
+
+# Only these headers are requested when polling (format='metadata');
+# bodies are fetched on demand with fetch_email_body(), only for emails
+# that get a task
+FETCH_FORMAT = 'metadata'
+METADATA_HEADERS = ['From', 'To', 'Subject', 'Date']
+TASK_BODY_MAX_CHARS = 4000  # body text copied into a task file
+
+# Pipeline mode (--pipeline)
+PIPELINE_QUEUE_SIZE = 100  # max in-flight items per stage (backpressure)
+PIPELINE_WRITE_WORKERS = 4
+
+# Heartbeats to the watcher manager (only when WATCHER_HEARTBEAT_FD is set)
+HEARTBEAT_INTERVAL = 10     # seconds between heartbeats while sleeping
+API_HEARTBEAT_TIMEOUT = 90  # longest expected gap between API calls in a cycle
 
 # Rate limiting
 MAX_EMAILS_PER_HOUR = 50
@@ -97,6 +162,420 @@ PRIORITY_KEYWORDS = {
     'low': []
 }
 
+# Optional overrides for the three lists above, reloaded when the file changes:
+# {"important_keywords": [...], "client_domains": [...], "priority_keywords": {...}}
+FILTERS_FILE = PROJECT_ROOT / "config" / "gmail_filters.json"
+
+
+# ============================================================================
+# MESSAGE LEDGER
+# ============================================================================
+
+class MessageLedger:
+    """
+    Persistent record of Gmail messages that already have a task.
+
+    A SQLite table keyed on message_id (indexed on thread_id). Checked
+    before fetching so emails that stay unread (test mode, failed
+    mark-as-read) never produce a second task file, and used to find the
+    existing task for a thread so follow-ups are appended to it.
+    """
+
+    def __init__(self, db_file: Path = LEDGER_FILE, retention_days: int = LEDGER_RETENTION_DAYS):
+        """
+        Open (or create) the ledger.
+
+        Args:
+            db_file: SQLite database path
+            retention_days: Entries older than this are pruned on open
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_file), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS messages (
+                message_id TEXT PRIMARY KEY,
+                thread_id TEXT,
+                task_file TEXT,
+                created_at TEXT,
+                acked INTEGER DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_messages_thread ON messages(thread_id);
+        """)
+
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM messages WHERE created_at < ?", (cutoff,))
+
+    def lookup(self, message_ids: List[str]) -> Dict[str, bool]:
+        """
+        Find which messages are already recorded.
+
+        Args:
+            message_ids: Gmail message IDs
+
+        Returns:
+            Dict of recorded message_id -> acked flag
+        """
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(message_ids), 500):
+                chunk = message_ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT message_id, acked FROM messages "
+                    f"WHERE message_id IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                found.update({mid: bool(acked) for mid, acked in rows})
+        return found
+
+    def task_for_thread(self, thread_id: str) -> Optional[Path]:
+        """Get the most recent task file created for a thread, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT task_file FROM messages WHERE thread_id = ? AND task_file IS NOT NULL "
+                "ORDER BY created_at DESC LIMIT 1",
+                (thread_id,)
+            ).fetchone()
+        return Path(row[0]) if row else None
+
+    def record(self, message_id: str, thread_id: str, task_file: Path):
+        """Record that a message has a task file."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO messages (message_id, thread_id, task_file, created_at, acked) "
+                "VALUES (?, ?, ?, ?, 0)",
+                (message_id, thread_id, str(task_file), datetime.now().isoformat())
+            )
+
+    def mark_acked(self, message_ids: List[str]):
+        """Record that messages were marked as read."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE messages SET acked = 1 WHERE message_id = ?",
+                [(mid,) for mid in message_ids]
+            )
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+
+# ============================================================================
+# POLL SCHEDULING
+# ============================================================================
+
+class AdaptivePollInterval:
+    """
+    Adaptive delay between polls.
+
+    Drops to the minimum interval right after new mail, grows exponentially
+    while idle, and on 429/5xx honors the server's Retry-After (or backs
+    off exponentially). Jitter is applied to every delay.
+    """
+
+    def __init__(
+        self,
+        base: float = POLL_INTERVAL,
+        minimum: float = MIN_POLL_INTERVAL,
+        maximum: float = MAX_POLL_INTERVAL,
+        backoff: float = IDLE_BACKOFF_FACTOR,
+        jitter: float = POLL_JITTER
+    ):
+        """
+        Initialize poll interval.
+
+        Args:
+            base: Starting interval in seconds
+            minimum: Interval after a cycle that found new mail
+            maximum: Ceiling for the idle backoff
+            backoff: Multiplier applied after each idle cycle
+            jitter: Relative random jitter (0.1 = +/-10%)
+        """
+        self.current = base
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.jitter = jitter
+        self.error_streak = 0
+
+    def next_delay(self, new_mail: int, error_status: Optional[int] = None,
+                   retry_after: Optional[float] = None) -> float:
+        """
+        Compute the delay before the next poll.
+
+        Args:
+            new_mail: Number of emails processed in the last cycle
+            error_status: HTTP status of a failed API call, if any
+            retry_after: Server-requested delay in seconds, if any
+
+        Returns:
+            Seconds to sleep
+        """
+        if error_status in RETRYABLE_STATUSES:
+            self.error_streak += 1
+            if retry_after is not None:
+                # Never poll earlier than the server asked
+                return retry_after * (1 + random.uniform(0, self.jitter))
+            delay = min(MAX_ERROR_BACKOFF, ERROR_BACKOFF_BASE * 2 ** (self.error_streak - 1))
+            return self._jittered(delay)
+
+        self.error_streak = 0
+        if new_mail:
+            self.current = self.minimum
+        else:
+            self.current = min(self.maximum, self.current * self.backoff)
+
+        return self._jittered(self.current)
+
+    def _jittered(self, delay: float) -> float:
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+def parse_retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After header from an HttpError.
+
+    Args:
+        error: Exception raised by the Gmail API client
+
+    Returns:
+        Delay in seconds, or None if the header is absent or invalid
+    """
+    resp = getattr(error, 'resp', None)
+    value = resp.get('retry-after') if resp is not None and hasattr(resp, 'get') else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(retry_at.tzinfo)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+# Serializes daily-log rewrites between accounts polling in worker threads
+_LOG_FILE_LOCK = threading.Lock()
+
+
+def _open_heartbeat_fd() -> Optional[int]:
+    """Get the heartbeat pipe inherited from the watcher manager, if any."""
+    try:
+        fd = int(os.environ["WATCHER_HEARTBEAT_FD"])
+        os.set_blocking(fd, False)
+        return fd
+    except (KeyError, ValueError, OSError):
+        return None
+
+
+_HEARTBEAT_FD = _open_heartbeat_fd()
+
+
+def send_heartbeat(next_within: float, **counters):
+    """
+    Report liveness and counters to the watcher manager.
+
+    No-op when not supervised. Never blocks: a beat is skipped if the pipe
+    is full.
+
+    Args:
+        next_within: Seconds until the next heartbeat is due
+        **counters: Counters such as processed, errors and source
+    """
+    if _HEARTBEAT_FD is None:
+        return
+
+    message = json.dumps({"next_within": next_within, **counters}) + "\n"
+    try:
+        os.write(_HEARTBEAT_FD, message.encode('utf-8'))
+    except OSError:
+        pass  # Pipe full or manager gone
+
+
+def account_path(path: Path, account: str) -> Path:
+    """
+    Get the per-account variant of a state file path.
+
+    The default account keeps the original file name, so single-account
+    installs are unaffected.
+
+    Args:
+        path: Base file path (e.g. Logs/gmail_sync_state.json)
+        account: Account name
+
+    Returns:
+        Path such as Logs/gmail_sync_state_work.json
+    """
+    if account == DEFAULT_ACCOUNT:
+        return path
+    return path.with_name(f"{path.stem}_{account}{path.suffix}")
+
+
+# ============================================================================
+# EMAIL FILTER
+# ============================================================================
+
+class EmailFilter:
+    """
+    Compiled email filtering and classification rules.
+
+    Built once from configuration: the Gmail search query string, a
+    precompiled sender regex, a client domain set matched by suffix and a
+    keyword -> priority table. Classification tokenizes the text once and
+    looks each word (or multi-word phrase) up in the table, so its cost does
+    not depend on the number of keywords.
+    """
+
+    PRIORITY_RANK = {'low': 0, 'medium': 1, 'high': 2}
+    SENDER_RE = re.compile(r'<(.+?)>')
+    WORD_RE = re.compile(r'\w+')
+
+    def __init__(
+        self,
+        important_keywords: List[str] = IMPORTANT_KEYWORDS,
+        client_domains: List[str] = CLIENT_DOMAINS,
+        priority_keywords: Dict[str, List[str]] = PRIORITY_KEYWORDS
+    ):
+        """
+        Compile filter rules.
+
+        Args:
+            important_keywords: Subject keywords that make an email a candidate
+            client_domains: Client sender domains (e.g. '@client.com')
+            priority_keywords: Keywords per priority level
+        """
+        self.important_keywords = list(important_keywords)
+        self.client_domain_list = list(client_domains)
+        self.client_domains = {d.lower().lstrip('@') for d in client_domains}
+
+        # Highest level wins when a keyword is listed under several levels
+        self.priority_table: Dict[str, str] = {}
+        for level in sorted(priority_keywords, key=lambda l: self.PRIORITY_RANK.get(l, 0)):
+            for keyword in priority_keywords[level]:
+                self.priority_table[' '.join(self.WORD_RE.findall(keyword.lower()))] = level
+
+        self.keyword_set = {' '.join(self.WORD_RE.findall(kw.lower())) for kw in important_keywords}
+
+        phrases = list(self.priority_table) + list(self.keyword_set)
+        self.max_phrase_words = max((len(p.split()) for p in phrases), default=1)
+
+        self.query = self._build_query()
+
+    @classmethod
+    def from_config(cls, config_file: Path = FILTERS_FILE) -> 'EmailFilter':
+        """
+        Build a filter from the config file, falling back to module defaults.
+
+        Args:
+            config_file: JSON file with optional overrides
+
+        Returns:
+            Compiled EmailFilter
+
+        Raises:
+            ValueError: If the file is not valid JSON or a setting has the
+                wrong shape (e.g. an unknown priority level)
+        """
+        config = {}
+        if config_file.exists():
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            if not isinstance(config, dict):
+                raise ValueError(f"{config_file.name} must contain a JSON object")
+
+        important_keywords = config.get('important_keywords', IMPORTANT_KEYWORDS)
+        client_domains = config.get('client_domains', CLIENT_DOMAINS)
+        priority_keywords = config.get('priority_keywords', PRIORITY_KEYWORDS)
+
+        cls._check_strings('important_keywords', important_keywords)
+        cls._check_strings('client_domains', client_domains)
+        if not isinstance(priority_keywords, dict):
+            raise ValueError("priority_keywords must map priority levels to keyword lists")
+        for level, keywords in priority_keywords.items():
+            if level not in cls.PRIORITY_RANK:
+                raise ValueError(
+                    f"Unknown priority level '{level}' "
+                    f"(expected one of: {', '.join(cls.PRIORITY_RANK)})"
+                )
+            cls._check_strings(f"priority_keywords.{level}", keywords)
+
+        return cls(
+            important_keywords=important_keywords,
+            client_domains=client_domains,
+            priority_keywords=priority_keywords
+        )
+
+    @staticmethod
+    def _check_strings(name: str, value):
+        """Raise ValueError unless a config setting is a list of strings."""
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"{name} must be a list of strings")
+
+    def _build_query(self) -> str:
+        """Build the Gmail search query for important emails."""
+        query_parts = [
+            "is:unread",
+            "in:inbox",
+        ]
+
+        # Add importance filter OR client filter
+        importance_parts = [
+            "is:important",
+            f"from:({' OR '.join(self.client_domain_list)})"
+        ]
+
+        # Add keyword filters
+        keyword_filter = ' OR '.join([f'subject:{kw}' for kw in self.important_keywords])
+
+        # Combine: unread AND inbox AND (important OR from:clients OR keywords)
+        return f"{' '.join(query_parts)} ({' OR '.join(importance_parts)} OR ({keyword_filter}))"
+
+    def sender_email(self, from_header: str) -> str:
+        """Extract the address from a From header."""
+        match = self.SENDER_RE.search(from_header)
+        return match.group(1) if match else from_header
+
+    def is_client(self, sender_email: str) -> bool:
+        """Check the sender's domain (or any parent domain) against client domains."""
+        domain = sender_email.rpartition('@')[2].lower().rstrip('>').strip()
+        labels = domain.split('.')
+        return any('.'.join(labels[i:]) in self.client_domains for i in range(len(labels)))
+
+    def _phrases(self, text: str):
+        """Yield every word and multi-word phrase (up to the longest keyword)."""
+        words = self.WORD_RE.findall(text.lower())
+        for i in range(len(words)):
+            for n in range(1, self.max_phrase_words + 1):
+                if i + n > len(words):
+                    break
+                yield ' '.join(words[i:i + n])
+
+    def priority(self, *texts: str) -> str:
+        """
+        Classify priority from keywords in one pass over the texts.
+
+        Returns:
+            'high', 'medium' or 'low'
+        """
+        best = 'low'
+        for text in texts:
+            for phrase in self._phrases(text):
+                level = self.priority_table.get(phrase)
+                if level and self.PRIORITY_RANK[level] > self.PRIORITY_RANK[best]:
+                    best = level
+                    if best == 'high':
+                        return best
+        return best
+
+    def has_keyword(self, text: str) -> bool:
+        """Check if the text contains an important keyword."""
+        return any(phrase in self.keyword_set for phrase in self._phrases(text))
+
 
 # ============================================================================
 # GMAIL API CLIENT
@@ -105,24 +584,86 @@ PRIORITY_KEYWORDS = {
 class GmailWatcher:
     """Watches Gmail inbox and creates tasks for important emails."""
 
-    def __init__(self, test_mode: bool = False, dry_run: bool = False):
+    def __init__(
+        self,
+        test_mode: bool = False,
+        dry_run: bool = False,
+        service=None,
+        sync_state_file: Optional[Path] = None,
+        fetch_format: str = FETCH_FORMAT,
+        pipeline: bool = False,
+        ledger: Optional[MessageLedger] = None,
+        account: str = DEFAULT_ACCOUNT,
+        token_file: Path = TOKEN_FILE,
+        credentials_file: Path = CREDENTIALS_FILE
+    ):
         """
         Initialize Gmail watcher.
 
         Args:
             test_mode: If True, don't mark emails as read
             dry_run: If True, don't create task files
+            service: Pre-built Gmail service (e.g. a local fake for testing);
+                normally set by authenticate()
+            sync_state_file: JSON file holding the incremental sync state
+                (defaults to the account's Logs/gmail_sync_state*.json)
+            fetch_format: 'metadata' (headers, labels, snippet) or 'full'
+            pipeline: If True, run cycles through the async pipeline
+            ledger: Seen-message ledger (defaults to the account's
+                Logs/gmail_ledger*.sqlite3)
+            account: Account name used to tag logs, tasks and state files
+            token_file: OAuth token for this account
+            credentials_file: OAuth client config for this account
         """
+        self.account = account
+        self.token_file = token_file
+        self.credentials_file = credentials_file
         self.test_mode = test_mode
         self.dry_run = dry_run
-        self.service = None
+        self.service = service
+        self.fetch_format = fetch_format
+        self.pipeline = pipeline
         self.processed_count = 0
         self.rate_limit_tracker = []
 
+        # Incremental sync state (History API)
+        self.sync_state_file = sync_state_file or account_path(SYNC_STATE_FILE, account)
+        self.history_id: Optional[str] = None
+        self.pending_ids: List[str] = []
+        self.matched_ids: Set[str] = set()
+        self._next_history_id: Optional[str] = None
+        self._load_sync_state()
+
         # Ensure directories exist
         NEEDS_ACTION_PATH.mkdir(parents=True, exist_ok=True)
         LOGS_PATH.mkdir(parents=True, exist_ok=True)
 
+        self.ledger = ledger or MessageLedger(account_path(LEDGER_FILE, account))
+
+        # Compiled filters, rebuilt when FILTERS_FILE changes
+        self.filters_file = FILTERS_FILE
+        self.filters = EmailFilter()
+        self._filters_mtime: Optional[float] = None
+        self.reload_filters_if_changed()
+
+        # Poll cadence and quota metrics
+        self.poll_interval = AdaptivePollInterval()
+        self.last_error_status: Optional[int] = None
+        self.last_retry_after: Optional[float] = None
+        self.metrics = {
+            'polls': 0,
+            'emails_processed': 0,
+            'api_calls': {},
+            'quota_units': 0,
+            'errors': {},
+            'last_poll_at': None,
+            'next_interval': None,
+        }
+        self._quota_window = deque()
+        self._last_heartbeat = 0.0
+        self.reack_ids: List[str] = []
+        self._thread_locks: Dict[str, threading.Lock] = {}
+
         self.log(f"Gmail Watcher initialized (test_mode={test_mode}, dry_run={dry_run})")
 
     def log(self, message: str, level: str = "INFO"):
@@ -143,6 +684,9 @@ class GmailWatcher:
             "ERROR": "[ERROR]"
         }.get(level, "")
 
+        if self.account != DEFAULT_ACCOUNT:
+            prefix_ascii = f"{prefix_ascii} [{self.account}]"
+
         print(f"{timestamp} {prefix_ascii} {message}")
 
     def log_to_json(self, action: str, details: Dict):
@@ -154,24 +698,26 @@ class GmailWatcher:
             "timestamp": datetime.now().isoformat(),
             "action": action,
             "source": "gmail_watcher",
+            "account": self.account,
             **details
         }
 
-        # Read existing logs
-        logs = []
-        if log_file.exists():
-            try:
-                with open(log_file, "r", encoding="utf-8") as f:
-                    logs = json.load(f)
-            except json.JSONDecodeError:
-                logs = []
+        with _LOG_FILE_LOCK:
+            # Read existing logs
+            logs = []
+            if log_file.exists():
+                try:
+                    with open(log_file, "r", encoding="utf-8") as f:
+                        logs = json.load(f)
+                except json.JSONDecodeError:
+                    logs = []
 
-        # Append new log
-        logs.append(log_entry)
+            # Append new log
+            logs.append(log_entry)
 
-        # Write back
-        with open(log_file, "w", encoding="utf-8") as f:
-            json.dump(logs, f, indent=2, ensure_ascii=False)
+            # Write back
+            with open(log_file, "w", encoding="utf-8") as f:
+                json.dump(logs, f, indent=2, ensure_ascii=False)
 
     def authenticate(self) -> bool:
         """
@@ -183,12 +729,12 @@ class GmailWatcher:
         creds = None
 
         # Check if we have a token file
-        if TOKEN_FILE.exists():
+        if self.token_file.exists():
             try:
-                creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
-                self.log("Loaded existing credentials from token.json")
+                creds = Credentials.from_authorized_user_file(str(self.token_file), SCOPES)
+                self.log(f"Loaded existing credentials from {self.token_file.name}")
             except Exception as e:
-                self.log(f"Failed to load token.json: {e}", "WARNING")
+                self.log(f"Failed to load {self.token_file.name}: {e}", "WARNING")
                 creds = None
 
         # If there are no (valid) credentials available, let the user log in
@@ -204,15 +750,15 @@ class GmailWatcher:
                     return False
             else:
                 # No valid credentials, need to authenticate
-                if not CREDENTIALS_FILE.exists():
-                    self.log(f"Credentials file not found: {CREDENTIALS_FILE}", "ERROR")
+                if not self.credentials_file.exists():
+                    self.log(f"Credentials file not found: {self.credentials_file}", "ERROR")
                     self.log("Please run: python scripts/setup_gmail_oauth.py", "WARNING")
                     return False
 
                 try:
                     self.log("Starting OAuth flow...")
                     flow = InstalledAppFlow.from_client_secrets_file(
-                        str(CREDENTIALS_FILE), SCOPES
+                        str(self.credentials_file), SCOPES
                     )
                     creds = flow.run_local_server(port=0)
                     self.log("OAuth flow completed successfully", "SUCCESS")
@@ -222,9 +768,9 @@ class GmailWatcher:
 
             # Save the credentials for the next run
             try:
-                with open(TOKEN_FILE, 'w') as token:
+                with open(self.token_file, 'w') as token:
                     token.write(creds.to_json())
-                self.log("Credentials saved to token.json", "SUCCESS")
+                self.log(f"Credentials saved to {self.token_file.name}", "SUCCESS")
             except Exception as e:
                 self.log(f"Failed to save credentials: {e}", "WARNING")
 
@@ -237,12 +783,12 @@ class GmailWatcher:
             self.log(f"Failed to build Gmail service: {e}", "ERROR")
             return False
 
-    def check_rate_limit(self) -> bool:
+    def rate_limit_remaining(self) -> int:
         """
-        Check if we're within rate limits.
+        Get how many more emails can be processed in the current window.
 
         Returns:
-            True if within limits, False if exceeded
+            Remaining email capacity
         """
         now = datetime.now()
         cutoff = now - timedelta(seconds=RATE_LIMIT_WINDOW)
@@ -253,8 +799,17 @@ class GmailWatcher:
             if ts > cutoff
         ]
 
+        return max(0, MAX_EMAILS_PER_HOUR - len(self.rate_limit_tracker))
+
+    def check_rate_limit(self) -> bool:
+        """
+        Check if we're within rate limits.
+
+        Returns:
+            True if within limits, False if exceeded
+        """
         # Check if under limit
-        if len(self.rate_limit_tracker) >= MAX_EMAILS_PER_HOUR:
+        if self.rate_limit_remaining() == 0:
             self.log(f"Rate limit exceeded: {len(self.rate_limit_tracker)}/{MAX_EMAILS_PER_HOUR} per hour", "WARNING")
             return False
 
@@ -265,89 +820,561 @@ class GmailWatcher:
         self.rate_limit_tracker.append(datetime.now())
         self.processed_count += 1
 
+    def reload_filters_if_changed(self):
+        """Recompile filters if the filter config file was added, changed or removed."""
+        try:
+            mtime = self.filters_file.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime == self._filters_mtime:
+            return
+
+        try:
+            self.filters = EmailFilter.from_config(self.filters_file)
+            if self._filters_mtime is not None or mtime is not None:
+                self.log(f"Loaded email filters from {self.filters_file.name}")
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            self.log(f"Invalid filter config, keeping previous filters: {e}", "ERROR")
+
+        self._filters_mtime = mtime
+
     def build_search_query(self) -> str:
         """
-        Build Gmail search query for important emails.
+        Get the Gmail search query for important emails.
 
         Returns:
             Gmail search query string
         """
-        query_parts = [
-            "is:unread",
-            "in:inbox",
-        ]
+        return self.filters.query
 
-        # Add importance filter OR client filter
-        importance_parts = [
-            "is:important",
-            f"from:({' OR '.join(CLIENT_DOMAINS)})"
+    def _load_sync_state(self):
+        """Load the last synced historyId and pending message IDs."""
+        if not self.sync_state_file.exists():
+            return
+
+        try:
+            with open(self.sync_state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.history_id = state.get("history_id")
+            self.pending_ids = state.get("pending_ids", [])
+            # Older state files have no match flags: those IDs get filtered
+            self.matched_ids = set(state.get("pending_matched", []))
+        except (json.JSONDecodeError, OSError) as e:
+            self.log(f"Ignoring unreadable sync state: {e}", "WARNING")
+
+    def _save_sync_state(self):
+        """Persist the sync state (atomically)."""
+        state = {
+            "history_id": self.history_id,
+            "pending_ids": self.pending_ids,
+            "pending_matched": [mid for mid in self.pending_ids if mid in self.matched_ids],
+            "updated_at": datetime.now().isoformat()
+        }
+
+        try:
+            tmp_file = self.sync_state_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_file, self.sync_state_file)
+        except OSError as e:
+            self.log(f"Failed to save sync state: {e}", "WARNING")
+
+    def commit_sync_state(self, failed_ids: List[str]):
+        """
+        Advance the sync checkpoint after a cycle.
+
+        Args:
+            failed_ids: Message IDs that were not processed and must be
+                retried next cycle
+        """
+        if self._next_history_id:
+            self.history_id = self._next_history_id
+            self._next_history_id = None
+
+        self.pending_ids = list(dict.fromkeys(failed_ids))
+        self.matched_ids &= set(self.pending_ids)
+        self._save_sync_state()
+
+    def _count_api(self, method: str, calls: int = 1):
+        """Record Gmail API calls and their quota cost."""
+        units = QUOTA_UNITS.get(method, 0) * calls
+        self.metrics['api_calls'][method] = self.metrics['api_calls'].get(method, 0) + calls
+        self.metrics['quota_units'] += units
+        self._quota_window.append((time.time(), units))
+
+        # Each completed call is progress; tell the manager (at most once a second)
+        if time.monotonic() - self._last_heartbeat >= 1.0:
+            self.heartbeat()
+
+    def heartbeat(self, next_within: float = API_HEARTBEAT_TIMEOUT):
+        """
+        Send a heartbeat with this account's counters.
+
+        Args:
+            next_within: Seconds until the next heartbeat is due
+        """
+        self._last_heartbeat = time.monotonic()
+        send_heartbeat(
+            next_within,
+            source=self.account,
+            processed=self.processed_count,
+            errors=sum(self.metrics['errors'].values())
+        )
+
+    def sleep_with_heartbeat(self, delay: float):
+        """Sleep between polls, sending heartbeats every HEARTBEAT_INTERVAL."""
+        end = time.monotonic() + delay
+        remaining = delay
+        while remaining > 0:
+            step = min(remaining, HEARTBEAT_INTERVAL)
+            self.heartbeat(next_within=step)
+            time.sleep(step)
+            remaining = end - time.monotonic()
+
+    async def sleep_with_heartbeat_async(self, delay: float):
+        """Event-loop variant of sleep_with_heartbeat (multi-account mode)."""
+        end = time.monotonic() + delay
+        remaining = delay
+        while remaining > 0:
+            step = min(remaining, HEARTBEAT_INTERVAL)
+            self.heartbeat(next_within=step)
+            await asyncio.sleep(step)
+            remaining = end - time.monotonic()
+
+    def _note_api_error(self, error: Exception):
+        """Remember the status of a failed call for poll scheduling."""
+        status = getattr(getattr(error, 'resp', None), 'status', None)
+        if status is None:
+            return
+
+        self.metrics['errors'][str(status)] = self.metrics['errors'].get(str(status), 0) + 1
+        if status in RETRYABLE_STATUSES:
+            self.last_error_status = status
+            self.last_retry_after = parse_retry_after(error)
+
+    def save_metrics(self, metrics_file: Optional[Path] = None):
+        """Write poll cadence and quota usage to the metrics file."""
+        metrics_file = metrics_file or account_path(METRICS_FILE, self.account)
+        cutoff = time.time() - 3600
+        while self._quota_window and self._quota_window[0][0] < cutoff:
+            self._quota_window.popleft()
+
+        data = {
+            **self.metrics,
+            'quota_units_last_hour': sum(units for _, units in self._quota_window),
+            'account': self.account,
+            'updated_at': datetime.now().isoformat(),
+        }
+
+        try:
+            tmp_file = metrics_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_file, metrics_file)
+        except OSError as e:
+            self.log(f"Failed to save metrics: {e}", "WARNING")
+
+    def next_poll_delay(self, processed: int) -> float:
+        """
+        Get the delay before the next poll and reset per-cycle error state.
+
+        Args:
+            processed: Emails processed in the last cycle
+
+        Returns:
+            Seconds to sleep
+        """
+        delay = self.poll_interval.next_delay(
+            processed,
+            self.last_error_status,
+            self.last_retry_after
+        )
+        self.last_error_status = None
+        self.last_retry_after = None
+
+        self.metrics['next_interval'] = round(delay, 1)
+        return delay
+
+    def _list_history_messages(self) -> Optional[List[Dict]]:
+        """
+        List messages added to the inbox since the last historyId.
+
+        Returns:
+            List of {'id', 'threadId', 'labelIds'} dicts, or None if the
+            history has expired and a full sync is needed
+        """
+        added = {}
+        page_token = None
+
+        while True:
+            try:
+                response = self.service.users().history().list(
+                    userId='me',
+                    startHistoryId=self.history_id,
+                    historyTypes=['messageAdded'],
+                    labelId='INBOX',
+                    maxResults=HISTORY_PAGE_SIZE,
+                    pageToken=page_token
+                ).execute()
+                self._count_api('history.list')
+            except HttpError as e:
+                if getattr(e, 'resp', None) is not None and e.resp.status == 404:
+                    self.log("Gmail history expired, falling back to full sync", "WARNING")
+                    return None
+                raise
+
+            for record in response.get('history', []):
+                for item in record.get('messagesAdded', []):
+                    message = item.get('message', {})
+                    if 'id' in message:
+                        added[message['id']] = message
+
+            self._next_history_id = response.get('historyId', self._next_history_id)
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        # Only unread inbox messages are candidates
+        return [
+            m for m in added.values()
+            if {'UNREAD', 'INBOX'} <= set(m.get('labelIds', ['UNREAD', 'INBOX']))
         ]
 
-        # Add keyword filters
-        keyword_filter = ' OR '.join([f'subject:{kw}' for kw in IMPORTANT_KEYWORDS])
+    def _full_sync_message_ids(self) -> List[str]:
+        """
+        Run the full search query and checkpoint the current historyId.
 
-        # Combine: unread AND inbox AND (important OR from:clients OR keywords)
-        query = f"{' '.join(query_parts)} ({' OR '.join(importance_parts)} OR ({keyword_filter}))"
+        Returns:
+            List of matching message IDs
+        """
+        # Checkpoint before searching so nothing arriving meanwhile is missed
+        profile = self.service.users().getProfile(userId='me').execute()
+        self._count_api('getProfile')
+        self._next_history_id = profile.get('historyId')
 
-        return query
+        query = self.build_search_query()
+        self.log(f"Searching with query: {query[:100]}...")
 
-    def fetch_important_emails(self) -> List[Dict]:
+        results = self.service.users().messages().list(
+            userId='me',
+            q=query,
+            maxResults=MAX_RESULTS
+        ).execute()
+        self._count_api('messages.list')
+
+        return [msg['id'] for msg in results.get('messages', [])]
+
+    def collect_message_ids(self) -> Tuple[List[str], Set[str]]:
         """
-        Fetch important unread emails from Gmail.
+        Determine which messages to fetch this cycle.
+
+        Combines pending IDs from earlier cycles with new IDs from the
+        History API (or the full search). The rate limit is applied after
+        filtering, so only a full limit defers everything unfetched.
 
         Returns:
-            List of email message dictionaries
+            Tuple of (message IDs to fetch, IDs known to match the search
+            query; every other ID still needs client-side filtering)
+
+        Raises:
+            HttpError: If the Gmail API call fails
         """
-        if not self.service:
-            self.log("Gmail service not initialized", "ERROR")
-            return []
+        incremental = False
+        history_ids = []
 
-        try:
-            # Build search query
-            query = self.build_search_query()
-            self.log(f"Searching with query: {query[:100]}...")
+        if self.history_id:
+            added = self._list_history_messages()
+            if added is not None:
+                incremental = True
+                history_ids = [m['id'] for m in added]
+
+        # Pending IDs keep their match flag from the cycle that found them
+        self.matched_ids &= set(self.pending_ids)
+
+        if incremental:
+            message_ids = list(dict.fromkeys(self.pending_ids + history_ids))
+        else:
+            search_ids = self._full_sync_message_ids()
+            self.matched_ids.update(search_ids)
+            message_ids = list(dict.fromkeys(self.pending_ids + search_ids))
 
-            # Search for messages
-            results = self.service.users().messages().list(
+        self.pending_ids = []
+
+        # Skip emails that already have a task; retry marking them as read
+        seen = self.ledger.lookup(message_ids)
+        if seen:
+            self.reack_ids = [mid for mid, acked in seen.items() if not acked]
+            message_ids = [mid for mid in message_ids if mid not in seen]
+            self.log(f"Skipping {len(seen)} already-processed email(s)")
+
+        if not message_ids:
+            self.log("No new important emails found")
+            return [], self.matched_ids
+
+        self.log(
+            f"Found {len(message_ids)} {'new' if incremental else 'important'} email(s)",
+            "SUCCESS"
+        )
+
+        if not self.rate_limit_remaining():
+            self.log(f"Rate limit reached, deferring {len(message_ids)} email(s)", "WARNING")
+            self.pending_ids = message_ids
+            return [], self.matched_ids
+
+        return message_ids, self.matched_ids
+
+    def retry_acks(self):
+        """Mark as read emails whose task exists but whose earlier ack failed."""
+        if not self.reack_ids:
+            return
+
+        ids, self.reack_ids = self.reack_ids, []
+        if self.test_mode:
+            return
+
+        self.log(f"Retrying mark-as-read for {len(ids)} email(s)")
+        self.ledger.mark_acked(self.mark_as_read_batch(ids))
+
+    def _passes_filters(self, email_data: Dict, matched_ids: Set[str]) -> bool:
+        """
+        Keep only important emails.
+
+        History returns every new inbox message, and pending IDs may have
+        come from it, so anything not known to match the search query is
+        filtered on the fetched message. Matches are remembered so they are
+        not re-filtered if they end up pending.
+        """
+        if email_data['id'] in matched_ids:
+            return True
+
+        if not self.matches_watch_filters(self.extract_email_info(email_data)):
+            return False
+
+        matched_ids.add(email_data['id'])
+        return True
+
+    def _accept_email(self, email_data: Dict, matched_ids: Set[str], accepted: int,
+                      remaining: int, deferred: List[str]) -> bool:
+        """
+        Decide whether a fetched email is processed this cycle.
+
+        Shared by the batch and pipeline paths: the email must pass the
+        filters, and only matches count against the rate limit. Matches
+        over the limit are added to deferred.
+
+        Args:
+            email_data: Fetched message
+            matched_ids: IDs known to match the search query
+            accepted: Emails accepted so far this cycle
+            remaining: Rate limit left at the start of the cycle
+            deferred: Collects IDs deferred to the next cycle
+
+        Returns:
+            True if the email should be processed now
+        """
+        if not self._passes_filters(email_data, matched_ids):
+            return False
+
+        if accepted >= remaining:
+            deferred.append(email_data['id'])
+            return False
+
+        return True
+
+    def _fetch_messages(self, message_ids: List[str]) -> Tuple[List[Dict], List[str]]:
+        """
+        Fetch messages using batch HTTP requests.
+
+        Args:
+            message_ids: Gmail message IDs to fetch
+
+        Returns:
+            Tuple of (messages in request order, IDs to retry next cycle)
+        """
+        results: Dict[str, Dict] = {}
+        retry_ids: List[str] = []
+
+        def on_response(request_id, response, exception):
+            if exception is None:
+                results[request_id] = response
+                return
+
+            status = getattr(getattr(exception, 'resp', None), 'status', None)
+            self._note_api_error(exception)
+            self.log(f"Failed to fetch email {request_id}: {exception}", "ERROR")
+            # Deleted messages are gone for good; anything else is retried
+            if status != 404:
+                retry_ids.append(request_id)
+
+        for start in range(0, len(message_ids), FETCH_BATCH_SIZE):
+            chunk = message_ids[start:start + FETCH_BATCH_SIZE]
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for message_id in chunk:
+                batch.add(self._get_message_request(message_id), request_id=message_id)
+            batch.execute()
+            self._count_api('messages.get', len(chunk))
+
+        emails = [results[mid] for mid in message_ids if mid in results]
+        return emails, retry_ids
+
+    def _get_message_request(self, message_id: str):
+        """Build a messages.get request using the configured fetch format."""
+        if self.fetch_format == 'metadata':
+            return self.service.users().messages().get(
                 userId='me',
-                q=query,
-                maxResults=MAX_RESULTS
-            ).execute()
+                id=message_id,
+                format='metadata',
+                metadataHeaders=METADATA_HEADERS
+            )
 
-            messages = results.get('messages', [])
+        return self.service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format=self.fetch_format
+        )
 
-            if not messages:
-                self.log("No new important emails found")
-                return []
+    def fetch_email_body(self, message_id: str) -> str:
+        """
+        Fetch the full plain-text body of an email on demand.
 
-            self.log(f"Found {len(messages)} important email(s)", "SUCCESS")
+        Polling only retrieves metadata; consumers that need the body (e.g.
+        drafting a reply) call this for the specific message.
 
-            # Fetch full message details
-            emails = []
-            for msg in messages:
-                try:
-                    # Check rate limit before processing each email
-                    if not self.check_rate_limit():
-                        self.log("Rate limit reached, stopping email fetch", "WARNING")
-                        break
+        Args:
+            message_id: Gmail message ID
+
+        Returns:
+            Decoded body text (HTML stripped if there is no text/plain part)
+        """
+        email_data = self.service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='full'
+        ).execute()
+        self._count_api('messages.get')
+
+        return self._extract_text_body(email_data.get('payload', {}))
+
+    def load_email_body(self, email_data: Dict) -> str:
+        """
+        Get the body of an email that is getting a task.
+
+        Uses the fetched payload when it already has the body (--full) and
+        fetch_email_body() otherwise. A failed fetch is not fatal: the task
+        falls back to the snippet.
+
+        Args:
+            email_data: Gmail API message object
+
+        Returns:
+            Body text, or '' if it is unavailable
+        """
+        if self.fetch_format == 'full':
+            return self._extract_text_body(email_data.get('payload', {}))
+
+        try:
+            return self.fetch_email_body(email_data['id'])
+        except HttpError as e:
+            self._note_api_error(e)
+            self.log(f"Failed to fetch body of {email_data['id']}, using snippet: {e}", "WARNING")
+            return ''
 
-                    email_data = self.service.users().messages().get(
-                        userId='me',
-                        id=msg['id'],
-                        format='full'
-                    ).execute()
+    @staticmethod
+    def _extract_text_body(payload: Dict) -> str:
+        """Find and decode the text body in a message payload."""
+        html_body = None
+        stack = [payload]
 
-                    emails.append(email_data)
+        while stack:
+            part = stack.pop(0)
+            data = part.get('body', {}).get('data')
+            mime_type = part.get('mimeType', '')
 
-                except HttpError as e:
-                    self.log(f"Failed to fetch email {msg['id']}: {e}", "ERROR")
-                    continue
+            if data and mime_type in ('text/plain', 'text/html'):
+                text = base64.urlsafe_b64decode(data + '=' * (-len(data) % 4)).decode('utf-8', 'replace')
+                if mime_type == 'text/plain':
+                    return text
+                if html_body is None:
+                    html_body = re.sub(r'<[^>]+>', '', text)
+
+            stack.extend(part.get('parts', []))
+
+        return html_body or ''
+
+    def matches_watch_filters(self, email_info: Dict) -> bool:
+        """
+        Apply the search query's importance filters client-side.
+
+        Used for messages discovered through the History API, which returns
+        every new inbox message rather than only query matches.
+
+        Args:
+            email_info: Extracted email information
+
+        Returns:
+            True if the email is important, from a client, or has a keyword
+            in its subject
+        """
+        if email_info['is_important'] or email_info['is_client']:
+            return True
+
+        return self.filters.has_keyword(email_info['subject'])
+
+    def fetch_important_emails(self) -> List[Dict]:
+        """
+        Fetch important unread emails from Gmail.
+
+        Uses the History API to get only messages added since the last
+        cycle; runs the full search when there is no checkpoint yet or the
+        history has expired.
+
+        Returns:
+            List of email message dictionaries
+        """
+        if not self.service:
+            self.log("Gmail service not initialized", "ERROR")
+            return []
+
+        # IDs carried over from earlier cycles are behind the history
+        # checkpoint; keep them, and this cycle's IDs, if it fails
+        carried_ids = list(self.pending_ids)
+        message_ids = []
+
+        try:
+            message_ids, matched_ids = self.collect_message_ids()
+
+            # Fetch and filter batch by batch until the rate limit is filled;
+            # only matching emails count against it, the rest are dropped
+            remaining = self.rate_limit_remaining()
+            emails = []
+            deferred = []
+            for start in range(0, len(message_ids), FETCH_BATCH_SIZE):
+                if len(emails) >= remaining:
+                    deferred.extend(message_ids[start:])
+                    break
+                fetched, retry_ids = self._fetch_messages(message_ids[start:start + FETCH_BATCH_SIZE])
+                self.pending_ids.extend(retry_ids)
+                for email_data in fetched:
+                    if self._accept_email(email_data, matched_ids, len(emails), remaining, deferred):
+                        emails.append(email_data)
+
+            if deferred:
+                self.log(
+                    f"Rate limit allows {remaining} more email(s), deferring "
+                    f"{len(deferred)}", "WARNING"
+                )
+                self.pending_ids.extend(deferred)
 
             return emails
 
         except HttpError as e:
+            self._note_api_error(e)
             self.log(f"Gmail API error: {e}", "ERROR")
             self.log_to_json("gmail_api_error", {"error": str(e)})
+            self._next_history_id = None
+            self.pending_ids = list(dict.fromkeys(carried_ids + self.pending_ids + message_ids))
             return []
 
     def extract_email_info(self, email_data: Dict) -> Dict:
@@ -372,33 +1399,17 @@ class GmailWatcher:
             'date': headers.get('Date', ''),
             'labels': email_data.get('labelIds', []),
             'snippet': email_data.get('snippet', '')[:200],  # First 200 chars
+            'body': '',  # Filled in by load_email_body() for emails that get a task
         }
 
         # Extract sender email
-        from_header = info['from']
-        email_match = re.search(r'<(.+?)>', from_header)
-        if email_match:
-            info['sender_email'] = email_match.group(1)
-        else:
-            info['sender_email'] = from_header
+        info['sender_email'] = self.filters.sender_email(info['from'])
 
         # Determine priority based on keywords
-        subject_lower = info['subject'].lower()
-        snippet_lower = info['snippet'].lower()
-
-        priority = 'low'
-        for level in ['high', 'medium']:
-            for keyword in PRIORITY_KEYWORDS[level]:
-                if keyword in subject_lower or keyword in snippet_lower:
-                    priority = level
-                    break
-            if priority == level:
-                break
-
-        info['priority'] = priority
+        info['priority'] = self.filters.priority(info['subject'], info['snippet'])
 
         # Check if from client domain
-        info['is_client'] = any(domain in info['sender_email'] for domain in CLIENT_DOMAINS)
+        info['is_client'] = self.filters.is_client(info['sender_email'])
 
         # Check if important label
         info['is_important'] = 'IMPORTANT' in info['labels']
@@ -409,16 +1420,91 @@ class GmailWatcher:
         """
         Create a task file in Needs_Action/ for the email.
 
+        Follow-ups in a thread that already has a task in Needs_Action/ are
+        appended to that task instead. Either way the message is recorded
+        in the ledger.
+
         Args:
             email_info: Extracted email information
 
         Returns:
-            Path to created task file, or None if creation failed
+            Path to created (or appended) task file, or None if creation failed
         """
         if self.dry_run:
             self.log(f"[DRY-RUN] Would create task for: {email_info['subject']}")
             return None
 
+        # Serialize per thread so concurrent writers agree on one task file
+        lock = self._thread_locks.setdefault(email_info['thread_id'], threading.Lock())
+        with lock:
+            existing = self.ledger.task_for_thread(email_info['thread_id'])
+            if existing and existing.exists():
+                filepath = self._append_to_thread_task(existing, email_info)
+            else:
+                filepath = self._write_task_file(email_info)
+
+            if filepath:
+                self.ledger.record(email_info['message_id'], email_info['thread_id'], filepath)
+
+        return filepath
+
+    def _append_to_thread_task(self, task_file: Path, email_info: Dict) -> Optional[Path]:
+        """
+        Append a follow-up email to the existing task for its thread.
+
+        Args:
+            task_file: Existing task file for the thread
+            email_info: Extracted email information
+
+        Returns:
+            Path to the task file, or None if the append failed
+        """
+        content = f"""
+## Follow-up: {email_info['subject']}
+
+**From:** {email_info['from']}
+**Date:** {email_info['date']}
+**Priority:** {email_info['priority'].upper()}
+
+{self._task_body(email_info)}
+
+**Message ID:** {email_info['message_id']}
+"""
+
+        try:
+            with open(task_file, 'a', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.log(f"Appended follow-up to task file: {task_file.name}", "SUCCESS")
+            return task_file
+
+        except Exception as e:
+            self.log(f"Failed to append to task file: {e}", "ERROR")
+            return None
+
+    @staticmethod
+    def _task_body(email_info: Dict) -> str:
+        """Body text for a task file (the snippet if the body is unavailable)."""
+        body = email_info['body'].strip()
+        if not body:
+            return email_info['snippet']
+
+        if len(body) > TASK_BODY_MAX_CHARS:
+            body = body[:TASK_BODY_MAX_CHARS].rstrip() + "\n\n_[truncated - read full email in Gmail]_"
+        return body
+
+    def _write_task_file(self, email_info: Dict) -> Optional[Path]:
+        """
+        Write a new task file for an email.
+
+        Args:
+            email_info: Extracted email information
+
+        Returns:
+            Path to created task file, or None if creation failed
+        """
         try:
             # Generate filename (sanitize subject)
             subject_clean = re.sub(r'[^\w\s-]', '', email_info['subject'])
@@ -437,6 +1523,7 @@ status: needs_action
 type: email_task
 priority: {email_info['priority']}
 email_metadata:
+  account: {self.account}
   message_id: {email_info['message_id']}
   thread_id: {email_info['thread_id']}
   from: {email_info['sender_email']}
@@ -455,7 +1542,7 @@ email_metadata:
 
 ## Email Preview
 
-{email_info['snippet']}
+{self._task_body(email_info)}
 
 ## Action Required
 
@@ -478,9 +1565,18 @@ _Add any notes or context here_
 **Thread ID:** {email_info['thread_id']}
 """
 
-            # Write task file
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Write task file durably (callers ack the email only after this)
+            try:
+                f = open(filepath, 'x', encoding='utf-8')
+            except FileExistsError:
+                filename = f"email_{timestamp}_{subject_clean}_{email_info['message_id']}.md"
+                filepath = NEEDS_ACTION_PATH / filename
+                f = open(filepath, 'w', encoding='utf-8')
+
+            with f:
                 f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
 
             self.log(f"Created task file: {filename}", "SUCCESS")
             return filepath
@@ -509,23 +1605,63 @@ _Add any notes or context here_
                 id=message_id,
                 body={'removeLabelIds': ['UNREAD']}
             ).execute()
+            self._count_api('messages.modify')
 
             self.log(f"Marked message {message_id} as read", "SUCCESS")
             return True
 
         except HttpError as e:
+            self._note_api_error(e)
             self.log(f"Failed to mark message {message_id} as read: {e}", "ERROR")
             return False
 
-    def process_email(self, email_data: Dict) -> bool:
+    def mark_as_read_batch(self, message_ids: List[str]) -> List[str]:
         """
-        Process a single email: extract info, create task, mark as read.
+        Mark several emails as read with messages.batchModify.
+
+        batchModify is all-or-nothing, so a failed chunk falls back to
+        per-message modify calls to find out which IDs succeeded.
+
+        Args:
+            message_ids: Gmail message IDs
+
+        Returns:
+            IDs that were marked as read
+        """
+        if self.test_mode:
+            self.log(f"[TEST MODE] Would mark {len(message_ids)} message(s) as read")
+            return list(message_ids)
+
+        marked = []
+        for start in range(0, len(message_ids), MODIFY_BATCH_SIZE):
+            chunk = message_ids[start:start + MODIFY_BATCH_SIZE]
+            try:
+                self.service.users().messages().batchModify(
+                    userId='me',
+                    body={'ids': chunk, 'removeLabelIds': ['UNREAD']}
+                ).execute()
+                self._count_api('messages.batchModify')
+
+                self.log(f"Marked {len(chunk)} message(s) as read", "SUCCESS")
+                marked.extend(chunk)
+
+            except HttpError as e:
+                self._note_api_error(e)
+                self.log(f"Batch mark-as-read failed ({e}), retrying individually", "WARNING")
+                marked.extend(mid for mid in chunk if self.mark_as_read(mid))
+
+        return marked
+
+    def prepare_email(self, email_data: Dict) -> Optional[Tuple[Dict, Optional[Path]]]:
+        """
+        Extract info and create the task file for an email.
 
         Args:
             email_data: Gmail API message object
 
         Returns:
-            True if processed successfully, False otherwise
+            Tuple of (email info, task file) ready to be acknowledged, or
+            None if the task could not be created
         """
         try:
             # Extract email information
@@ -533,34 +1669,68 @@ _Add any notes or context here_
 
             self.log(f"Processing: {email_info['subject'][:50]}...")
 
+            if not self.dry_run:
+                email_info['body'] = self.load_email_body(email_data)
+
             # Create task file
             task_file = self.create_task_file(email_info)
 
             if task_file or self.dry_run:
-                # Mark as read
-                if self.mark_as_read(email_info['message_id']):
-                    # Log to JSON
-                    self.log_to_json("email_processed", {
-                        "message_id": email_info['message_id'],
-                        "from": email_info['sender_email'],
-                        "subject": email_info['subject'],
-                        "priority": email_info['priority'],
-                        "task_file": str(task_file) if task_file else None,
-                        "test_mode": self.test_mode,
-                        "dry_run": self.dry_run
-                    })
-
-                    # Record for rate limiting
-                    self.record_processed_email()
-
-                    return True
+                return email_info, task_file
 
-            return False
+            return None
 
         except Exception as e:
             self.log(f"Error processing email: {e}", "ERROR")
+            return None
+
+    def finalize_email(self, email_info: Dict, task_file: Optional[Path]):
+        """
+        Log and count an email once it has been marked as read.
+
+        Args:
+            email_info: Extracted email information
+            task_file: Created task file (None in dry-run mode)
+        """
+        # Log to JSON
+        self.log_to_json("email_processed", {
+            "message_id": email_info['message_id'],
+            "from": email_info['sender_email'],
+            "subject": email_info['subject'],
+            "priority": email_info['priority'],
+            "task_file": str(task_file) if task_file else None,
+            "test_mode": self.test_mode,
+            "dry_run": self.dry_run
+        })
+
+        # Record for rate limiting
+        self.record_processed_email()
+
+        self.ledger.mark_acked([email_info['message_id']])
+
+    def process_email(self, email_data: Dict) -> bool:
+        """
+        Process a single email: extract info, create task, mark as read.
+
+        Args:
+            email_data: Gmail API message object
+
+        Returns:
+            True if processed successfully, False otherwise
+        """
+        prepared = self.prepare_email(email_data)
+        if not prepared:
             return False
 
+        email_info, task_file = prepared
+
+        # Mark as read
+        if not self.mark_as_read(email_info['message_id']):
+            return False
+
+        self.finalize_email(email_info, task_file)
+        return True
+
     def run_once(self) -> int:
         """
         Run one cycle of email checking and processing.
@@ -569,42 +1739,374 @@ _Add any notes or context here_
             Number of emails processed
         """
         self.log("Starting email check cycle...")
+        self.reload_filters_if_changed()
 
         # Fetch important emails
         emails = self.fetch_important_emails()
+        self.retry_acks()
 
-        if not emails:
-            return 0
+        # Create task files
+        failed_ids = list(self.pending_ids)
+        prepared = []
+        for email_data in emails:
+            result = self.prepare_email(email_data)
+            if result:
+                prepared.append(result)
+            else:
+                self.log("Failed to process email, will retry next cycle", "WARNING")
+                failed_ids.append(email_data['id'])
+
+        # Mark all created tasks as read in one call
+        acked = set()
+        if prepared:
+            acked = set(self.mark_as_read_batch([info['message_id'] for info, _ in prepared]))
 
-        # Process each email
         processed = 0
-        for email_data in emails:
-            if self.process_email(email_data):
+        for email_info, task_file in prepared:
+            if email_info['message_id'] in acked:
+                self.finalize_email(email_info, task_file)
                 processed += 1
             else:
-                self.log("Failed to process email, skipping...", "WARNING")
+                failed_ids.append(email_info['message_id'])
+
+        # Advance the history checkpoint only after processing
+        self.commit_sync_state(failed_ids)
+        self._thread_locks.clear()
+
+        if not emails:
+            return 0
 
         self.log(f"Cycle complete: {processed}/{len(emails)} emails processed", "SUCCESS")
 
         return processed
 
+    async def run_once_async(self) -> int:
+        """
+        Run one cycle as a concurrent pipeline: fetch -> parse -> write -> ack.
+
+        Stages are connected by bounded queues, so a slow stage applies
+        backpressure to the ones before it. Gmail API calls share a single
+        worker thread (the API client is not thread-safe); task files are
+        written by PIPELINE_WRITE_WORKERS threads. An email is only marked
+        as read after its task file has been fsynced.
+
+        Returns:
+            Number of emails processed
+        """
+        self.log("Starting email check cycle (pipeline)...")
+        self.reload_filters_if_changed()
+
+        if not self.service:
+            self.log("Gmail service not initialized", "ERROR")
+            return 0
+
+        loop = asyncio.get_running_loop()
+        api_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmail-api")
+        write_pool = ThreadPoolExecutor(
+            max_workers=PIPELINE_WRITE_WORKERS,
+            thread_name_prefix="gmail-write"
+        )
+
+        parse_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        write_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        ack_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+        failed_ids: List[str] = []
+        processed = 0
+        remaining = self.rate_limit_remaining()
+        admitted = 0
+        deferred: List[str] = []
+
+        async def parse_worker():
+            nonlocal admitted
+            while True:
+                email_data, matched_ids = await parse_q.get()
+                try:
+                    if not self._accept_email(email_data, matched_ids, admitted, remaining, deferred):
+                        continue
+                    admitted += 1
+                    email_info = self.extract_email_info(email_data)
+                    self.log(f"Processing: {email_info['subject'][:50]}...")
+                    if not self.dry_run:
+                        # Gmail API calls stay on the single API thread
+                        email_info['body'] = await loop.run_in_executor(
+                            api_pool, self.load_email_body, email_data
+                        )
+                    await write_q.put(email_info)
+                except Exception as e:
+                    self.log(f"Error processing email: {e}", "ERROR")
+                    failed_ids.append(email_data['id'])
+                finally:
+                    parse_q.task_done()
+
+        async def write_worker():
+            while True:
+                email_info = await write_q.get()
+                try:
+                    task_file = await loop.run_in_executor(
+                        write_pool, self.create_task_file, email_info
+                    )
+                    if task_file or self.dry_run:
+                        await ack_q.put((email_info, task_file))
+                    else:
+                        failed_ids.append(email_info['message_id'])
+                finally:
+                    write_q.task_done()
+
+        async def ack_worker():
+            nonlocal processed
+            while True:
+                items = [await ack_q.get()]
+                # Ack everything already written in one batchModify call
+                while not ack_q.empty() and len(items) < MODIFY_BATCH_SIZE:
+                    items.append(ack_q.get_nowait())
+
+                try:
+                    acked = set(await loop.run_in_executor(
+                        api_pool,
+                        self.mark_as_read_batch,
+                        [info['message_id'] for info, _ in items]
+                    ))
+                    for email_info, task_file in items:
+                        if email_info['message_id'] in acked:
+                            self.finalize_email(email_info, task_file)
+                            processed += 1
+                        else:
+                            failed_ids.append(email_info['message_id'])
+                except Exception as e:
+                    self.log(f"Failed to acknowledge emails: {e}", "ERROR")
+                    failed_ids.extend(info['message_id'] for info, _ in items)
+                finally:
+                    for _ in items:
+                        ack_q.task_done()
+
+        workers = [asyncio.create_task(parse_worker()), asyncio.create_task(ack_worker())]
+        workers += [asyncio.create_task(write_worker()) for _ in range(PIPELINE_WRITE_WORKERS)]
+
+        # IDs carried over from earlier cycles are behind the history
+        # checkpoint; keep them, and this cycle's IDs, if it fails
+        carried_ids = list(self.pending_ids)
+        message_ids = []
+
+        try:
+            message_ids, matched_ids = await loop.run_in_executor(
+                api_pool, self.collect_message_ids
+            )
+            await loop.run_in_executor(api_pool, self.retry_acks)
+
+            # Fetch stage: one batch request at a time, feeding the pipeline
+            for start in range(0, len(message_ids), FETCH_BATCH_SIZE):
+                if admitted >= remaining:
+                    deferred.extend(message_ids[start:])
+                    break
+                chunk = message_ids[start:start + FETCH_BATCH_SIZE]
+                fetched, retry_ids = await loop.run_in_executor(
+                    api_pool, self._fetch_messages, chunk
+                )
+                failed_ids.extend(retry_ids)
+                for email_data in fetched:
+                    await parse_q.put((email_data, matched_ids))
+
+            await parse_q.join()
+            await write_q.join()
+            await ack_q.join()
+
+        except HttpError as e:
+            self._note_api_error(e)
+            self.log(f"Gmail API error: {e}", "ERROR")
+            self.log_to_json("gmail_api_error", {"error": str(e)})
+            self._next_history_id = None
+            self.pending_ids = list(dict.fromkeys(carried_ids + self.pending_ids + message_ids))
+
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            api_pool.shutdown(wait=True)
+            write_pool.shutdown(wait=True)
+
+        if deferred:
+            self.log(
+                f"Rate limit allows {remaining} more email(s), deferring "
+                f"{len(deferred)}", "WARNING"
+            )
+
+        # Advance the history checkpoint only after processing
+        self.commit_sync_state(self.pending_ids + deferred + failed_ids)
+        self._thread_locks.clear()
+
+        if processed or failed_ids:
+            self.log(f"Cycle complete: {processed} emails processed", "SUCCESS")
+
+        return processed
+
+    def run_cycle(self) -> int:
+        """
+        Run one cycle in the configured mode (sequential or pipeline).
+
+        Returns:
+            Number of emails processed
+        """
+        self.heartbeat()
+
+        if self.pipeline:
+            processed = asyncio.run(self.run_once_async())
+        else:
+            processed = self.run_once()
+
+        self._record_cycle(processed)
+        return processed
+
+    async def run_cycle_async(self) -> int:
+        """
+        Run one cycle from inside an event loop (used for multi-account).
+
+        Sequential mode runs in a worker thread so accounts poll concurrently.
+
+        Returns:
+            Number of emails processed
+        """
+        self.heartbeat()
+
+        if self.pipeline:
+            processed = await self.run_once_async()
+        else:
+            processed = await asyncio.to_thread(self.run_once)
+
+        self._record_cycle(processed)
+        return processed
+
+    def _record_cycle(self, processed: int):
+        """Update poll metrics after a cycle."""
+        self.metrics['polls'] += 1
+        self.metrics['emails_processed'] += processed
+        self.metrics['last_poll_at'] = datetime.now().isoformat()
+
     def run_continuous(self):
         """Run continuous monitoring loop."""
-        self.log(f"Starting continuous monitoring (poll interval: {POLL_INTERVAL}s)...")
+        self.log(
+            f"Starting continuous monitoring (adaptive poll interval: "
+            f"{MIN_POLL_INTERVAL}-{MAX_POLL_INTERVAL}s)..."
+        )
         self.log("Press Ctrl+C to stop")
 
         try:
             while True:
-                self.run_once()
+                processed = self.run_cycle()
 
-                self.log(f"Sleeping for {POLL_INTERVAL} seconds...")
-                time.sleep(POLL_INTERVAL)
+                delay = self.next_poll_delay(processed)
+                self.save_metrics()
+
+                self.log(f"Sleeping for {delay:.0f} seconds...")
+                self.sleep_with_heartbeat(delay)
 
         except KeyboardInterrupt:
             self.log("\nStopping watcher...", "INFO")
             self.log(f"Total emails processed this session: {self.processed_count}", "INFO")
 
 
+# ============================================================================
+# MULTI-ACCOUNT
+# ============================================================================
+
+def load_accounts(accounts_file: Path = ACCOUNTS_FILE) -> List[Dict]:
+    """
+    Load account definitions.
+
+    Args:
+        accounts_file: JSON file with an "accounts" list
+
+    Returns:
+        List of dicts with name, token_file and credentials_file (Paths)
+    """
+    with open(accounts_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    accounts = []
+    for entry in config.get('accounts', []):
+        name = entry['name']
+        if not re.fullmatch(r'[\w-]+', name):
+            raise ValueError(f"Invalid account name: {name!r}")
+
+        token_file = Path(entry.get('token_file', MCP_EMAIL_DIR / f"token_{name}.json"))
+        credentials_file = Path(entry.get('credentials_file', CREDENTIALS_FILE))
+        accounts.append({
+            'name': name,
+            'token_file': token_file if token_file.is_absolute() else PROJECT_ROOT / token_file,
+            'credentials_file': (
+                credentials_file if credentials_file.is_absolute()
+                else PROJECT_ROOT / credentials_file
+            ),
+        })
+
+    return accounts
+
+
+class MultiAccountWatcher:
+    """
+    Runs several GmailWatchers in one process.
+
+    Each account keeps its own service client, sync state, ledger, rate
+    limit and adaptive poll interval; all accounts share one event loop
+    instead of one interpreter per mailbox.
+    """
+
+    def __init__(self, watchers: List[GmailWatcher]):
+        """
+        Initialize multi-account watcher.
+
+        Args:
+            watchers: One GmailWatcher per account
+        """
+        self.watchers = watchers
+
+    def authenticate(self) -> bool:
+        """
+        Authenticate every account, dropping the ones that fail.
+
+        Returns:
+            True if at least one account is ready
+        """
+        ready = []
+        for watcher in self.watchers:
+            if watcher.authenticate():
+                ready.append(watcher)
+            else:
+                watcher.log("Authentication failed, account disabled", "ERROR")
+
+        self.watchers = ready
+        return bool(ready)
+
+    async def run_once(self) -> int:
+        """
+        Run one cycle for every account concurrently.
+
+        Returns:
+            Total number of emails processed
+        """
+        results = await asyncio.gather(*(w.run_cycle_async() for w in self.watchers))
+        return sum(results)
+
+    async def run_continuous(self):
+        """Poll every account on its own adaptive schedule."""
+        await asyncio.gather(*(self._poll_account(w) for w in self.watchers))
+
+    async def _poll_account(self, watcher: GmailWatcher):
+        """Continuous loop for a single account."""
+        while True:
+            try:
+                processed = await watcher.run_cycle_async()
+            except Exception as e:
+                watcher.log(f"Cycle failed: {e}", "ERROR")
+                processed = 0
+
+            delay = watcher.next_poll_delay(processed)
+            watcher.save_metrics()
+
+            watcher.log(f"Sleeping for {delay:.0f} seconds...")
+            await watcher.sleep_with_heartbeat_async(delay)
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -629,6 +2131,23 @@ def main():
         action='store_true',
         help='Process emails once and exit (do not run continuously)'
     )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help="Fetch full message payloads instead of metadata only"
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Process emails through the concurrent async pipeline'
+    )
+    parser.add_argument(
+        '--accounts',
+        nargs='?',
+        const=ACCOUNTS_FILE,
+        type=Path,
+        help=f'Watch every account listed in a JSON file (default: {ACCOUNTS_FILE})'
+    )
 
     args = parser.parse_args()
 
@@ -644,8 +2163,16 @@ def main():
         print("[DRY RUN] No task files will be created, no emails marked as read")
     print()
 
+    if args.accounts:
+        return run_accounts(args)
+
     # Initialize watcher
-    watcher = GmailWatcher(test_mode=args.test, dry_run=args.dry_run)
+    watcher = GmailWatcher(
+        test_mode=args.test,
+        dry_run=args.dry_run,
+        fetch_format='full' if args.full else FETCH_FORMAT,
+        pipeline=args.pipeline
+    )
 
     # Authenticate
     if not watcher.authenticate():
@@ -656,7 +2183,7 @@ def main():
 
     # Run once or continuously
     if args.once:
-        processed = watcher.run_once()
+        processed = watcher.run_cycle()
         print(f"\n✅ Processed {processed} email(s)")
         return 0
     else:
@@ -664,5 +2191,48 @@ def main():
         return 0
 
 
+def run_accounts(args) -> int:
+    """Run all configured accounts in this process."""
+    try:
+        accounts = load_accounts(args.accounts)
+    except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+        print(f"\n❌ Failed to load accounts from {args.accounts}: {e}")
+        return 1
+
+    if not accounts:
+        print(f"\n❌ No accounts defined in {args.accounts}")
+        return 1
+
+    multi = MultiAccountWatcher([
+        GmailWatcher(
+            test_mode=args.test,
+            dry_run=args.dry_run,
+            fetch_format='full' if args.full else FETCH_FORMAT,
+            pipeline=args.pipeline,
+            account=account['name'],
+            token_file=account['token_file'],
+            credentials_file=account['credentials_file']
+        )
+        for account in accounts
+    ])
+
+    if not multi.authenticate():
+        print("\n❌ Authentication failed for all accounts. Exiting.")
+        return 1
+
+    print()
+
+    try:
+        if args.once:
+            processed = asyncio.run(multi.run_once())
+            print(f"\n✅ Processed {processed} email(s) across {len(multi.watchers)} account(s)")
+        else:
+            asyncio.run(multi.run_continuous())
+    except KeyboardInterrupt:
+        print("\nStopping watcher...")
+
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
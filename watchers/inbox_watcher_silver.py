@@ -21,6 +21,24 @@ LOGS_PATH = VAULT_PATH / "Logs"
 EXCLUDED_FILES = {"Dashboard.md", "Company_Handbook.md", "Welcome.md"}
 POLL_INTERVAL = 3  # seconds
 AUTO_PROCESS = True  # Automatically run runner when tasks arrive
+RUNNER_TIMEOUT = 30  # seconds
+
+# Heartbeat pipe from the watcher manager (unset when run standalone)
+HEARTBEAT_FD = os.environ.get("WATCHER_HEARTBEAT_FD")
+
+
+def send_heartbeat(next_within, processed):
+    """Report liveness to the watcher manager without ever blocking."""
+    if not HEARTBEAT_FD:
+        return
+
+    message = json.dumps({"next_within": next_within, "processed": processed}) + "\n"
+    try:
+        fd = int(HEARTBEAT_FD)
+        os.set_blocking(fd, False)
+        os.write(fd, message.encode("utf-8"))
+    except (ValueError, OSError):
+        pass  # Pipe full or manager gone
 
 
 def log_action(action_type, file_name, source, destination):
@@ -140,7 +158,7 @@ def run_silver_runner():
             ["python", str(runner_script)],
             capture_output=True,
             text=True,
-            timeout=30
+            timeout=RUNNER_TIMEOUT
         )
 
         if result.returncode == 0:
@@ -176,11 +194,15 @@ def watch_inbox():
     LOGS_PATH.mkdir(parents=True, exist_ok=True)
 
     cycle_count = 0
+    processed_count = 0
 
     try:
         while True:
             cycle_count += 1
 
+            # Next beat is due after this cycle (runner included) and the sleep
+            send_heartbeat(RUNNER_TIMEOUT + POLL_INTERVAL + 5, processed_count)
+
             # Step 1: Move from root to Inbox
             root_moved = move_from_root_to_inbox()
 
@@ -191,6 +213,8 @@ def watch_inbox():
             if AUTO_PROCESS and inbox_moved > 0:
                 run_silver_runner()
 
+            processed_count += inbox_moved
+
             if root_moved > 0 or inbox_moved > 0:
                 print(f"📊 Cycle {cycle_count}: {root_moved} from root, {inbox_moved} from Inbox\n")
 